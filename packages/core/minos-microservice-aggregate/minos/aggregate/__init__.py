@@ -60,6 +60,7 @@ from .snapshots import (
     PostgreSqlSnapshotRepository,
     PostgreSqlSnapshotSetup,
     PostgreSqlSnapshotWriter,
+    SnapshotColumns,
     SnapshotEntry,
     SnapshotRepository,
     SnapshotService,
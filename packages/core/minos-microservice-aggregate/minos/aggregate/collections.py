@@ -17,6 +17,7 @@ from typing import (
 )
 
 from minos.common import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
     DataDecoder,
     DataEncoder,
     DeclarativeModel,
@@ -152,23 +153,30 @@ class IncrementalSetDiff(DeclarativeModel):
         :param get_fn: Optional function to get entries from the set by identifier.
         :return: The difference between new and old.
         """
-        differences = cls._diff(new, old, get_fn)
-        return cls(differences)
+        # The entries are built from already decoded values, so they do not need to be decoded nor validated again.
+        token = IS_TRUSTED_MODEL_CONTEXT_VAR.set(True)
+        try:
+            differences = cls._diff(new, old, get_fn)
+            return cls(differences)
+        finally:
+            IS_TRUSTED_MODEL_CONTEXT_VAR.reset(token)
 
     @staticmethod
     def _diff(new: IncrementalSet[T], old: IncrementalSet[T], get_fn) -> list[IncrementalSetDiffEntry]:
         result = list()
-        for value in new - old:
-            entry = IncrementalSetDiffEntry(Action.CREATE, value)
-            result.append(entry)
+        for value in new:
+            if value not in old:
+                entry = IncrementalSetDiffEntry(Action.CREATE, value)
+                result.append(entry)
 
-        for value in old - new:
-            entry = IncrementalSetDiffEntry(Action.DELETE, value)
-            result.append(entry)
+        for value in old:
+            if value not in new:
+                entry = IncrementalSetDiffEntry(Action.DELETE, value)
+                result.append(entry)
 
         if get_fn is not None:
-            for value in old & new:
-                if value == old.get(value.uuid):
+            for value in new:
+                if value not in old or value == old.get(value.uuid):
                     continue
                 entry = IncrementalSetDiffEntry(Action.UPDATE, value)
                 result.append(entry)
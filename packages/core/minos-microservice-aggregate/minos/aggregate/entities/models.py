@@ -41,14 +41,14 @@ from minos.aggregate.snapshots import (
 from minos.common import (
     NULL_DATETIME,
     NULL_UUID,
-    DeclarativeModel,
+    CompactDeclarativeModel,
     NotProvidedException,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class Entity(DeclarativeModel):
+class Entity(CompactDeclarativeModel):
     """Entity class."""
 
     uuid: UUID
@@ -18,6 +18,7 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    ModelCodec,
     import_module,
 )
 
@@ -66,8 +67,9 @@ class EventEntry:
         created_at: Optional[datetime] = None,
         transaction_uuid: UUID = NULL_UUID,
     ):
-        if isinstance(data, memoryview):
-            data = data.tobytes()
+        if isinstance(data, memoryview) and data.format != "B":
+            # Some drivers return char buffers, which are not comparable with bytes, so they are casted without copies.
+            data = data.cast("B")
         if action is not None and isinstance(action, str):
             action = Action.value_of(action)
 
@@ -82,11 +84,19 @@ class EventEntry:
         self.transaction_uuid = transaction_uuid
 
     @classmethod
-    def from_event(cls, event: Event, *, transaction: Optional[TransactionEntry] = None, **kwargs) -> EventEntry:
+    def from_event(
+        cls,
+        event: Event,
+        *,
+        transaction: Optional[TransactionEntry] = None,
+        codec: Union[str, ModelCodec] = "avro",
+        **kwargs,
+    ) -> EventEntry:
         """Build a new instance from a ``RootEntity``.
 
         :param event: The event.
         :param transaction: Optional transaction.
+        :param codec: The codec used to encode the fields diff.
         :param kwargs: Additional named arguments.
         :return: A new ``EventEntry`` instance.
         """
@@ -97,7 +107,7 @@ class EventEntry:
         return cls(
             uuid=event.uuid,
             name=event.name,
-            data=event.fields_diff.avro_bytes,
+            data=ModelCodec.get(codec).encode(event.fields_diff),
             action=event.action,
             **kwargs,
         )
@@ -161,7 +171,7 @@ class EventEntry:
         if not self.data:
             return FieldDiffContainer.empty()
 
-        return FieldDiffContainer.from_avro_bytes(self.data)
+        return ModelCodec.detect(self.data).decode(self.data, FieldDiffContainer, trusted=True)
 
     def __eq__(self, other: "EventEntry") -> bool:
         return type(self) == type(other) and tuple(self) == tuple(other)
@@ -32,6 +32,7 @@ from minos.common import (
     Lock,
     MinosPool,
     MinosSetup,
+    ModelCodec,
     NotProvidedException,
 )
 from minos.networks import (
@@ -78,6 +79,7 @@ class EventRepository(ABC, MinosSetup):
         transaction_repository: TransactionRepository = Provide["transaction_repository"],
         lock_pool: MinosPool[Lock] = Provide["lock_pool"],
         *args,
+        codec: Union[str, ModelCodec] = "avro",
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -94,6 +96,15 @@ class EventRepository(ABC, MinosSetup):
         self._broker_publisher = broker_publisher
         self._transaction_repository = transaction_repository
         self._lock_pool = lock_pool
+        self._codec = ModelCodec.get(codec)
+
+    @property
+    def codec(self) -> ModelCodec:
+        """Get the codec used to encode the entries data.
+
+        :return: A ``ModelCodec`` instance.
+        """
+        return self._codec
 
     def transaction(self, **kwargs) -> TransactionEntry:
         """Build a transaction instance related to the repository.
@@ -146,7 +157,7 @@ class EventRepository(ABC, MinosSetup):
             transaction = TRANSACTION_CONTEXT_VAR.get()
 
             if isinstance(entry, Event):
-                entry = EventEntry.from_event(entry, transaction=transaction)
+                entry = EventEntry.from_event(entry, transaction=transaction, codec=self._codec)
 
             if not isinstance(entry.action, Action):
                 raise EventRepositoryException("The 'EventEntry.action' attribute must be an 'Action' instance.")
@@ -23,6 +23,7 @@ from psycopg2.sql import (
 from minos.common import (
     NULL_UUID,
     MinosConfig,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
 )
 
@@ -42,19 +43,25 @@ class PostgreSqlEventRepository(PostgreSqlMinosDatabase, EventRepository):
 
     @classmethod
     def _from_config(cls, *args, config: MinosConfig, **kwargs) -> Optional[EventRepository]:
+        kwargs = {"codec": config.codecs.repository} | kwargs
         return cls(*args, **config.repository._asdict(), **kwargs)
 
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        return (_MIGRATION,)
+
     async def _setup(self):
         """Setup miscellaneous repository thing.
 
-        In the PostgreSQL case, configures the needed table to be used to store the data.
+        In the PostgreSQL case, checks that the schema used to store the data is up to date, migrating it if needed.
 
         :return: This method does not return anything.
         """
-        await self.submit_query('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', lock="uuid-ossp")
-
-        await self.submit_query(_CREATE_ACTION_ENUM_QUERY, lock="aggregate_event")
-        await self.submit_query(_CREATE_TABLE_QUERY, lock="aggregate_event")
+        await self.migrate()
 
     async def _submit(self, entry: EventEntry, **kwargs) -> EventEntry:
         lock = None
@@ -196,6 +203,10 @@ CREATE TABLE IF NOT EXISTS aggregate_event (
 );
 """.strip()
 
+_MIGRATION = PostgreSqlMigration(
+    "aggregate_event", [['CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', _CREATE_ACTION_ENUM_QUERY, _CREATE_TABLE_QUERY]]
+)
+
 _INSERT_VALUES_QUERY = SQL(
     """
 INSERT INTO aggregate_event (id, action, uuid, name, version, data, created_at, transaction_uuid)
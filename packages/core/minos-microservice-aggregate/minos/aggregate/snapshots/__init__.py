@@ -1,6 +1,9 @@
 from .abc import (
     SnapshotRepository,
 )
+from .columns import (
+    SnapshotColumns,
+)
 from .entries import (
     SnapshotEntry,
 )
@@ -28,6 +28,9 @@ from ..transactions import (
     TRANSACTION_CONTEXT_VAR,
     TransactionEntry,
 )
+from .columns import (
+    SnapshotColumns,
+)
 
 if TYPE_CHECKING:
     from ..entities import (
@@ -112,6 +115,53 @@ class SnapshotRepository(ABC, MinosSetup):
     def _find(self, *args, **kwargs) -> AsyncIterator[RootEntity]:
         raise NotImplementedError
 
+    async def find_columns(
+        self,
+        name: str,
+        condition: _Condition,
+        ordering: Optional[_Ordering] = None,
+        limit: Optional[int] = None,
+        streaming_mode: bool = False,
+        transaction: Optional[TransactionEntry] = None,
+        **kwargs,
+    ) -> SnapshotColumns:
+        """Find a collection of ``RootEntity`` instances based on a ``Condition``, organized as columns.
+
+        It is intended for analytical reads, which aggregate a few fields across many instances, so the
+        ``RootEntity`` instances are only built on demand.
+
+        :param name: Class name of the ``RootEntity``.
+        :param condition: The condition that must be satisfied by the ``RootEntity`` instances.
+        :param ordering: Optional argument to return the instance with specific ordering strategy. The default behaviour
+            is to retrieve them without any order pattern.
+        :param limit: Optional argument to return only a subset of instances. The default behaviour is to return all the
+            instances that meet the given condition.
+        :param streaming_mode: If ``True`` return the values in streaming directly from the database (keep an open
+            database connection), otherwise preloads the full set of values on memory and then retrieves them.
+        :param transaction: The transaction within the operation is performed. If not any value is provided, then the
+            transaction is extracted from the context var. If not any transaction is being scoped then the query is
+            performed to the global snapshot.
+        :param kwargs: Additional named arguments.
+        :return: A ``SnapshotColumns`` instance.
+        """
+        if transaction is None:
+            transaction = TRANSACTION_CONTEXT_VAR.get()
+
+        await self.synchronize(**kwargs)
+
+        return await self._find_columns(
+            name=name,
+            condition=condition,
+            ordering=ordering,
+            limit=limit,
+            streaming_mode=streaming_mode,
+            transaction=transaction,
+            **kwargs,
+        )
+
+    def _find_columns(self, *args, **kwargs) -> Awaitable[SnapshotColumns]:
+        return SnapshotColumns.from_root_entities(self._find(*args, **kwargs))
+
     def synchronize(self, **kwargs) -> Awaitable[None]:
         """Synchronize the snapshot to the latest available version.
 
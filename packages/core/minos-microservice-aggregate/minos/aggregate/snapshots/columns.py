@@ -0,0 +1,220 @@
+from __future__ import (
+    annotations,
+)
+
+from array import (
+    array,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from minos.common import (
+    AvroDataEncoder,
+)
+
+from ..exceptions import (
+    SnapshotRepositoryException,
+)
+from .entries import (
+    SnapshotEntry,
+)
+
+if TYPE_CHECKING:
+    from ..entities import (
+        RootEntity,
+    )
+
+Column = Union[array, list[Any]]
+
+ARRAY_TYPECODES: dict[str, str] = {
+    "boolean": "b",
+    "int": "q",
+    "long": "q",
+    "float": "d",
+    "double": "d",
+}
+
+_METADATA_FIELD_NAMES = ("uuid", "version", "created_at", "updated_at")
+
+
+class SnapshotColumns:
+    """Columnar representation of a collection of ``RootEntity`` instances that share the same fields.
+
+    The values are stored as their ``avro`` data, one column per field. The columns of the ``boolean``, ``int``,
+    ``long``, ``float`` and ``double`` fields, which include the ``timestamp-micros`` and ``date`` logical types, are
+    stored as ``array.array`` instances, so they can be aggregated, or wrapped without copies by numeric libraries
+    (i.e. ``numpy.frombuffer(columns["price"], dtype="float64")``), without building the ``RootEntity`` instances.
+    The rest of columns are stored as lists.
+
+    The ``RootEntity`` instances are only built on demand, using ``build`` or iterating over the instance, with the
+    schema of the first one.
+    """
+
+    __slots__ = ("_schema", "_columns", "_size")
+
+    def __init__(
+        self, schema: Optional[Union[list[dict[str, Any]], dict[str, Any]]], columns: dict[str, Column], size: int
+    ):
+        self._schema = schema
+        self._columns = columns
+        self._size = size
+
+    @classmethod
+    async def from_entries(cls, entries: AsyncIterable[SnapshotEntry]) -> SnapshotColumns:
+        """Build a new instance from a collection of ``SnapshotEntry`` instances.
+
+        The data of each entry is split into the columns directly, so no ``RootEntity`` instance is built. The deleted
+        entries are skipped.
+
+        :param entries: An asynchronous iterable of ``SnapshotEntry`` instances.
+        :return: A new ``SnapshotColumns`` instance.
+        """
+        builder = _SnapshotColumnsBuilder()
+        async for entry in entries:
+            builder.add_entry(entry)
+        return builder.build()
+
+    @classmethod
+    async def from_root_entities(cls, instances: AsyncIterable[RootEntity]) -> SnapshotColumns:
+        """Build a new instance from a collection of ``RootEntity`` instances.
+
+        :param instances: An asynchronous iterable of ``RootEntity`` instances.
+        :return: A new ``SnapshotColumns`` instance.
+        """
+        builder = _SnapshotColumnsBuilder()
+        async for instance in instances:
+            builder.add(instance.avro_schema, instance.avro_data)
+        return builder.build()
+
+    @property
+    def schema(self) -> Optional[Union[list[dict[str, Any]], dict[str, Any]]]:
+        """Get the avro schema of the ``RootEntity`` instances.
+
+        :return: A ``list`` or ``dict`` instance or ``None`` if the instance is empty.
+        """
+        return self._schema
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        """Get the columns indexed by field name.
+
+        :return: A dictionary in which the keys are field names and the values are ``array`` or ``list`` instances.
+        """
+        return self._columns
+
+    def build(self, index: int, **kwargs) -> RootEntity:
+        """Build the ``RootEntity`` instance at the given position.
+
+        :param index: The position of the instance.
+        :param kwargs: Additional named arguments.
+        :return: A ``RootEntity`` instance.
+        """
+        from ..entities import (
+            RootEntity,
+        )
+
+        if not -self._size <= index < self._size:
+            raise IndexError(f"The index is out of range. Obtained: {index!r}")
+
+        data = {name: _restore(column, index) for name, column in self._columns.items()}
+        data |= kwargs
+        return RootEntity.from_avro(self._schema, data, trusted=True)
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[RootEntity]:
+        for index in range(self._size):
+            yield self.build(index)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self._schema == other._schema and self._columns == other._columns
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(columns={list(self._columns)!r}, size={self._size!r})"
+
+
+class _SnapshotColumnsBuilder:
+    def __init__(self):
+        self._schema = None
+        self._fields = None
+        self._encoded_schemas = set()
+        self._appenders = None
+        self._columns = dict()
+        self._size = 0
+        self._encoder = AvroDataEncoder()
+
+    def add_entry(self, entry: SnapshotEntry) -> None:
+        data = entry.data
+        if data is None:
+            return
+
+        encoded_schema = entry.encoded_schema
+        if encoded_schema not in self._encoded_schemas:
+            self._set_schema(entry.schema)
+            self._encoded_schemas.add(encoded_schema)
+
+        data = dict(data)
+        for name in _METADATA_FIELD_NAMES:
+            data[name] = self._encoder.build(getattr(entry, name))
+        self._append(data)
+
+    def add(self, schema: Union[list[dict[str, Any]], dict[str, Any]], data: dict[str, Any]) -> None:
+        self._set_schema(schema)
+        self._append(data)
+
+    def _set_schema(self, schema: Union[list[dict[str, Any]], dict[str, Any]]) -> None:
+        record = _get_record(schema)
+        fields = (record["name"], tuple(field["name"] for field in record["fields"]))
+
+        if self._schema is None:
+            self._schema = schema
+            self._fields = fields
+            self._appenders = list()
+            for field in record["fields"]:
+                column = _build_column(field["type"])
+                self._columns[field["name"]] = column
+                self._appenders.append((field["name"], column.append))
+        elif fields != self._fields:
+            raise SnapshotRepositoryException(
+                f"The instances must share the same fields. Expected: {self._fields!r} Obtained: {fields!r}"
+            )
+
+    def _append(self, data: dict[str, Any]) -> None:
+        for name, append in self._appenders:
+            append(data[name])
+        self._size += 1
+
+    def build(self) -> SnapshotColumns:
+        return SnapshotColumns(self._schema, self._columns, self._size)
+
+
+def _get_record(schema: Union[list[dict[str, Any]], dict[str, Any]]) -> dict[str, Any]:
+    if isinstance(schema, list):
+        schema = schema[-1]
+    return schema
+
+
+def _build_column(type_: Any) -> Column:
+    if isinstance(type_, dict):
+        type_ = type_["type"]
+
+    if not isinstance(type_, str) or type_ not in ARRAY_TYPECODES:
+        return list()
+    return array(ARRAY_TYPECODES[type_])
+
+
+def _restore(column: Column, index: int) -> Any:
+    value = column[index]
+    if isinstance(column, array) and column.typecode == ARRAY_TYPECODES["boolean"]:
+        return bool(value)
+    return value
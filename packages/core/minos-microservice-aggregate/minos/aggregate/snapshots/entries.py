@@ -2,7 +2,6 @@ from __future__ import (
     annotations,
 )
 
-import json
 from datetime import (
     datetime,
 )
@@ -19,6 +18,7 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    AvroDataEncoder,
     MinosJsonBinaryProtocol,
     import_module,
 )
@@ -35,6 +35,8 @@ if TYPE_CHECKING:
         RootEntity,
     )
 
+_METADATA_FIELD_NAMES = frozenset({"uuid", "version", "created_at", "updated_at"})
+
 
 class SnapshotEntry:
     """Minos Snapshot Entry class.
@@ -46,8 +48,9 @@ class SnapshotEntry:
         "uuid",
         "name",
         "version",
-        "schema",
-        "data",
+        "_schema",
+        "_data",
+        "_encoded_data",
         "created_at",
         "updated_at",
         "transaction_uuid",
@@ -59,23 +62,19 @@ class SnapshotEntry:
         uuid: UUID,
         name: str,
         version: int,
-        schema: Optional[Union[list[dict[str, Any]], dict[str, Any]]] = None,
+        schema: Optional[Union[list[dict[str, Any]], dict[str, Any], bytes, memoryview]] = None,
         data: Optional[dict[str, Any]] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         transaction_uuid: UUID = NULL_UUID,
     ):
-        if isinstance(schema, memoryview):
-            schema = schema.tobytes()
-        if isinstance(schema, bytes):
-            schema = MinosJsonBinaryProtocol.decode(schema)
-
         self.uuid = uuid
         self.name = name
         self.version = version
 
-        self.schema = schema
-        self.data = data
+        self._schema = schema
+        self._data = data
+        self._encoded_data = None
 
         self.created_at = created_at
         self.updated_at = updated_at
@@ -86,22 +85,24 @@ class SnapshotEntry:
     def from_root_entity(cls, instance: RootEntity, **kwargs) -> SnapshotEntry:
         """Build a new instance from a ``RootEntity``.
 
+        The data is encoded directly from the instance fields, without building the intermediate ``avro`` data. It
+        is encoded eagerly, so later changes on the instance do not modify the entry.
+
         :param instance: The ``RootEntity`` instance.
         :return: A new ``SnapshotEntry`` instance.
         """
-        data = {k: v for k, v in instance.avro_data.items() if k not in {"uuid", "version", "created_at", "updated_at"}}
-
         # noinspection PyTypeChecker
-        return cls(
+        entry = cls(
             uuid=instance.uuid,
             name=instance.classname,
             version=instance.version,
             schema=instance.avro_schema,
-            data=data,
             created_at=instance.created_at,
             updated_at=instance.updated_at,
             **kwargs,
         )
+        entry._encoded_data = AvroDataEncoder().build_json(instance, exclude=_METADATA_FIELD_NAMES).decode()
+        return entry
 
     @classmethod
     def from_event_entry(cls, entry: EventEntry) -> SnapshotEntry:
@@ -135,16 +136,42 @@ class SnapshotEntry:
             "transaction_uuid": self.transaction_uuid,
         }
 
+    @property
+    def data(self) -> Optional[dict[str, Any]]:
+        """Get the data if available.
+
+        :return: A ``dict`` instance or ``None``.
+        """
+        if self._data is None and self._encoded_data is not None:
+            self._data = MinosJsonBinaryProtocol.decode(self._encoded_data)
+        return self._data
+
+    @property
+    def schema(self) -> Optional[Union[list[dict[str, Any]], dict[str, Any]]]:
+        """Get the schema if available.
+
+        The schema is kept as the given buffer until it is accessed for the first time, so entries whose schema is
+        never needed are not decoded.
+
+        :return: A ``list`` or ``dict`` instance or ``None``.
+        """
+        if isinstance(self._schema, (bytes, memoryview)):
+            self._schema = MinosJsonBinaryProtocol.decode(self._schema)
+        return self._schema
+
     @property
     def encoded_schema(self) -> Optional[bytes]:
         """Get the encoded schema if available.
 
         :return: A ``bytes`` instance or ``None``.
         """
-        if self.schema is None:
+        if self._schema is None:
             return None
 
-        return MinosJsonBinaryProtocol.encode(self.schema)
+        if isinstance(self._schema, (bytes, memoryview)):
+            return bytes(self._schema)
+
+        return MinosJsonBinaryProtocol.encode(self._schema)
 
     @property
     def encoded_data(self) -> Optional[str]:
@@ -152,10 +179,13 @@ class SnapshotEntry:
 
         :return: A ``str`` instance or ``None``.
         """
-        if self.data is None:
+        if self._encoded_data is not None:
+            return self._encoded_data
+
+        if self._data is None:
             return None
 
-        return json.dumps(self.data)
+        return AvroDataEncoder().build_json(self._data).decode()
 
     def build(self, **kwargs) -> RootEntity:
         """Rebuild the stored ``RootEntity`` object instance from the internal state.
@@ -177,7 +207,7 @@ class SnapshotEntry:
             "updated_at": self.updated_at,
         }
         data |= kwargs
-        instance = RootEntity.from_avro(self.schema, data)
+        instance = RootEntity.from_avro(self.schema, data, trusted=True)
         return instance
 
     @property
@@ -9,6 +9,7 @@ from typing import (
 
 from minos.common import (
     MinosConfig,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
 )
 
@@ -20,10 +21,16 @@ class PostgreSqlSnapshotSetup(PostgreSqlMinosDatabase):
     def _from_config(cls: Type[T], config: MinosConfig, **kwargs) -> T:
         return cls(**config.snapshot._asdict(), **kwargs)
 
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        return (_MIGRATION,)
+
     async def _setup(self) -> None:
-        await self.submit_query('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', lock="uuid-ossp")
-        await self.submit_query(_CREATE_TABLE_QUERY, lock="snapshot")
-        await self.submit_query(_CREATE_OFFSET_TABLE_QUERY, lock="snapshot_aux_offset")
+        await self.migrate()
 
 
 T = TypeVar("T", bound=PostgreSqlSnapshotSetup)
@@ -49,3 +56,7 @@ CREATE TABLE IF NOT EXISTS snapshot_aux_offset (
     CONSTRAINT id_uni CHECK (id)
 );
 """.strip()
+
+_MIGRATION = PostgreSqlMigration(
+    "snapshot", [['CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', _CREATE_TABLE_QUERY, _CREATE_OFFSET_TABLE_QUERY]]
+)
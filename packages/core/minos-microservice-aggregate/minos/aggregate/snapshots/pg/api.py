@@ -15,6 +15,9 @@ from minos.common import (
 from ..abc import (
     SnapshotRepository,
 )
+from ..columns import (
+    SnapshotColumns,
+)
 from .readers import (
     PostgreSqlSnapshotReader,
 )
@@ -69,5 +72,8 @@ class PostgreSqlSnapshotRepository(SnapshotRepository):
     def _find(self, *args, **kwargs) -> AsyncIterator[RootEntity]:
         return self.reader.find(*args, **kwargs)
 
+    def _find_columns(self, *args, **kwargs) -> Awaitable[SnapshotColumns]:
+        return self.reader.find_columns(*args, **kwargs)
+
     def _synchronize(self, *args, **kwargs) -> Awaitable[None]:
         return self.writer.dispatch(**kwargs)
@@ -14,6 +14,7 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    STREAMING_FETCH_SIZE,
 )
 
 from ...exceptions import (
@@ -27,6 +28,9 @@ from ...queries import (
 from ...transactions import (
     TransactionEntry,
 )
+from ..columns import (
+    SnapshotColumns,
+)
 from ..entries import (
     SnapshotEntry,
 )
@@ -91,6 +95,17 @@ class PostgreSqlSnapshotReader(PostgreSqlSnapshotSetup):
         async for snapshot_entry in self.find_entries(*args, **kwargs):
             yield snapshot_entry.build(**kwargs)
 
+    async def find_columns(self, *args, **kwargs) -> SnapshotColumns:
+        """Find a collection of ``RootEntity`` instances based on a ``Condition``, organized as columns.
+
+        The stored data is split into columns directly, so the ``RootEntity`` instances are only built on demand.
+
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: A ``SnapshotColumns`` instance.
+        """
+        return await SnapshotColumns.from_entries(self.find_entries(*args, **kwargs))
+
     async def find_entries(
         self,
         name: str,
@@ -98,6 +113,8 @@ class PostgreSqlSnapshotReader(PostgreSqlSnapshotSetup):
         ordering: Optional[_Ordering] = None,
         limit: Optional[int] = None,
         streaming_mode: bool = False,
+        fetch_size: int = STREAMING_FETCH_SIZE,
+        read_only: bool = True,
         transaction: Optional[TransactionEntry] = None,
         exclude_deleted: bool = True,
         **kwargs,
@@ -112,6 +129,8 @@ class PostgreSqlSnapshotReader(PostgreSqlSnapshotSetup):
             instances that meet the given condition.
         :param streaming_mode: If ``True`` return the values in streaming directly from the database (keep an open
             database connection), otherwise preloads the full set of values on memory and then retrieves them.
+        :param fetch_size: The number of rows retrieved on each round trip in streaming mode.
+        :param read_only: If ``True`` the query can be routed to a read replica (if the pool has any).
         :param transaction: The transaction within the operation is performed. If not any value is provided, then the
             transaction is extracted from the context var. If not any transaction is being scoped then the query is
             performed to the global snapshot.
@@ -128,15 +147,9 @@ class PostgreSqlSnapshotReader(PostgreSqlSnapshotSetup):
         qb = PostgreSqlSnapshotQueryBuilder(name, condition, ordering, limit, transaction_uuids, exclude_deleted)
         query, parameters = qb.build()
 
-        async with self.cursor() as cursor:
-            # noinspection PyTypeChecker
-            await cursor.execute(query, parameters)
-            if streaming_mode:
-                async for row in cursor:
-                    # noinspection PyArgumentList
-                    yield SnapshotEntry(*row)
-                return
-            else:
-                rows = await cursor.fetchall()
-        for row in rows:
+        iterable = self.submit_query_and_iter(
+            query, parameters, streaming_mode=streaming_mode, fetch_size=fetch_size, read_only=read_only
+        )
+        async for row in iterable:
+            # noinspection PyArgumentList
             yield SnapshotEntry(*row)
@@ -96,7 +96,9 @@ class PostgreSqlSnapshotWriter(PostgreSqlSnapshotSetup):
         initial_offset = await self._load_offset(**kwargs)
 
         offset = initial_offset
-        async for event_entry in self._event_repository.select(id_gt=offset, **kwargs):
+        # The pending entries could be the full event log, so they are retrieved in streaming mode.
+        iterable = self._event_repository.select(id_gt=offset, **(kwargs | {"streaming_mode": True}))
+        async for event_entry in iterable:
             try:
                 await self._dispatch_one(event_entry, **kwargs)
             except SnapshotRepositoryConflictException:
@@ -165,7 +167,8 @@ class PostgreSqlSnapshotWriter(PostgreSqlSnapshotSetup):
         return previous
 
     async def _select_one_instance(self, name: str, uuid: UUID, **kwargs) -> RootEntity:
-        snapshot_entry = await self._reader.get_entry(name, uuid, **kwargs)
+        # The previous entry must be read from the primary database, as the replicas could be outdated.
+        snapshot_entry = await self._reader.get_entry(name, uuid, **(kwargs | {"read_only": False}))
         return snapshot_entry.build(**kwargs)
 
     async def _submit_entry(self, snapshot_entry: SnapshotEntry, **kwargs) -> SnapshotEntry:
@@ -15,6 +15,7 @@ from uuid import (
 
 from minos.common import (
     MinosConfig,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
 )
 
@@ -36,11 +37,16 @@ class PostgreSqlTransactionRepository(PostgreSqlMinosDatabase, TransactionReposi
     def _from_config(cls, *args, config: MinosConfig, **kwargs) -> Optional[PostgreSqlTransactionRepository]:
         return cls(*args, **config.repository._asdict(), **kwargs)
 
-    async def _setup(self):
-        await self.submit_query('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', lock="uuid-ossp")
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        return (_MIGRATION,)
 
-        await self.submit_query(_CREATE_TRANSACTION_STATUS_ENUM_QUERY, lock=hash("aggregate_transaction_enum"))
-        await self.submit_query(_CREATE_TRANSACTION_TABLE_QUERY, lock=hash("aggregate_transaction"))
+    async def _setup(self):
+        await self.migrate()
 
     async def _submit(self, transaction: TransactionEntry) -> TransactionEntry:
         params = {
@@ -156,6 +162,17 @@ CREATE TABLE IF NOT EXISTS aggregate_transaction (
 );
 """.strip()
 
+_MIGRATION = PostgreSqlMigration(
+    "aggregate_transaction",
+    [
+        [
+            'CREATE EXTENSION IF NOT EXISTS "uuid-ossp";',
+            _CREATE_TRANSACTION_STATUS_ENUM_QUERY,
+            _CREATE_TRANSACTION_TABLE_QUERY,
+        ]
+    ],
+)
+
 _INSERT_TRANSACTIONS_VALUES_QUERY = """
 INSERT INTO aggregate_transaction (uuid, destination_uuid, status, event_offset)
 VALUES (%(uuid)s, %(destination_uuid)s, %(status)s, %(event_offset)s)
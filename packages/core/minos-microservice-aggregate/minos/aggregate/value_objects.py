@@ -4,6 +4,7 @@ from __future__ import (
 
 from typing import (
     Any,
+    Optional,
     TypeVar,
 )
 
@@ -20,7 +21,15 @@ from minos.common import (
 
 
 class ValueObject(DeclarativeModel):
-    """Value Object class."""
+    """Value Object class.
+
+    As value objects are immutable, the tuple of values used to compare them and their hash are computed once and then
+    cached. Values of mutable types (i.e. ``list`` or ``dict``) must not be modified in place after the instance has
+    been built.
+    """
+
+    _value_tuple: Optional[tuple[tuple[str, Any], ...]] = None
+    _hash_value: Optional[int] = None
 
     def __setattr__(self, key: str, value: Any):
         if key.startswith("_"):
@@ -28,6 +37,21 @@ class ValueObject(DeclarativeModel):
         else:
             raise ValueObjectException("modification of an immutable value object not allowed")
 
+    def _get_value_tuple(self) -> tuple[tuple[str, Any], ...]:
+        if self._value_tuple is None:
+            self._value_tuple = tuple(self._field_items())
+        return self._value_tuple
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is type(other):
+            return self._get_value_tuple() == other._get_value_tuple()
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash_value is None:
+            self._hash_value = hash(self._get_value_tuple())
+        return self._hash_value
+
 
 T = TypeVar("T", bound=Model)
 
@@ -18,6 +18,9 @@ from minos.common import (
     NULL_UUID,
     current_datetime,
 )
+from minos.common.testing import (
+    FakeModelCodec,
+)
 from tests.utils import (
     Car,
 )
@@ -59,6 +62,23 @@ class TestRepositoryEntry(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(datetime(2020, 10, 13, 8, 45, 32), entry.created_at)
         self.assertEqual(self.transaction_uuid, entry.transaction_uuid)
 
+    def test_constructor_memoryview(self):
+        data = memoryview(bytes("car", "utf-8"))
+        entry = EventEntry(self.uuid, "example.Car", 0, data)
+        self.assertIs(data, entry.data)
+        self.assertEqual(bytes("car", "utf-8"), entry.data)
+
+    def test_constructor_memoryview_char_format(self):
+        data = memoryview(bytes("car", "utf-8")).cast("c")
+        entry = EventEntry(self.uuid, "example.Car", 0, data)
+        self.assertEqual(bytes("car", "utf-8"), entry.data)
+        self.assertEqual(hash(bytes("car", "utf-8")), hash(entry.data))
+
+    async def test_field_diff_container_memoryview(self):
+        fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        entry = EventEntry(self.uuid, "example.Car", 0, memoryview(fields_diff.avro_bytes))
+        self.assertEqual(fields_diff, entry.field_diff_container)
+
     async def test_from_event(self):
         fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
         created_at = current_datetime()
@@ -74,6 +94,15 @@ class TestRepositoryEntry(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(None, entry.created_at)
         self.assertEqual(NULL_UUID, entry.transaction_uuid)
 
+    async def test_from_event_with_codec(self):
+        fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        created_at = current_datetime()
+        event = Event(self.uuid, Car.classname, 1, Action.CREATE, created_at, fields_diff)
+
+        entry = EventEntry.from_event(event, codec=FakeModelCodec())
+        self.assertEqual(fields_diff, FakeModelCodec().decode(entry.data, FieldDiffContainer))
+        self.assertEqual(fields_diff, entry.field_diff_container)
+
     async def test_from_event_with_transaction(self):
         transaction = TransactionEntry(self.transaction_uuid)
         fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
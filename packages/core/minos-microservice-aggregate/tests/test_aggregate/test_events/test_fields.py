@@ -24,6 +24,9 @@ from minos.common import (
     NULL_UUID,
     ModelType,
 )
+from minos.common.testing import (
+    remove_namespace_suffixes,
+)
 from tests.utils import (
     Car,
     MinosTestCase,
@@ -102,7 +105,7 @@ class TestFieldDiffContainer(MinosTestCase):
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "int"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.hola",
+                            "namespace": "minos.aggregate.events.fields",
                             "type": "record",
                         },
                     },
@@ -111,20 +114,19 @@ class TestFieldDiffContainer(MinosTestCase):
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "string"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.adios",
+                            "namespace": "minos.aggregate.events.fields",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "FieldDiffContainer",
-                "namespace": "minos.aggregate.events.fields.uno",
+                "namespace": "minos.aggregate.events.fields",
                 "type": "record",
             }
         ]
         with patch("minos.aggregate.FieldDiffContainer.generate_random_str", side_effect=["hello", "goodbye"]):
             diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["uno", "hola", "adios"]):
-            self.assertEqual(expected, diff.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(diff.avro_schema))
 
     def test_avro_data(self):
         expected = {"hello": {"name": "doors", "value": 5}, "goodbye": {"name": "color", "value": "yellow"}}
@@ -33,10 +33,14 @@ from minos.aggregate import (
 )
 from minos.common import (
     NULL_UUID,
+    AvroModelCodec,
     MinosSetup,
     NotProvidedException,
     current_datetime,
 )
+from minos.common.testing import (
+    FakeModelCodec,
+)
 from minos.networks import (
     BrokerMessageV1,
 )
@@ -79,6 +83,11 @@ class TestEventRepository(MinosTestCase):
         self.assertEqual(self.broker_publisher, repository._broker_publisher)
         self.assertEqual(self.transaction_repository, repository._transaction_repository)
         self.assertEqual(self.lock_pool, repository._lock_pool)
+        self.assertEqual(AvroModelCodec(), repository.codec)
+
+    def test_constructor_with_codec(self):
+        repository = _EventRepository(codec="minos.common.testing.FakeModelCodec")
+        self.assertEqual(FakeModelCodec(), repository.codec)
 
     async def test_constructor_raises(self):
         with self.assertRaises(NotProvidedException):
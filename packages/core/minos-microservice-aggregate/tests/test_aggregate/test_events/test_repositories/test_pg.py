@@ -6,6 +6,9 @@ from minos.aggregate import (
     EventRepository,
     PostgreSqlEventRepository,
 )
+from minos.common import (
+    ModelCodec,
+)
 from minos.common.testing import (
     PostgresAsyncTestCase,
 )
@@ -59,6 +62,7 @@ class TestPostgreSqlEventRepositorySubmit(PostgresAsyncTestCase, EventRepository
         self.assertEqual(self.config.repository.password, repository.password)
         self.assertEqual(self.config.repository.host, repository.host)
         self.assertEqual(self.config.repository.port, repository.port)
+        self.assertEqual(ModelCodec.get(self.config.codecs.repository), repository.codec)
 
     async def test_setup(self):
         async with aiopg.connect(**self.repository_db) as connection:
@@ -69,6 +73,13 @@ class TestPostgreSqlEventRepositorySubmit(PostgresAsyncTestCase, EventRepository
                 response = (await cursor.fetchone())[0]
         self.assertTrue(response)
 
+    async def test_setup_schema_version(self):
+        async with aiopg.connect(**self.repository_db) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT version FROM minos_schema_version WHERE name = 'aggregate_event';")
+                response = await cursor.fetchone()
+        self.assertEqual((1,), response)
+
 
 class TestPostgreSqlRepositorySelect(PostgresAsyncTestCase, EventRepositorySelectTestCase):
     __test__ = True
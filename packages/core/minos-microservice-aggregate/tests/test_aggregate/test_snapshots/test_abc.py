@@ -9,6 +9,7 @@ from unittest.mock import (
     AsyncMock,
     MagicMock,
     call,
+    patch,
 )
 from uuid import (
     uuid4,
@@ -19,6 +20,7 @@ from minos.aggregate import (
     Condition,
     Ordering,
     RootEntity,
+    SnapshotColumns,
     SnapshotRepository,
     TransactionEntry,
 )
@@ -129,6 +131,38 @@ class TestSnapshotRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, self.find_mock.call_count)
         self.assertEqual(transaction, self.find_mock.call_args.kwargs["transaction"])
 
+    async def test_find_columns(self):
+        transaction = TransactionEntry()
+        with patch.object(SnapshotColumns, "from_root_entities", return_value=2) as from_mock:
+            observed = await self.snapshot_repository.find_columns(
+                self.classname, Condition.TRUE, Ordering.ASC("name"), 10, True, transaction
+            )
+        self.assertEqual(2, observed)
+
+        self.assertEqual(1, self.synchronize_mock.call_count)
+        self.assertEqual(call(), self.synchronize_mock.call_args)
+
+        self.assertEqual(1, self.find_mock.call_count)
+        args = call(
+            name=self.classname,
+            condition=Condition.TRUE,
+            ordering=Ordering.ASC("name"),
+            limit=10,
+            streaming_mode=True,
+            transaction=transaction,
+        )
+        self.assertEqual(args, self.find_mock.call_args)
+        self.assertEqual(call(self.find_mock.return_value), from_mock.call_args)
+
+    async def test_find_columns_transaction_context(self):
+        transaction = TransactionEntry()
+        TRANSACTION_CONTEXT_VAR.set(transaction)
+        with patch.object(SnapshotColumns, "from_root_entities", return_value=2):
+            await self.snapshot_repository.find_columns(self.classname, Condition.TRUE)
+
+        self.assertEqual(1, self.find_mock.call_count)
+        self.assertEqual(transaction, self.find_mock.call_args.kwargs["transaction"])
+
     async def test_synchronize(self):
         await self.snapshot_repository.synchronize()
 
@@ -0,0 +1,177 @@
+import unittest
+from array import (
+    array,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    SnapshotColumns,
+    SnapshotEntry,
+    SnapshotRepositoryException,
+)
+from minos.common import (
+    MinosJsonBinaryProtocol,
+)
+from tests.utils import (
+    Car,
+    FakeAsyncIterator,
+    MinosTestCase,
+    Owner,
+)
+
+
+class TestSnapshotColumns(MinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        created_at = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        self.cars = [
+            Car(3, "blue", uuid=uuid4(), version=1, created_at=created_at, updated_at=created_at),
+            Car(5, "red", uuid=uuid4(), version=2, created_at=created_at, updated_at=datetime.now(tz=timezone.utc)),
+        ]
+
+    def tearDown(self) -> None:
+        self.container.unwire()
+
+    async def test_from_entries(self):
+        entries = [SnapshotEntry.from_root_entity(car) for car in self.cars]
+
+        observed = await SnapshotColumns.from_entries(FakeAsyncIterator(entries))
+
+        self.assertEqual(2, len(observed))
+        self.assertEqual(self.cars[0].avro_schema, observed.schema)
+        self.assertEqual(
+            ["uuid", "version", "created_at", "updated_at", "doors", "color", "owner"], list(observed.columns)
+        )
+        self.assertEqual([str(car.uuid) for car in self.cars], observed["uuid"])
+        self.assertEqual(array("q", [1, 2]), observed["version"])
+        self.assertEqual(array("q", [car.avro_data["updated_at"] for car in self.cars]), observed["updated_at"])
+        self.assertEqual(array("q", [3, 5]), observed["doors"])
+        self.assertEqual(["blue", "red"], observed["color"])
+        self.assertEqual([None, None], observed["owner"])
+
+    async def test_from_entries_encoded_schema(self):
+        entries = [
+            SnapshotEntry(
+                car.uuid,
+                car.classname,
+                car.version,
+                MinosJsonBinaryProtocol.encode(car.avro_schema),
+                {"doors": car.doors, "color": car.color, "owner": None},
+                car.created_at,
+                car.updated_at,
+            )
+            for car in self.cars
+        ]
+
+        observed = await SnapshotColumns.from_entries(FakeAsyncIterator(entries))
+
+        self.assertEqual(self.cars, list(observed))
+
+    async def test_from_entries_skip_deleted(self):
+        entries = [
+            SnapshotEntry(uuid4(), Car.classname, 2),
+            SnapshotEntry.from_root_entity(self.cars[0]),
+        ]
+
+        observed = await SnapshotColumns.from_entries(FakeAsyncIterator(entries))
+
+        self.assertEqual([self.cars[0]], list(observed))
+
+    async def test_from_entries_empty(self):
+        observed = await SnapshotColumns.from_entries(FakeAsyncIterator([]))
+
+        self.assertEqual(None, observed.schema)
+        self.assertEqual(dict(), observed.columns)
+        self.assertEqual(0, len(observed))
+
+    async def test_from_entries_raises(self):
+        schema = {"type": "record", "name": "Car", "fields": [{"name": "color", "type": "string"}]}
+        entries = [
+            SnapshotEntry.from_root_entity(self.cars[0]),
+            SnapshotEntry(uuid4(), Car.classname, 1, schema, {"color": "blue"}),
+        ]
+
+        with self.assertRaises(SnapshotRepositoryException):
+            await SnapshotColumns.from_entries(FakeAsyncIterator(entries))
+
+    async def test_from_root_entities(self):
+        expected = await SnapshotColumns.from_entries(
+            FakeAsyncIterator([SnapshotEntry.from_root_entity(car) for car in self.cars])
+        )
+
+        observed = await SnapshotColumns.from_root_entities(FakeAsyncIterator(self.cars))
+
+        self.assertEqual(expected, observed)
+
+    async def test_from_root_entities_raises(self):
+        owner = Owner("John", "Doe", 45, uuid=uuid4(), version=1)
+
+        with self.assertRaises(SnapshotRepositoryException):
+            await SnapshotColumns.from_root_entities(FakeAsyncIterator([self.cars[0], owner]))
+
+    async def test_columns(self):
+        schema = {
+            "type": "record",
+            "name": "Product",
+            "fields": [
+                {"name": "uuid", "type": {"type": "string", "logicalType": "uuid"}},
+                {"name": "version", "type": "int"},
+                {"name": "created_at", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+                {"name": "updated_at", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+                {"name": "price", "type": "double"},
+                {"name": "available", "type": "boolean"},
+                {"name": "discount", "type": ["float", "null"]},
+            ],
+        }
+        entry = SnapshotEntry(
+            uuid4(),
+            "path.to.Product",
+            1,
+            schema,
+            {"price": 3.5, "available": True, "discount": None},
+            datetime.now(tz=timezone.utc),
+            datetime.now(tz=timezone.utc),
+        )
+
+        observed = await SnapshotColumns.from_entries(FakeAsyncIterator([entry]))
+
+        self.assertEqual(array("d", [3.5]), observed["price"])
+        self.assertEqual(array("b", [True]), observed["available"])
+        self.assertEqual([None], observed["discount"])
+
+    async def test_build(self):
+        columns = await SnapshotColumns.from_root_entities(FakeAsyncIterator(self.cars))
+
+        self.assertEqual(self.cars[1], columns.build(1))
+        self.assertEqual(self.cars[1], columns.build(-1))
+
+    async def test_build_raises(self):
+        columns = await SnapshotColumns.from_root_entities(FakeAsyncIterator(self.cars))
+
+        with self.assertRaises(IndexError):
+            columns.build(2)
+
+    async def test_iter(self):
+        columns = await SnapshotColumns.from_root_entities(FakeAsyncIterator(self.cars))
+
+        self.assertEqual(self.cars, list(columns))
+
+    async def test_repr(self):
+        columns = await SnapshotColumns.from_root_entities(FakeAsyncIterator(self.cars))
+
+        expected = (
+            "SnapshotColumns(columns=['uuid', 'version', 'created_at', 'updated_at', 'doors', 'color', 'owner'], "
+            "size=2)"
+        )
+        self.assertEqual(expected, repr(columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,15 +3,21 @@ from datetime import (
     datetime,
 )
 from unittest.mock import (
+    PropertyMock,
     patch,
 )
 from uuid import (
     uuid4,
 )
 
+import orjson
+
 from minos.aggregate import (
     SnapshotEntry,
 )
+from minos.common import (
+    MinosJsonBinaryProtocol,
+)
 from tests.utils import (
     Car,
     MinosTestCase,
@@ -44,6 +50,13 @@ class TestSnapshotEntry(MinosTestCase):
         self.assertEqual(None, entry.created_at)
         self.assertEqual(None, entry.updated_at)
 
+    def test_constructor_encoded_schema(self):
+        encoded = MinosJsonBinaryProtocol.encode(self.schema)
+        entry = SnapshotEntry(self.uuid, "example.Car", 0, memoryview(encoded), self.data)
+        self.assertEqual(encoded, entry.encoded_schema)
+        self.assertEqual(self.schema, entry.schema)
+        self.assertEqual(encoded, entry.encoded_schema)
+
     def test_constructor_extended(self):
         entry = SnapshotEntry(
             self.uuid,
@@ -74,6 +87,24 @@ class TestSnapshotEntry(MinosTestCase):
             self.assertEqual(car.created_at, entry.created_at)
             self.assertEqual(car.updated_at, entry.updated_at)
 
+    def test_from_root_entity_encoded_data(self):
+        car = Car(3, "blue", uuid=self.uuid, version=1)
+        with patch.object(Car, "avro_data", new_callable=PropertyMock) as mock:
+            entry = SnapshotEntry.from_root_entity(car)
+            observed = entry.encoded_data
+            self.assertEqual(0, mock.call_count)
+        self.assertEqual({"color": "blue", "doors": 3, "owner": None}, orjson.loads(observed))
+
+    def test_from_root_entity_modified_later(self):
+        car = Car(3, "blue", uuid=self.uuid, version=1)
+        entry = SnapshotEntry.from_root_entity(car)
+        car.color = "red"
+        car.doors = 5
+
+        self.assertEqual({"color": "blue", "doors": 3, "owner": None}, orjson.loads(entry.encoded_data))
+        self.assertEqual({"color": "blue", "doors": 3, "owner": None}, entry.data)
+        self.assertEqual(Car(3, "blue", uuid=self.uuid, version=1), entry.build())
+
     def test_equals(self):
         a = SnapshotEntry(self.uuid, "example.Car", 0, self.schema, self.data)
         b = SnapshotEntry(self.uuid, "example.Car", 0, self.schema, self.data)
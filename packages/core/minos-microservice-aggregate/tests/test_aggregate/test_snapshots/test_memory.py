@@ -1,4 +1,7 @@
 import unittest
+from array import (
+    array,
+)
 from datetime import (
     datetime,
 )
@@ -15,6 +18,7 @@ from minos.aggregate import (
     InMemorySnapshotRepository,
     NotFoundException,
     Ordering,
+    SnapshotColumns,
     SnapshotEntry,
     SnapshotRepository,
     TransactionEntry,
@@ -354,6 +358,21 @@ class TestInMemorySnapshotRepository(MinosTestCase):
             self.assertIsInstance(obs.created_at, datetime)
             self.assertIsInstance(obs.updated_at, datetime)
 
+    async def test_find_columns(self):
+        observed = await self.snapshot_repository.find_columns(
+            "tests.utils.Car", Condition.TRUE, Ordering.ASC("updated_at")
+        )
+
+        self.assertIsInstance(observed, SnapshotColumns)
+        self.assertEqual(array("q", [3, 3]), observed["doors"])
+        self.assertEqual(array("q", [2, 1]), observed["version"])
+
+        expected = [
+            v
+            async for v in self.snapshot_repository.find("tests.utils.Car", Condition.TRUE, Ordering.ASC("updated_at"))
+        ]
+        self.assertEqual(expected, list(observed))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,6 +38,14 @@ class TestPostgreSqlSnapshotSetup(PostgresAsyncTestCase):
                     observed = (await cursor.fetchone())[0]
         self.assertEqual(True, observed)
 
+    async def test_setup_schema_version(self):
+        async with PostgreSqlSnapshotSetup.from_config(self.config):
+            async with aiopg.connect(**self.snapshot_db) as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute("SELECT name, version FROM minos_schema_version;")
+                    observed = await cursor.fetchall()
+        self.assertEqual([("snapshot", 1)], observed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -37,8 +37,10 @@ class TestPostgreSqlSnapshotRepository(MinosTestCase, PostgresAsyncTestCase):
         self.dispatch_mock = AsyncMock()
         self.get_mock = AsyncMock(return_value=1)
         self.find_mock = MagicMock(return_value=FakeAsyncIterator(range(5)))
+        self.find_columns_mock = AsyncMock(return_value=2)
         self.snapshot_repository.reader.get = self.get_mock
         self.snapshot_repository.reader.find = self.find_mock
+        self.snapshot_repository.reader.find_columns = self.find_columns_mock
         self.snapshot_repository.writer.dispatch = self.dispatch_mock
 
         self.classname = "path.to.Product"
@@ -82,6 +84,27 @@ class TestPostgreSqlSnapshotRepository(MinosTestCase, PostgresAsyncTestCase):
         )
         self.assertEqual(args, self.find_mock.call_args)
 
+    async def test_find_columns(self):
+        transaction = TransactionEntry()
+        observed = await self.snapshot_repository.find_columns(
+            self.classname, Condition.TRUE, Ordering.ASC("name"), 10, True, transaction
+        )
+        self.assertEqual(2, observed)
+
+        self.assertEqual(1, self.dispatch_mock.call_count)
+        self.assertEqual(call(), self.dispatch_mock.call_args)
+
+        self.assertEqual(1, self.find_columns_mock.call_count)
+        args = call(
+            name=self.classname,
+            condition=Condition.TRUE,
+            ordering=Ordering.ASC("name"),
+            limit=10,
+            streaming_mode=True,
+            transaction=transaction,
+        )
+        self.assertEqual(args, self.find_columns_mock.call_args)
+
     async def test_synchronize(self):
         await self.snapshot_repository.synchronize()
 
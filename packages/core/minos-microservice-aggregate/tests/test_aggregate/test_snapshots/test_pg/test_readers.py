@@ -1,7 +1,13 @@
 import unittest
+from array import (
+    array,
+)
 from datetime import (
     datetime,
 )
+from unittest.mock import (
+    patch,
+)
 from uuid import (
     uuid4,
 )
@@ -17,10 +23,14 @@ from minos.aggregate import (
     PostgreSqlSnapshotReader,
     PostgreSqlSnapshotSetup,
     PostgreSqlSnapshotWriter,
+    SnapshotColumns,
     SnapshotEntry,
     TransactionEntry,
     TransactionStatus,
 )
+from minos.common import (
+    PostgreSqlPool,
+)
 from minos.common.testing import (
     PostgresAsyncTestCase,
 )
@@ -211,6 +221,27 @@ class TestPostgreSqlSnapshotReader(MinosTestCase, PostgresAsyncTestCase):
         ]
         self.assertEqual(expected, observed)
 
+    async def test_find_read_only(self):
+        async def _fn(pool):
+            return pool
+
+        condition = Condition.IN("uuid", [self.uuid_2, self.uuid_3])
+        with patch.object(PostgreSqlPool, "select_replica", autospec=True, side_effect=_fn) as mock:
+            observed = [v.uuid async for v in self.reader.find("tests.utils.Car", condition, Ordering.ASC("uuid"))]
+
+        self.assertEqual(sorted([self.uuid_2, self.uuid_3]), observed)
+        self.assertEqual(1, mock.call_count)
+
+    async def test_find_streaming_true_with_fetch_size(self):
+        condition = Condition.IN("uuid", [self.uuid_2, self.uuid_3])
+
+        iterable = self.reader.find(
+            "tests.utils.Car", condition, streaming_mode=True, fetch_size=1, ordering=Ordering.ASC("updated_at")
+        )
+        observed = [v.uuid async for v in iterable]
+
+        self.assertEqual([self.uuid_2, self.uuid_3], observed)
+
     async def test_find_streaming_true(self):
         condition = Condition.IN("uuid", [self.uuid_2, self.uuid_3])
 
@@ -356,6 +387,39 @@ class TestPostgreSqlSnapshotReader(MinosTestCase, PostgresAsyncTestCase):
         ]
         self.assertEqual(expected, observed)
 
+    async def test_find_columns(self):
+        observed = await self.reader.find_columns("tests.utils.Car", Condition.TRUE, Ordering.ASC("updated_at"))
+
+        self.assertIsInstance(observed, SnapshotColumns)
+        self.assertEqual(2, len(observed))
+        self.assertEqual(array("q", [3, 3]), observed["doors"])
+        self.assertEqual(array("q", [2, 1]), observed["version"])
+        self.assertEqual(["blue", "blue"], observed["color"])
+        self.assertEqual([str(self.uuid_2), str(self.uuid_3)], observed["uuid"])
+
+        with patch.object(SnapshotEntry, "build") as mock:
+            observed_instances = list(observed)
+        self.assertEqual(0, mock.call_count)
+
+        expected = [v async for v in self.reader.find("tests.utils.Car", Condition.TRUE, Ordering.ASC("updated_at"))]
+        self.assertEqual(expected, observed_instances)
+
+    async def test_find_columns_with_transaction(self):
+        observed = await self.reader.find_columns(
+            "tests.utils.Car",
+            Condition.TRUE,
+            Ordering.ASC("updated_at"),
+            transaction=TransactionEntry(self.transaction_1),
+        )
+
+        self.assertEqual(array("q", [4, 1]), observed["version"])
+
+    async def test_find_columns_empty(self):
+        observed = await self.reader.find_columns("tests.utils.Car", Condition.FALSE)
+
+        self.assertEqual(0, len(observed))
+        self.assertEqual(list(), list(observed))
+
     def _assert_equal_snapshot_entries(self, expected: list[SnapshotEntry], observed: list[SnapshotEntry]):
         self.assertEqual(len(expected), len(observed))
         for exp, obs in zip(expected, observed):
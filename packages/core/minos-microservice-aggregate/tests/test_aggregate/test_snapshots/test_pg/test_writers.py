@@ -5,6 +5,7 @@ from datetime import (
 from unittest.mock import (
     MagicMock,
     call,
+    patch,
 )
 from uuid import (
     uuid4,
@@ -27,6 +28,7 @@ from minos.aggregate import (
 )
 from minos.common import (
     NotProvidedException,
+    PostgreSqlPool,
     current_datetime,
 )
 from minos.common.testing import (
@@ -117,6 +119,12 @@ class TestPostgreSqlSnapshotWriter(MinosTestCase, PostgresAsyncTestCase):
         with self.assertRaises(NotProvidedException):
             PostgreSqlSnapshotWriter.from_config(self.config, reader=self.reader, transaction_repository=None)
 
+    async def test_dispatch_reads_from_primary(self):
+        with patch.object(PostgreSqlPool, "select_replica") as mock:
+            await self.writer.dispatch()
+
+        self.assertEqual(0, mock.call_count)
+
     async def test_dispatch(self):
         await self.writer.dispatch()
 
@@ -313,7 +321,7 @@ class TestPostgreSqlSnapshotWriter(MinosTestCase, PostgresAsyncTestCase):
 
         await self.writer.dispatch()
         self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=0), mock.call_args)
+        self.assertEqual(call(id_gt=0, streaming_mode=True), mock.call_args)
         mock.reset_mock()
 
         # noinspection PyTypeChecker
@@ -326,17 +334,17 @@ class TestPostgreSqlSnapshotWriter(MinosTestCase, PostgresAsyncTestCase):
 
         await self.writer.dispatch()
         self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=11), mock.call_args)
+        self.assertEqual(call(id_gt=11, streaming_mode=True), mock.call_args)
         mock.reset_mock()
 
         await self.writer.dispatch()
         self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=12), mock.call_args)
+        self.assertEqual(call(id_gt=12, streaming_mode=True), mock.call_args)
         mock.reset_mock()
 
         await self.writer.dispatch()
         self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=12), mock.call_args)
+        self.assertEqual(call(id_gt=12, streaming_mode=True), mock.call_args)
         mock.reset_mock()
 
 
@@ -2,6 +2,9 @@ import unittest
 from unittest import (
     TestCase,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.aggregate import (
     Action,
@@ -17,6 +20,10 @@ class _Location(ValueObject):
     street: str
 
 
+class _Address(ValueObject):
+    street: str
+
+
 class TestValueObject(TestCase):
     def setUp(self) -> None:
         self.value_object = _Location(street="street name")
@@ -28,6 +35,24 @@ class TestValueObject(TestCase):
         with self.assertRaises(ValueObjectException):
             self.value_object.street = "this assignment must raise"
 
+    def test_eq(self):
+        self.assertEqual(_Location(street="street name"), self.value_object)
+        self.assertNotEqual(_Location(street="another street name"), self.value_object)
+
+    def test_eq_another_type(self):
+        self.assertEqual(_Location.model_type(street="street name"), self.value_object)
+        self.assertNotEqual(_Address(street="street name"), self.value_object)
+
+    def test_hash(self):
+        self.assertEqual(hash((("street", "street name"),)), hash(self.value_object))
+        self.assertEqual(hash(_Location(street="street name")), hash(self.value_object))
+
+    def test_hash_cached(self):
+        expected = hash(self.value_object)
+        with patch.object(_Location, "_field_items") as mock:
+            self.assertEqual(expected, hash(self.value_object))
+            self.assertEqual(0, mock.call_count)
+
 
 class TestValueObjectSet(TestCase):
     def setUp(self) -> None:
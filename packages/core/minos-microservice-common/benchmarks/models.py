@@ -0,0 +1,105 @@
+from __future__ import (
+    annotations,
+)
+
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import (
+    Generic,
+    Optional,
+    TypeVar,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from minos.common import (
+    DeclarativeModel,
+)
+
+
+class Address(DeclarativeModel):
+    """For benchmarking purposes."""
+
+    street: str
+    number: int
+    zip_code: Optional[str]
+
+
+class Customer(DeclarativeModel):
+    """For benchmarking purposes."""
+
+    uuid: UUID
+    name: str
+    surname: Optional[str]
+    tags: list[str]
+    created_at: datetime
+
+    @staticmethod
+    def parse_name(value: str) -> str:
+        """For benchmarking purposes."""
+        return value.title()
+
+
+class Order(DeclarativeModel):
+    """For benchmarking purposes."""
+
+    uuid: UUID
+    customer: Customer
+    address: Address
+    lines: list[OrderLine]
+    metadata: dict[str, str]
+
+
+class OrderLine(DeclarativeModel):
+    """For benchmarking purposes."""
+
+    product: str
+    quantity: int
+    price: float
+
+
+T = TypeVar("T")
+
+
+class Page(DeclarativeModel, Generic[T]):
+    """For benchmarking purposes."""
+
+    items: list[T]
+    total: int
+
+
+def build_address() -> Address:
+    """For benchmarking purposes."""
+    return Address("Green Street", 42, None)
+
+
+def build_customer() -> Customer:
+    """For benchmarking purposes."""
+    return Customer(uuid4(), "john", "Doe", ["foo", "bar"], datetime(2022, 1, 1, tzinfo=timezone.utc))
+
+
+def build_order(lines: int = 10) -> Order:
+    """For benchmarking purposes."""
+    return Order(
+        uuid4(),
+        build_customer(),
+        build_address(),
+        [OrderLine(f"product-{i}", i, 3.5 * i) for i in range(lines)],
+        {"channel": "web"},
+    )
+
+
+def build_page(items: int = 10) -> Page[Address]:
+    """For benchmarking purposes."""
+    return Page[Address]([build_address() for _ in range(items)], items)
+
+
+MODELS = {
+    "flat": build_address(),
+    "nested": build_order(),
+    "generic": build_page(),
+}
@@ -0,0 +1,24 @@
+import pytest
+
+from minos.common import (
+    MODEL_CODECS,
+)
+
+from .models import (
+    MODELS,
+)
+
+
+@pytest.mark.parametrize("codec_cls", MODEL_CODECS.values(), ids=MODEL_CODECS.keys())
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_encode(benchmark, codec_cls, model):
+    codec = codec_cls()
+    benchmark(codec.encode, model)
+
+
+@pytest.mark.parametrize("codec_cls", MODEL_CODECS.values(), ids=MODEL_CODECS.keys())
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_decode_trusted(benchmark, codec_cls, model):
+    codec = codec_cls()
+    raw = codec.encode(model)
+    benchmark(codec.decode, raw, type(model), trusted=True)
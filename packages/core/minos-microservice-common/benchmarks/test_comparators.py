@@ -0,0 +1,29 @@
+from typing import (
+    Optional,
+    Union,
+)
+
+import pytest
+
+from minos.common import (
+    ModelType,
+    TypeHintComparator,
+)
+
+from .models import (
+    Address,
+    Order,
+)
+
+PAIRS = {
+    "builtin": (int, int),
+    "union": (Optional[list[int]], Union[None, list[int], str]),
+    "model": (Order, ModelType.from_model(Order)),
+    "model-mismatch": (Address, Order),
+}
+
+
+@pytest.mark.parametrize("pair", PAIRS.values(), ids=PAIRS.keys())
+def test_type_hint_comparator(benchmark, pair):
+    first, second = pair
+    benchmark(lambda: TypeHintComparator(first, second).match())
@@ -0,0 +1,29 @@
+import pytest
+
+from minos.common.model.declarative import (
+    _get_class_type_hints,
+    _get_field_hook_names,
+    _merge_type_hints_cached,
+)
+
+from .models import (
+    build_address,
+    build_customer,
+    build_order,
+    build_page,
+)
+
+
+@pytest.mark.parametrize("build", [build_address, build_customer, build_order, build_page])
+def test_construction(benchmark, build):
+    benchmark(build)
+
+
+def test_construction_without_caches(benchmark):
+    def _fn():
+        _get_class_type_hints.cache_clear()
+        _merge_type_hints_cached.cache_clear()
+        _get_field_hook_names.cache_clear()
+        return build_order()
+
+    benchmark(_fn)
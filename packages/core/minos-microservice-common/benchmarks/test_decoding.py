@@ -0,0 +1,34 @@
+import pytest
+
+from minos.common import (
+    AvroSchemaDecoder,
+    Model,
+)
+
+from .models import (
+    MODELS,
+    build_order,
+)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_from_avro_bytes(benchmark, model):
+    raw = model.avro_bytes
+    benchmark(type(model).from_avro_bytes, raw)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_from_avro_bytes_trusted(benchmark, model):
+    raw = model.avro_bytes
+    benchmark(type(model).from_avro_bytes, raw, trusted=True)
+
+
+def test_from_avro_bytes_batch(benchmark):
+    raw = Model.to_avro_bytes([build_order() for _ in range(100)])
+    benchmark(Model.from_avro_bytes, raw, batch_mode=True)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_avro_schema_decoder(benchmark, model):
+    schema = model.avro_schema
+    benchmark(lambda: AvroSchemaDecoder(schema).build())
@@ -0,0 +1,30 @@
+import pytest
+
+from minos.common import (
+    Model,
+)
+
+from .models import (
+    MODELS,
+    build_order,
+)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_avro_schema(benchmark, model):
+    benchmark(lambda: model.avro_schema)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_avro_data(benchmark, model):
+    benchmark(lambda: model.avro_data)
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_avro_bytes(benchmark, model):
+    benchmark(lambda: model.avro_bytes)
+
+
+def test_to_avro_bytes_batch(benchmark):
+    models = [build_order() for _ in range(100)]
+    benchmark(Model.to_avro_bytes, models)
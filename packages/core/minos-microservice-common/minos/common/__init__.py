@@ -4,6 +4,7 @@ __version__ = "0.5.0"
 
 from .configuration import (
     BROKER,
+    CODECS,
     DISCOVERY,
     QUEUE,
     REPOSITORY,
@@ -16,10 +17,27 @@ from .configuration import (
     MinosConfigAbstract,
 )
 from .database import (
+    QUERY_INSTRUMENTATION,
+    QUERY_PERCENTILES,
+    SCHEMA_VERSION_TABLE_NAME,
+    STREAMING_FETCH_SIZE,
+    AiopgCursor,
+    AsyncPgConnection,
+    AsyncPgCursor,
+    AsyncPgLockPool,
+    AsyncPgPool,
     PostgreSqlLock,
+    PostgreSqlLockManager,
     PostgreSqlLockPool,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
     PostgreSqlPool,
+    QueryEvent,
+    QueryInstrumentation,
+    QueryMetrics,
+    QueryTrace,
+    fingerprint_query,
+    paginate,
 )
 from .datetime import (
     NULL_DATETIME,
@@ -68,11 +86,15 @@ from .meta import (
     self_or_classmethod,
 )
 from .model import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+    MODEL_CODECS,
     AvroDataDecoder,
     AvroDataEncoder,
+    AvroModelCodec,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
     BucketModel,
+    CompactDeclarativeModel,
     DataDecoder,
     DataEncoder,
     DataTransferObject,
@@ -80,9 +102,11 @@ from .model import (
     DynamicModel,
     Field,
     GenericTypeProjector,
+    JsonModelCodec,
     MinosModel,
     MissingSentinel,
     Model,
+    ModelCodec,
     ModelField,
     ModelType,
     NoneType,
@@ -93,14 +117,19 @@ from .model import (
     is_model_type,
 )
 from .pools import (
+    WAIT_TIME_BUCKETS,
     MinosPool,
+    PoolMetrics,
 )
 from .protocol import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
     MinosBinaryProtocol,
     MinosJsonBinaryProtocol,
+    PostgreSqlAvroSchemaRegistry,
 )
 from .setup import (
     MinosSetup,
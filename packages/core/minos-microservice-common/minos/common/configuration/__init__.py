@@ -1,5 +1,6 @@
 from .config import (
     BROKER,
+    CODECS,
     DISCOVERY,
     QUEUE,
     REPOSITORY,
@@ -12,6 +12,7 @@ from pathlib import (
 )
 from typing import (
     Any,
+    Optional,
     Union,
 )
 
@@ -28,9 +29,18 @@ STORAGE = namedtuple("Storage", "path")
 
 SAGA = namedtuple("Saga", "storage")
 REST = namedtuple("Rest", "host port")
-REPOSITORY = namedtuple("Repository", "database user password host port")
-SNAPSHOT = namedtuple("Snapshot", "database user password host port")
+REPOSITORY = namedtuple(
+    "Repository",
+    "database user password host port replicas replica_balancing max_replication_lag",
+    defaults=((), "round-robin", None),
+)
+SNAPSHOT = namedtuple(
+    "Snapshot",
+    "database user password host port replicas replica_balancing max_replication_lag",
+    defaults=((), "round-robin", None),
+)
 DISCOVERY = namedtuple("Discovery", "client host port")
+CODECS = namedtuple("Codecs", "default repository topics")
 
 _ENVIRONMENT_MAPPER = {
     "service.name": "MINOS_SERVICE_NAME",
@@ -58,6 +68,8 @@ _ENVIRONMENT_MAPPER = {
     "discovery.client": "MINOS_DISCOVERY_CLIENT",
     "discovery.host": "MINOS_DISCOVERY_HOST",
     "discovery.port": "MINOS_DISCOVERY_PORT",
+    "codecs.default": "MINOS_CODECS_DEFAULT",
+    "codecs.repository": "MINOS_CODECS_REPOSITORY",
 }
 
 _PARAMETERIZED_MAPPER = {
@@ -88,6 +100,8 @@ _PARAMETERIZED_MAPPER = {
     "discovery.client": "minos_discovery_client",
     "discovery.host": "minos_discovery_host",
     "discovery.port": "minos_discovery_port",
+    "codecs.default": "codecs_default",
+    "codecs.repository": "codecs_repository",
 }
 
 
@@ -269,6 +283,7 @@ class MinosConfig(MinosConfigAbstract):
             password=self._get("repository.password"),
             host=self._get("repository.host"),
             port=int(self._get("repository.port")),
+            **self._get_replication("repository"),
         )
 
     @property
@@ -283,8 +298,31 @@ class MinosConfig(MinosConfigAbstract):
             password=self._get("snapshot.password"),
             host=self._get("snapshot.host"),
             port=int(self._get("snapshot.port")),
+            **self._get_replication("snapshot"),
         )
 
+    def _get_replication(self, prefix: str) -> dict[str, Any]:
+        try:
+            replicas = self._get(f"{prefix}.replicas")
+        except MinosConfigException:
+            replicas = list()
+
+        try:
+            replica_balancing = self._get(f"{prefix}.replica_balancing")
+        except MinosConfigException:
+            replica_balancing = "round-robin"
+
+        try:
+            max_replication_lag = float(self._get(f"{prefix}.max_replication_lag"))
+        except MinosConfigException:
+            max_replication_lag = None
+
+        return {
+            "replicas": tuple(replicas),
+            "replica_balancing": replica_balancing,
+            "max_replication_lag": max_replication_lag,
+        }
+
     @property
     def discovery(self) -> DISCOVERY:
         """Get the sagas config.
@@ -295,3 +333,36 @@ class MinosConfig(MinosConfigAbstract):
         host = self._get("discovery.host")
         port = self._get("discovery.port")
         return DISCOVERY(client=client, host=host, port=port)
+
+    @property
+    def codecs(self) -> CODECS:
+        """Get the codecs config.
+
+        The ``default`` codec is used to serialize every model unless the repository or the message topic have their
+        own codec. Every value can be the name of a registered codec (i.e. ``avro`` or ``json``) or its classname.
+
+        :return: A ``CODECS`` NamedTuple instance.
+        """
+        default = self._codecs_default
+        return CODECS(default=default, repository=self._codecs_repository or default, topics=self._codecs_topics)
+
+    @property
+    def _codecs_default(self) -> str:
+        try:
+            return self._get("codecs.default")
+        except MinosConfigException:
+            return "avro"
+
+    @property
+    def _codecs_repository(self) -> Optional[str]:
+        try:
+            return self._get("codecs.repository")
+        except MinosConfigException:
+            return None
+
+    @property
+    def _codecs_topics(self) -> dict[str, str]:
+        try:
+            return self._get("codecs.topics")
+        except MinosConfigException:
+            return dict()
@@ -1,10 +1,37 @@
 from .abc import (
+    STREAMING_FETCH_SIZE,
     PostgreSqlMinosDatabase,
 )
+from .aiopg import (
+    AiopgCursor,
+)
+from .asyncpg import (
+    AsyncPgConnection,
+    AsyncPgCursor,
+    AsyncPgLockPool,
+    AsyncPgPool,
+)
+from .instrumentation import (
+    QUERY_INSTRUMENTATION,
+    QUERY_PERCENTILES,
+    QueryEvent,
+    QueryInstrumentation,
+    QueryMetrics,
+    QueryTrace,
+    fingerprint_query,
+)
 from .locks import (
     PostgreSqlLock,
+    PostgreSqlLockManager,
+)
+from .migrations import (
+    SCHEMA_VERSION_TABLE_NAME,
+    PostgreSqlMigration,
 )
 from .pools import (
     PostgreSqlLockPool,
     PostgreSqlPool,
 )
+from .utils import (
+    paginate,
+)
@@ -1,10 +1,20 @@
 from collections.abc import (
     Hashable,
+    Iterable,
+    Sequence,
+)
+from contextlib import (
+    asynccontextmanager,
+    contextmanager,
+)
+from time import (
+    perf_counter,
 )
 from typing import (
     Any,
     AsyncContextManager,
     AsyncIterator,
+    Iterator,
     Optional,
 )
 
@@ -18,28 +28,67 @@ from dependency_injector.wiring import (
     Provide,
     inject,
 )
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
 
 from ..setup import (
     MinosSetup,
 )
+from .instrumentation import (
+    QUERY_INSTRUMENTATION,
+    QueryInstrumentation,
+    QueryTrace,
+)
 from .locks import (
     PostgreSqlLock,
 )
+from .migrations import (
+    _CREATE_SCHEMA_VERSION_TABLE_QUERY,
+    _SCHEMA_VERSION_TABLE_EXISTS_QUERY,
+    _SELECT_SCHEMA_VERSIONS_QUERY,
+    _UPSERT_SCHEMA_VERSION_QUERY,
+    SCHEMA_VERSION_TABLE_NAME,
+    PostgreSqlMigration,
+)
 from .pools import (
     PostgreSqlPool,
 )
 
+STREAMING_FETCH_SIZE = 1000
+
 
 class PostgreSqlMinosDatabase(MinosSetup):
     """PostgreSql Minos Database base class."""
 
-    def __init__(self, host: str, port: int, database: str, user: str, password: str, *args, **kwargs):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: str,
+        password: str,
+        *args,
+        replicas: Iterable[dict[str, Any]] = (),
+        replica_balancing: str = "round-robin",
+        max_replication_lag: Optional[float] = None,
+        instrumentation: Optional[QueryInstrumentation] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        if instrumentation is None:
+            instrumentation = QUERY_INSTRUMENTATION
+
         self.host = host
         self.port = port
         self.database = database
         self.user = user
         self.password = password
+        self.replicas = tuple(replicas)
+        self.replica_balancing = replica_balancing
+        self.max_replication_lag = max_replication_lag
+        self.instrumentation = instrumentation
 
         self._pool = None
         self._owned_pool = False
@@ -50,6 +99,68 @@ class PostgreSqlMinosDatabase(MinosSetup):
             self._pool = None
             self._owned_pool = False
 
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        return tuple()
+
+    async def migrate(self, *migrations: PostgreSqlMigration) -> None:
+        """Apply the pending schema migrations.
+
+        The schema versions are checked with a single round trip, so if they are up to date (the usual case at
+        startup) neither DDL statements nor locks are needed. Otherwise, the pending steps of each migration are
+        applied within a transaction while the schema version lock is held, and the new version is recorded into the
+        ``minos_schema_version`` table. The migrations that have already been checked through the same pool are
+        skipped.
+
+        :param migrations: The migrations to be applied. If not set, the ``migrations`` of the instance are used.
+        :return: This method does not return anything.
+        """
+        if not migrations:
+            migrations = self.migrations
+
+        checked = self.pool.checked_migrations
+        migrations = [migration for migration in migrations if migration not in checked]
+        if not migrations:
+            return
+
+        versions = await self._get_schema_versions(migration.name for migration in migrations)
+        for migration in migrations:
+            if versions.get(migration.name, 0) < migration.version:
+                await self._apply_migration(migration)
+            checked.add(migration)
+
+    async def _get_schema_versions(self, names: Iterable[str]) -> dict[str, int]:
+        async with self.cursor() as cursor:
+            await cursor.execute(_SCHEMA_VERSION_TABLE_EXISTS_QUERY)
+            (exists,) = await cursor.fetchone()
+            if not exists:
+                return dict()
+
+            await cursor.execute(_SELECT_SCHEMA_VERSIONS_QUERY, (tuple(names),))
+            return dict(await cursor.fetchall())
+
+    async def _apply_migration(self, migration: PostgreSqlMigration) -> None:
+        async with self.locked_cursor(SCHEMA_VERSION_TABLE_NAME) as cursor:
+            await cursor.execute(_CREATE_SCHEMA_VERSION_TABLE_QUERY)
+
+            async with cursor.begin():
+                await cursor.execute(_SELECT_SCHEMA_VERSIONS_QUERY, ((migration.name,),))
+                row = await cursor.fetchone()
+                version = 0 if row is None else row[1]
+
+                steps = migration.get_pending_steps(version)
+                if not steps:
+                    return
+
+                for step in steps:
+                    for operation in step:
+                        await cursor.execute(operation)
+                await cursor.execute(_UPSERT_SCHEMA_VERSION_QUERY, (migration.name, migration.version))
+
     async def submit_query_and_fetchone(self, *args, **kwargs) -> tuple:
         """Submit a SQL query and gets the first response.
 
@@ -68,6 +179,8 @@ class PostgreSqlMinosDatabase(MinosSetup):
         timeout: Optional[float] = None,
         lock: Optional[int] = None,
         streaming_mode: bool = False,
+        fetch_size: int = STREAMING_FETCH_SIZE,
+        read_only: bool = False,
         **kwargs,
     ) -> AsyncIterator[tuple]:
         """Submit a SQL query and return an asynchronous iterator.
@@ -77,26 +190,35 @@ class PostgreSqlMinosDatabase(MinosSetup):
         :param timeout: An optional timeout.
         :param lock: Optional key to perform the query with locking. If not set, the query is performed without any
             lock.
-        :param streaming_mode: If ``True`` the data fetching is performed in streaming mode, that is iterating over the
-            cursor and yielding once a time (requires an opening connection to do that). Otherwise, all the data is
-            fetched and keep in memory before yielding it.
+        :param streaming_mode: If ``True`` the data fetching is performed in streaming mode, that is, the query is
+            executed through a server-side cursor (so it must be a ``SELECT`` or ``VALUES`` query) and the rows are
+            fetched in chunks of ``fetch_size`` rows (requires an opening connection and transaction to do that).
+            Otherwise, all the data is fetched and keep in memory before yielding it.
+        :param fetch_size: The number of rows retrieved on each round trip in streaming mode.
+        :param read_only: If ``True`` the query can be routed to a read replica (if the pool has any). Locked queries
+            are always performed on the primary database.
         :param kwargs: Additional named arguments.
         :return: This method does not return anything.
         """
-        if lock is None:
-            context_manager = self.cursor()
-        else:
-            context_manager = self.locked_cursor(lock)
-
-        async with context_manager as cursor:
-            await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
-
+        trace = QueryTrace()
+        async with self._get_cursor(trace, lock, read_only) as cursor:
             if streaming_mode:
-                async for row in cursor:
-                    yield row
+                with self._trace_query(trace, operation):
+                    trace.rows = 0
+                    rows = cursor.stream(operation, parameters, fetch_size=fetch_size, timeout=timeout)
+                    try:
+                        async for row in rows:
+                            trace.rows += 1
+                            yield row
+                    finally:
+                        # The server-side cursor must be closed before the connection is released.
+                        await rows.aclose()
                 return
 
-            rows = await cursor.fetchall()
+            with self._trace_query(trace, operation):
+                await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
+                rows = await cursor.fetchall()
+                trace.rows = len(rows)
 
         for row in rows:
             yield row
@@ -115,45 +237,176 @@ class PostgreSqlMinosDatabase(MinosSetup):
         :param kwargs: Additional named arguments.
         :return: This method does not return anything.
         """
-        if lock is None:
-            context_manager = self.cursor()
-        else:
-            context_manager = self.locked_cursor(lock)
+        trace = QueryTrace()
+        async with self._get_cursor(trace, lock) as cursor:
+            with self._trace_query(trace, operation):
+                await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
 
-        async with context_manager as cursor:
-            await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
+    # noinspection PyUnusedLocal
+    async def submit_many(
+        self,
+        operation: Any,
+        parameters_seq: Iterable[Any],
+        *,
+        timeout: Optional[float] = None,
+        lock: Any = None,
+        transaction: bool = True,
+        page_size: int = 100,
+        **kwargs,
+    ) -> None:
+        """Submit a SQL query once for each of the given parameters, using a single connection.
 
-    def locked_cursor(self, key: Hashable, *args, **kwargs) -> AsyncContextManager[Cursor]:
-        """Get a new locked cursor.
+        If the connection supports it, the statements are pipelined, otherwise they are sent in pages, so that each
+        page only requires one round trip.
 
-        :param key: The key to be used for locking.
-        :param args: Additional positional arguments.
+        :param operation: Query to be executed.
+        :param parameters_seq: A sequence of parameters to be projected into the query.
+        :param timeout: An optional timeout (applied to each page).
+        :param lock: Optional key to perform the query with locking. If not set, the query is performed without any
+            lock.
+        :param transaction: If ``True`` all the statements are executed within a single transaction.
+        :param page_size: The maximum number of statements sent on each round trip (not used by pipelined
+            statements).
         :param kwargs: Additional named arguments.
-        :return: A Cursor wrapped into an asynchronous context manager.
+        :return: This method does not return anything.
         """
-        lock = PostgreSqlLock(self.pool.acquire(), key, *args, **kwargs)
+        trace = QueryTrace()
+        async with self._bulk_cursor(trace, lock, transaction) as cursor:
+            with self._trace_query(trace, operation):
+                parameters_seq = _count(parameters_seq, trace)
+                await cursor.executemany(operation, parameters_seq, timeout=timeout, page_size=page_size)
 
-        async def _fn_enter():
-            await lock.__aenter__()
-            return lock.cursor
+    # noinspection PyUnusedLocal
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        timeout: Optional[float] = None,
+        lock: Any = None,
+        transaction: bool = True,
+        page_size: int = 1000,
+        **kwargs,
+    ) -> None:
+        """Insert the given rows into a table, using a single connection.
 
-        async def _fn_exit(_):
-            await lock.__aexit__(None, None, None)
+        If the connection supports it, the rows are sent with ``COPY ... FROM STDIN (FORMAT binary)``, otherwise
+        they are sent as multi-row ``INSERT ... VALUES`` statements.
 
-        return ContextManager(_fn_enter, _fn_exit)
+        :param table: The table name.
+        :param columns: The column names.
+        :param rows: The rows to be inserted, containing one value for each column.
+        :param timeout: An optional timeout (applied to each page).
+        :param lock: Optional key to perform the query with locking. If not set, the query is performed without any
+            lock.
+        :param transaction: If ``True`` all the rows are inserted within a single transaction.
+        :param page_size: The maximum number of rows sent on each round trip (only used by ``INSERT ... VALUES``).
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        operation = SQL("COPY {table} ({columns}) FROM STDIN").format(
+            table=Identifier(table), columns=SQL(", ").join(map(Identifier, columns))
+        )
 
-    def cursor(self, *args, **kwargs) -> AsyncContextManager[Cursor]:
+        trace = QueryTrace()
+        async with self._bulk_cursor(trace, lock, transaction) as cursor:
+            with self._trace_query(trace, operation):
+                rows = _count(rows, trace)
+                await cursor.copy_records(table, columns, rows, timeout=timeout, page_size=page_size)
+
+    @asynccontextmanager
+    async def _bulk_cursor(self, trace: QueryTrace, lock: Any, transaction: bool) -> AsyncIterator[Cursor]:
+        async with self._get_cursor(trace, lock) as cursor:
+            if not transaction:
+                yield cursor
+                return
+
+            async with cursor.begin():
+                yield cursor
+
+    def _get_cursor(self, trace: QueryTrace, lock: Any = None, read_only: bool = False) -> AsyncContextManager[Cursor]:
+        if lock is None:
+            return self.cursor(read_only=read_only, trace=trace)
+        return self.locked_cursor(lock, trace=trace)
+
+    @contextmanager
+    def _trace_query(self, trace: QueryTrace, operation: Any) -> Iterator[QueryTrace]:
+        started_at = perf_counter()
+        failed = False
+        try:
+            yield trace
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._notify(trace, operation, perf_counter() - started_at, failed)
+
+    def _notify(self, trace: QueryTrace, operation: Any, duration: float, failed: bool = False) -> None:
+        if not self.instrumentation.enabled:
+            return
+        self.instrumentation.notify(trace.build_event(operation, duration, failed))
+
+    @asynccontextmanager
+    async def locked_cursor(
+        self, key: Hashable, *args, trace: Optional[QueryTrace] = None, **kwargs
+    ) -> AsyncIterator[Cursor]:
+        """Get a new locked cursor.
+
+        :param key: The key to be used for locking.
+        :param args: Additional positional arguments.
+        :param trace: The trace in which the lock and pool wait times are stored. If not set, an event describing the
+            cursor usage is notified to the instrumentation once the cursor is released.
+        :param kwargs: Additional named arguments.
+        :return: A Cursor wrapped into an asynchronous context manager.
+        """
+        owned = trace is None
+        if owned:
+            trace = QueryTrace()
+
+        started_at = perf_counter()
+        async with PostgreSqlLock(self.pool.lock_manager, key):
+            trace.lock_wait_time = perf_counter() - started_at
+            async with self.cursor(*args, trace=trace, **kwargs) as cursor:
+                if not owned:
+                    yield cursor
+                    return
+
+                with self._trace_query(trace, None):
+                    yield cursor
+
+    def cursor(
+        self, *args, read_only: bool = False, trace: Optional[QueryTrace] = None, **kwargs
+    ) -> AsyncContextManager[Cursor]:
         """Get a new cursor.
 
         :param args: Additional positional arguments.
+        :param read_only: If ``True`` the cursor can be opened on a read replica (if the pool has any).
+        :param trace: The trace in which the pool wait time is stored. If not set, an event describing the cursor usage
+            is notified to the instrumentation once the cursor is released.
         :param kwargs: Additional named arguments.
         :return: A Cursor wrapped into an asynchronous context manager.
         """
-        acquired = self.pool.acquire()
+        owned = trace is None
+        if owned:
+            trace = QueryTrace()
+
+        acquired = None
+        acquired_at = None
 
         async def _fn_enter():
+            nonlocal acquired, acquired_at
+            started_at = perf_counter()
+            pool = self.pool
+            if read_only:
+                pool = await pool.select_replica()
+
+            acquired = pool.acquire()
             connection = await acquired.__aenter__()
-            cursor = await connection.cursor(*args, **kwargs).__aenter__()
+            cursor = await pool.open_cursor(connection, *args, **kwargs)
+
+            acquired_at = perf_counter()
+            trace.pool_wait_time = acquired_at - started_at
             return cursor
 
         async def _fn_exit(cursor: Cursor):
@@ -161,6 +414,9 @@ class PostgreSqlMinosDatabase(MinosSetup):
                 cursor.close()
             await acquired.__aexit__(None, None, None)
 
+            if owned:
+                self._notify(trace, None, perf_counter() - acquired_at)
+
         return ContextManager(_fn_enter, _fn_exit)
 
     @property
@@ -179,6 +435,20 @@ class PostgreSqlMinosDatabase(MinosSetup):
             return pool, False
 
         pool = PostgreSqlPool(
-            host=self.host, port=self.port, database=self.database, user=self.user, password=self.password
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            replicas=self.replicas,
+            replica_balancing=self.replica_balancing,
+            max_replication_lag=self.max_replication_lag,
         )
         return pool, True
+
+
+def _count(values: Iterable[Any], trace: QueryTrace) -> Iterator[Any]:
+    trace.rows = 0
+    for value in values:
+        trace.rows += 1
+        yield value
@@ -0,0 +1,121 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+)
+from uuid import (
+    uuid4,
+)
+
+from aiopg import (
+    Cursor,
+)
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+    Literal,
+)
+
+from .utils import (
+    paginate,
+)
+
+
+class AiopgCursor:
+    """Wrapper of an ``aiopg`` cursor that exposes the same bulk and streaming interface as ``AsyncPgCursor``.
+
+    The rest of attributes and methods are delegated to the wrapped cursor.
+    """
+
+    def __init__(self, impl: Cursor):
+        self.impl = impl
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.impl, item)
+
+    async def __aenter__(self) -> AiopgCursor:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __aiter__(self) -> AsyncIterator[tuple]:
+        return self.impl.__aiter__()
+
+    async def executemany(
+        self, operation: Any, parameters_seq: Iterable[Any], timeout: Optional[float] = None, page_size: int = 100
+    ) -> None:
+        """Execute a query once for each of the given parameters.
+
+        The statements are sent in pages, so that each page only requires one round trip.
+
+        :param operation: Query to be executed.
+        :param parameters_seq: A sequence of parameters to be projected into the query.
+        :param timeout: An optional timeout (applied to each page).
+        :param page_size: The maximum number of statements sent on each round trip.
+        :return: This method does not return anything.
+        """
+        for page in paginate(parameters_seq, page_size):
+            query = b";".join(self.mogrify(operation, parameters) for parameters in page)
+            await self.execute(query, timeout=timeout)
+
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        timeout: Optional[float] = None,
+        page_size: int = 1000,
+    ) -> None:
+        """Insert the given rows into a table using multi-row ``INSERT ... VALUES`` statements.
+
+        :param table: The table name.
+        :param columns: The column names.
+        :param rows: The rows to be inserted, containing one value for each column.
+        :param timeout: An optional timeout (applied to each page).
+        :param page_size: The maximum number of rows sent on each round trip.
+        :return: This method does not return anything.
+        """
+        prefix = self.mogrify(
+            SQL("INSERT INTO {table} ({columns}) VALUES ").format(
+                table=Identifier(table), columns=SQL(", ").join(map(Identifier, columns))
+            )
+        )
+        template = f"({', '.join('%s' for _ in columns)})"
+        for page in paginate(rows, page_size):
+            query = prefix + b", ".join(self.mogrify(template, row) for row in page)
+            await self.execute(query, timeout=timeout)
+
+    async def stream(
+        self, operation: Any, parameters: Any = None, fetch_size: int = 1000, timeout: Optional[float] = None
+    ) -> AsyncIterator[tuple]:
+        """Execute a query through a server-side cursor and iterate over its rows.
+
+        :param operation: Query to be executed.
+        :param parameters: Parameters to be projected into the query.
+        :param fetch_size: The number of rows retrieved on each round trip.
+        :param timeout: An optional timeout.
+        :return: An asynchronous iterator of ``tuple`` instances.
+        """
+        name = Identifier(f"minos_{uuid4().hex}")
+        declare = self.mogrify(SQL("DECLARE {name} NO SCROLL CURSOR FOR ").format(name=name))
+        declare += self.mogrify(operation, parameters)
+        fetch = SQL("FETCH FORWARD {size} FROM {name};").format(size=Literal(fetch_size), name=name)
+
+        async with self.begin():
+            await self.execute(declare, timeout=timeout)
+            while True:
+                await self.execute(fetch, timeout=timeout)
+                rows = await self.fetchall()
+                for row in rows:
+                    yield row
+                if len(rows) < fetch_size:
+                    break
@@ -0,0 +1,559 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+import re
+from asyncio import (
+    Queue,
+    TimeoutError,
+    sleep,
+)
+from collections.abc import (
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Optional,
+    Union,
+)
+from uuid import (
+    UUID,
+)
+
+import asyncpg
+import orjson
+from psycopg2 import (
+    IntegrityError,
+)
+from psycopg2.extensions import (
+    Notify,
+)
+from psycopg2.extras import (
+    Json,
+)
+
+from .pools import (
+    PostgreSqlLockPool,
+    PostgreSqlPool,
+)
+from .utils import (
+    render_query,
+)
+
+logger = logging.getLogger(__name__)
+
+QUERY_CACHE_MAXSIZE = 1024
+
+_PLACEHOLDER_PATTERN = re.compile(r"%\(([^)]+)\)s|%s|%%")
+_NULL = "NULL"
+_CASTS: dict[type, str] = {
+    UUID: "uuid",
+    bool: "boolean",
+    bytes: "bytea",
+    bytearray: "bytea",
+    memoryview: "bytea",
+    date: "date",
+    time: "time",
+    timedelta: "interval",
+}
+_LEXICAL_PATTERN = re.compile(
+    r"(?<!\w)[eE]'(?:[^'\\]|\\.|'')*'|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\""
+    r"|--[^\n]*|/\*.*?\*/|(\$(?:[A-Za-z_]\w*)?\$).*?\1",
+    re.DOTALL,
+)
+_LISTEN_PATTERN = re.compile(r'^\s*(LISTEN|UNLISTEN)\s+("(?:[^"]|"")+"|[^\s;]+)\s*;?\s*$', re.IGNORECASE)
+
+
+class AsyncPgPool(PostgreSqlPool):
+    """Postgres Pool class based on ``asyncpg``.
+
+    The connections use the binary protocol and prepare (and cache) automatically the executed statements, but they
+    are wrapped to expose the same cursor interface as the ``aiopg`` ones, so this pool can be used as a drop-in
+    replacement of ``PostgreSqlPool`` (i.e. injecting ``minos.common.AsyncPgPool`` as the ``postgresql_pool``).
+    """
+
+    def __init__(self, *args, statement_cache_size: int = 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statement_cache_size = statement_cache_size
+
+    def _build_replica_pool(self, **kwargs) -> AsyncPgPool:
+        return AsyncPgPool(**self._get_replica_kwargs(**kwargs), statement_cache_size=self.statement_cache_size)
+
+    async def open_cursor(self, connection: AsyncPgConnection, *args, **kwargs) -> AsyncPgCursor:
+        """Open a new cursor on a connection acquired from the pool.
+
+        :param connection: The connection.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: An ``AsyncPgCursor`` instance.
+        """
+        return connection.cursor(*args, **kwargs)
+
+    async def _create_instance(self) -> Optional[AsyncPgConnection]:
+        try:
+            raw = await asyncpg.connect(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                statement_cache_size=self.statement_cache_size,
+            )
+        except (OSError, TimeoutError, asyncpg.PostgresError) as exc:
+            logger.warning(f"There was an {exc!r} while trying to get a database connection.")
+            await sleep(self._get_creation_retry_delay())
+            return None
+
+        await _set_type_codecs(raw)
+        connection = AsyncPgConnection(raw)
+
+        logger.info(f"Created {self.database!r} database connection identified by {id(connection)}!")
+        return connection
+
+    async def _check_instance(self, instance: Optional[AsyncPgConnection]) -> bool:
+        if instance is None:
+            return False
+
+        return not instance.closed
+
+
+class AsyncPgLockPool(AsyncPgPool, PostgreSqlLockPool):
+    """Postgres Locking Pool class based on ``asyncpg``."""
+
+
+class AsyncPgConnection:
+    """Wrapper of an ``asyncpg`` connection that exposes the ``aiopg`` connection interface."""
+
+    def __init__(self, raw: asyncpg.Connection):
+        self.raw = raw
+        self.notifies = Queue()
+        self._channels = set()
+
+    @property
+    def closed(self) -> bool:
+        """Check if the connection is closed.
+
+        :return: ``True`` if the connection is closed or ``False`` otherwise.
+        """
+        return self.raw.is_closed()
+
+    def cursor(self, *args, **kwargs) -> AsyncPgCursor:
+        """Get a new cursor.
+
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: An ``AsyncPgCursor`` instance.
+        """
+        return AsyncPgCursor(self)
+
+    async def close(self) -> None:
+        """Close the connection.
+
+        :return: This method does not return anything.
+        """
+        await self.raw.close()
+
+    async def listen(self, channel: str) -> None:
+        """Start listening the given notification channel.
+
+        The received notifications are put into the ``notifies`` queue.
+
+        :param channel: The channel name.
+        :return: This method does not return anything.
+        """
+        await self.raw.add_listener(channel, self._on_notification)
+        self._channels.add(channel)
+
+    async def unlisten(self, channel: str) -> None:
+        """Stop listening the given notification channel.
+
+        :param channel: The channel name. If ``*`` is given, all the channels are unlistened.
+        :return: This method does not return anything.
+        """
+        if channel == "*":
+            channels = set(self._channels)
+        else:
+            channels = {channel}
+
+        for channel in channels:
+            await self.raw.remove_listener(channel, self._on_notification)
+            self._channels.discard(channel)
+
+    # noinspection PyUnusedLocal
+    def _on_notification(self, raw: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        self.notifies.put_nowait(Notify(pid, channel, payload))
+
+
+class AsyncPgCursor:
+    """Cursor-like class on top of an ``asyncpg`` connection.
+
+    The queries follow the ``psycopg2`` format (``%s`` and ``%(name)s`` placeholders or ``psycopg2.sql`` composables),
+    so they are translated to the ``asyncpg`` format (``$n`` placeholders) before being executed as prepared statements.
+    """
+
+    def __init__(self, connection: AsyncPgConnection):
+        self.connection = connection
+        self._rows = None
+        self._position = 0
+        self._closed = False
+
+    async def __aenter__(self) -> AsyncPgCursor:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Check if the cursor is closed.
+
+        :return: ``True`` if the cursor is closed or ``False`` otherwise.
+        """
+        return self._closed or self.connection.closed
+
+    def close(self) -> None:
+        """Close the cursor.
+
+        :return: This method does not return anything.
+        """
+        self._rows = None
+        self._closed = True
+
+    def begin(self) -> AsyncContextManager:
+        """Begin a new transaction.
+
+        :return: An asynchronous context manager.
+        """
+        return self.connection.raw.transaction()
+
+    async def execute(self, operation: Any, parameters: Any = None, timeout: Optional[float] = None) -> None:
+        """Execute a query.
+
+        :param operation: Query to be executed.
+        :param parameters: Parameters to be projected into the query.
+        :param timeout: An optional timeout.
+        :return: This method does not return anything.
+        """
+        query = render_query(operation)
+        self._rows, self._position = list(), 0
+
+        match = _LISTEN_PATTERN.match(query)
+        if match is not None:
+            statement, channel = match.groups()
+            channel = _parse_channel(channel)
+            if statement.upper() == "LISTEN":
+                await self.connection.listen(channel)
+            else:
+                await self.connection.unlisten(channel)
+            return
+
+        query, args = translate_query(query, parameters)
+        raw = self.connection.raw
+        try:
+            if parameters is None and count_statements(query) > 1:
+                # Multiple statements cannot be prepared, so they are sent using the simple query protocol.
+                await raw.execute(query, timeout=timeout)
+                records = list()
+            else:
+                records = await raw.fetch(query, *args, timeout=timeout)
+        except asyncpg.IntegrityConstraintViolationError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+        self._rows = [tuple(record) for record in records]
+
+    # noinspection PyUnusedLocal
+    async def executemany(
+        self, operation: Any, parameters_seq: Iterable[Any], timeout: Optional[float] = None, page_size: int = 100
+    ) -> None:
+        """Execute a query once for each of the given parameters.
+
+        The statements are pipelined, so they do not wait for the previous ones to be completed.
+
+        :param operation: Query to be executed.
+        :param parameters_seq: A sequence of parameters to be projected into the query.
+        :param timeout: An optional timeout.
+        :param page_size: Not used, as the statements are not sent in pages.
+        :return: This method does not return anything.
+        """
+        query = render_query(operation)
+        self._rows, self._position = list(), 0
+
+        # The translated query depends on the types of the parameters, so the consecutive ones that lead to the same
+        # query are grouped.
+        groups = list()
+        for parameters in parameters_seq:
+            translated, args = translate_query(query, parameters)
+            if not groups or groups[-1][0] != translated:
+                groups.append((translated, list()))
+            groups[-1][1].append(args)
+
+        try:
+            for translated, args_seq in groups:
+                await self.connection.raw.executemany(translated, args_seq, timeout=timeout)
+        except asyncpg.IntegrityConstraintViolationError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    # noinspection PyUnusedLocal
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        timeout: Optional[float] = None,
+        page_size: int = 1000,
+    ) -> None:
+        """Insert the given rows into a table using ``COPY ... FROM STDIN (FORMAT binary)``.
+
+        :param table: The table name.
+        :param columns: The column names.
+        :param rows: The rows to be inserted, containing one value for each column.
+        :param timeout: An optional timeout.
+        :param page_size: Not used, as the rows are sent in a single stream.
+        :return: This method does not return anything.
+        """
+        self._rows, self._position = list(), 0
+        try:
+            await self.connection.raw.copy_records_to_table(table, records=rows, columns=columns, timeout=timeout)
+        except asyncpg.IntegrityConstraintViolationError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    async def stream(
+        self, operation: Any, parameters: Any = None, fetch_size: int = 1000, timeout: Optional[float] = None
+    ) -> AsyncIterator[tuple]:
+        """Execute a query through a server-side cursor and iterate over its rows.
+
+        :param operation: Query to be executed.
+        :param parameters: Parameters to be projected into the query.
+        :param fetch_size: The number of rows retrieved on each round trip.
+        :param timeout: An optional timeout.
+        :return: An asynchronous iterator of ``tuple`` instances.
+        """
+        query, args = translate_query(render_query(operation), parameters)
+        self._rows, self._position = list(), 0
+
+        raw = self.connection.raw
+        async with raw.transaction():
+            async for record in raw.cursor(query, *args, prefetch=fetch_size, timeout=timeout):
+                yield tuple(record)
+
+    async def fetchone(self) -> Optional[tuple]:
+        """Fetch the next row.
+
+        :return: A ``tuple`` or ``None`` if there are not more rows.
+        """
+        if self._rows is None or self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    async def fetchall(self) -> list[tuple]:
+        """Fetch the remaining rows.
+
+        :return: A list of ``tuple`` instances.
+        """
+        if self._rows is None:
+            return list()
+        position = self._position
+        rows = self._rows[position:]
+        self._position = len(self._rows)
+        return rows
+
+    async def __aiter__(self) -> AsyncIterator[tuple]:
+        while (row := await self.fetchone()) is not None:
+            yield row
+
+
+@lru_cache(maxsize=QUERY_CACHE_MAXSIZE)
+def count_statements(query: str) -> int:
+    """Count the number of statements of a query.
+
+    The semicolons placed into literals, quoted identifiers or comments are not taken into account.
+
+    :param query: The query.
+    :return: An ``int`` value.
+    """
+    query = _LEXICAL_PATTERN.sub(_replace_lexical_match, query)
+    return sum(1 for statement in query.split(";") if statement.strip())
+
+
+def _replace_lexical_match(match: re.Match) -> str:
+    if match.group(0).startswith(("--", "/*")):
+        return " "
+    return "_"
+
+
+def translate_query(query: str, parameters: Any = None) -> tuple[str, list[Any]]:
+    """Translate a query from the ``psycopg2`` format to the ``asyncpg`` one.
+
+    The placeholders of the parameters that ``psycopg2`` sends as typed literals (i.e. ``uuid``, ``bytea`` or
+    ``timestamptz`` values) are casted to the same type, so that the statements are resolved in the same way.
+
+    :param query: The query, containing ``%s`` or ``%(name)s`` placeholders.
+    :param parameters: The parameters to be projected into the query, as a sequence or a mapping.
+    :return: A tuple containing the translated query and the list of arguments.
+    """
+    if parameters is None:
+        return query, list()
+
+    query, parameters = _expand_tuples(query, parameters)
+    keys = _parse_query(query)[1]
+    args = [_adapt_value(parameters[key]) for key in keys]
+    casts = tuple(_get_cast(arg) for arg in args)
+    return _build_query(query, casts), [arg for arg in args if arg is not None]
+
+
+def _expand_tuples(query: str, parameters: Any) -> tuple[str, Any]:
+    if isinstance(parameters, Mapping):
+        if not any(isinstance(value, tuple) for value in parameters.values()):
+            return query, parameters
+        expanded = dict(parameters)
+
+        def _fn(match: re.Match) -> str:
+            name = match.group(1)
+            if name is None or not isinstance(parameters[name], tuple):
+                return match.group(0)
+            names = list()
+            for index, value in enumerate(parameters[name]):
+                expanded[f"{name}__{index}"] = value
+                names.append(f"%({name}__{index})s")
+            return f"({', '.join(names)})"
+
+    else:
+        if not any(isinstance(value, tuple) for value in parameters):
+            return query, parameters
+        expanded = list()
+        values = iter(parameters)
+
+        def _fn(match: re.Match) -> str:
+            if match.group(0) != "%s":
+                return match.group(0)
+            value = next(values)
+            if not isinstance(value, tuple):
+                expanded.append(value)
+                return "%s"
+            expanded.extend(value)
+            return f"({', '.join('%s' for _ in value)})"
+
+    return _PLACEHOLDER_PATTERN.sub(_fn, query), expanded
+
+
+@lru_cache(maxsize=QUERY_CACHE_MAXSIZE)
+def _parse_query(query: str) -> tuple[tuple[str, ...], tuple[Union[int, str], ...], tuple[int, ...]]:
+    chunks, keys, positions = list(), list(), list()
+    indices = dict()
+
+    last, chunk = 0, list()
+    for match in _PLACEHOLDER_PATTERN.finditer(query):
+        start = match.start()
+        chunk.append(query[last:start])
+        last = match.end()
+
+        if match.group(0) == "%%":
+            chunk.append("%")
+            continue
+
+        key = match.group(1)
+        if key is None:
+            key = len(positions)
+        if key not in indices:
+            indices[key] = len(keys)
+            keys.append(key)
+
+        chunks.append("".join(chunk))
+        positions.append(indices[key])
+        chunk = list()
+
+    chunk.append(query[last:])
+    chunks.append("".join(chunk))
+    return tuple(chunks), tuple(keys), tuple(positions)
+
+
+@lru_cache(maxsize=QUERY_CACHE_MAXSIZE)
+def _build_query(query: str, casts: tuple[Optional[str], ...]) -> str:
+    chunks, _, positions = _parse_query(query)
+
+    # The null values are inlined (as ``psycopg2`` does), so the rest of arguments are renumbered.
+    numbers, count = list(), 0
+    for cast in casts:
+        if cast != _NULL:
+            count += 1
+        numbers.append(count)
+
+    parts = [chunks[0]]
+    for position, chunk in zip(positions, chunks[1:]):
+        cast = casts[position]
+        if cast == _NULL:
+            parts.append(_NULL)
+        else:
+            parts.append(f"${numbers[position]}")
+            if cast is not None:
+                parts.append(f"::{cast}")
+        parts.append(chunk)
+    return "".join(parts)
+
+
+def _get_cast(value: Any) -> Optional[str]:
+    if value is None:
+        return _NULL
+    if type(value) is int:
+        return _get_int_cast(value)
+    if isinstance(value, datetime):
+        return "timestamp" if value.tzinfo is None else "timestamptz"
+    return _CASTS.get(type(value))
+
+
+def _get_int_cast(value: int) -> str:
+    if -(2**31) <= value < 2**31:
+        return "integer"
+    if -(2**63) <= value < 2**63:
+        return "bigint"
+    return "numeric"
+
+
+def _adapt_value(value: Any) -> Any:
+    if isinstance(value, Json):
+        return value.dumps(value.adapted)
+    return value
+
+
+def _parse_channel(channel: str) -> str:
+    if channel.startswith('"'):
+        return channel[1:-1].replace('""', '"')
+    return channel.lower()
+
+
+async def _set_type_codecs(raw: asyncpg.Connection) -> None:
+    await raw.set_type_codec(
+        "jsonb", schema="pg_catalog", encoder=_encode_jsonb, decoder=_decode_jsonb, format="binary"
+    )
+    await raw.set_type_codec("json", schema="pg_catalog", encoder=_encode_json, decoder=orjson.loads, format="binary")
+
+
+def _encode_json(value: Any) -> bytes:
+    if isinstance(value, str):
+        return value.encode()
+    return orjson.dumps(value)
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    # The first byte of the binary representation of the ``jsonb`` values is the format version.
+    return b"\x01" + _encode_json(value)
+
+
+def _decode_jsonb(value: bytes) -> Any:
+    return orjson.loads(value[1:])
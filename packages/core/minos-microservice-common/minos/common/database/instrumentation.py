@@ -0,0 +1,256 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+import re
+from collections import (
+    deque,
+)
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from functools import (
+    lru_cache,
+)
+from math import (
+    ceil,
+)
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+)
+
+from .utils import (
+    render_query,
+)
+
+logger = logging.getLogger(__name__)
+
+QUERY_PERCENTILES = (50, 95, 99)
+
+
+class QueryEvent(NamedTuple):
+    """Query Event class.
+
+    Describes an executed statement or, if the ``fingerprint`` is ``None``, a cursor that has been used directly (in
+    which case the ``duration`` is the time the cursor was held).
+    """
+
+    fingerprint: Optional[str]
+    duration: float
+    rows: Optional[int] = None
+    pool_wait_time: float = 0.0
+    lock_wait_time: float = 0.0
+    failed: bool = False
+
+
+QueryHook = Callable[[QueryEvent], None]
+
+
+class QueryTrace:
+    """Query Trace class.
+
+    Collects the measures of a query while it is being performed, that are used to build its ``QueryEvent``.
+    """
+
+    def __init__(self):
+        self.rows = None
+        self.pool_wait_time = 0.0
+        self.lock_wait_time = 0.0
+
+    def build_event(self, operation: Any, duration: float, failed: bool = False) -> QueryEvent:
+        """Build the event that describes the traced query.
+
+        :param operation: The executed operation. If ``None``, the event describes a cursor usage.
+        :param duration: The duration of the query in seconds.
+        :param failed: ``True`` if the query raised an exception or ``False`` otherwise.
+        :return: A ``QueryEvent`` instance.
+        """
+        fingerprint = None
+        if operation is not None:
+            fingerprint = fingerprint_query(operation)
+
+        return QueryEvent(fingerprint, duration, self.rows, self.pool_wait_time, self.lock_wait_time, failed)
+
+
+class QueryInstrumentation:
+    """Query Instrumentation class.
+
+    Notifies the events of the queries performed by the ``PostgreSqlMinosDatabase`` instances to the registered hooks.
+    The events are only built if there is at least one hook, so the instrumentation does not add any overhead
+    otherwise.
+    """
+
+    def __init__(self, hooks: Iterable[QueryHook] = ()):
+        self._hooks = list(hooks)
+
+    @property
+    def hooks(self) -> tuple[QueryHook, ...]:
+        """Get the registered hooks.
+
+        :return: A tuple of callables.
+        """
+        return tuple(self._hooks)
+
+    @property
+    def enabled(self) -> bool:
+        """Check if there is any registered hook.
+
+        :return: ``True`` if there is at least one hook or ``False`` otherwise.
+        """
+        return bool(self._hooks)
+
+    def add_hook(self, hook: QueryHook) -> None:
+        """Register a new hook.
+
+        :param hook: A callable that receives a ``QueryEvent`` instance.
+        :return: This method does not return anything.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: QueryHook) -> None:
+        """Unregister a hook.
+
+        :param hook: The hook to be unregistered.
+        :return: This method does not return anything.
+        """
+        self._hooks.remove(hook)
+
+    def notify(self, event: QueryEvent) -> None:
+        """Notify an event to the registered hooks.
+
+        :param event: The ``QueryEvent`` instance.
+        :return: This method does not return anything.
+        """
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception as exc:
+                logger.warning(f"Raised an exception while notifying a query event to {hook!r}: {exc!r}")
+
+
+QUERY_INSTRUMENTATION = QueryInstrumentation()
+
+
+class QueryMetrics:
+    """Query Metrics class.
+
+    Aggregates the statement events by fingerprint, keeping the durations of the last ``window_size`` executions of
+    each statement to compute its percentiles. The statements that last at least ``slow_query_threshold`` seconds are
+    logged as slow queries.
+    """
+
+    def __init__(self, window_size: int = 1000, slow_query_threshold: Optional[float] = None):
+        self.window_size = window_size
+        self.slow_query_threshold = slow_query_threshold
+        self._statements: dict[str, _StatementMetrics] = dict()
+
+    def __call__(self, event: QueryEvent) -> None:
+        if event.fingerprint is None:
+            return
+
+        metrics = self._statements.get(event.fingerprint)
+        if metrics is None:
+            metrics = self._statements[event.fingerprint] = _StatementMetrics(self.window_size)
+        metrics.observe(event)
+
+        if self.slow_query_threshold is not None and event.duration >= self.slow_query_threshold:
+            logger.warning(
+                f"Slow query ({event.duration:.3f}s, pool wait: {event.pool_wait_time:.3f}s, "
+                f"lock wait: {event.lock_wait_time:.3f}s, rows: {event.rows!r}): {event.fingerprint}"
+            )
+
+    @property
+    def fingerprints(self) -> tuple[str, ...]:
+        """Get the fingerprints of the observed statements.
+
+        :return: A tuple of ``str`` values.
+        """
+        return tuple(self._statements)
+
+    def get_percentiles(self, fingerprint: str) -> dict[int, float]:
+        """Get the duration percentiles of a statement.
+
+        :param fingerprint: The statement fingerprint.
+        :return: A dictionary in which the keys are the percentiles and the values are the durations in seconds.
+        """
+        return self._statements[fingerprint].get_percentiles()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Get the metrics as a dictionary.
+
+        :return: A dictionary in which the keys are the statement fingerprints.
+        """
+        return {fingerprint: metrics.as_dict() for fingerprint, metrics in self._statements.items()}
+
+    def reset(self) -> None:
+        """Discard the observed statements.
+
+        :return: This method does not return anything.
+        """
+        self._statements.clear()
+
+
+class _StatementMetrics:
+    def __init__(self, window_size: int):
+        self.count = 0
+        self.failures = 0
+        self.rows = 0
+        self.duration_sum = 0.0
+        self.pool_wait_time_sum = 0.0
+        self.lock_wait_time_sum = 0.0
+        self.durations = deque(maxlen=window_size)
+
+    def observe(self, event: QueryEvent) -> None:
+        self.count += 1
+        self.failures += event.failed
+        self.rows += event.rows or 0
+        self.duration_sum += event.duration
+        self.pool_wait_time_sum += event.pool_wait_time
+        self.lock_wait_time_sum += event.lock_wait_time
+        self.durations.append(event.duration)
+
+    def get_percentiles(self) -> dict[int, float]:
+        durations = sorted(self.durations)
+        return {p: durations[max(ceil(p / 100 * len(durations)) - 1, 0)] for p in QUERY_PERCENTILES}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "rows": self.rows,
+            "duration_sum": self.duration_sum,
+            "pool_wait_time_sum": self.pool_wait_time_sum,
+            "lock_wait_time_sum": self.lock_wait_time_sum,
+        } | {f"p{p}": value for p, value in self.get_percentiles().items()}
+
+
+def fingerprint_query(operation: Any) -> str:
+    """Get the fingerprint of a query, that is, its normalized text without the literal values.
+
+    :param operation: A ``str``, ``bytes`` or ``Composable`` instance.
+    :return: A ``str`` value.
+    """
+    if isinstance(operation, bytes):
+        operation = operation.decode(errors="replace")
+    else:
+        operation = render_query(operation)
+    return _fingerprint(operation)
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(query: str) -> str:
+    query = _COMMENT_PATTERN.sub(" ", query)
+    query = _LITERAL_PATTERN.sub("?", query)
+    query = _WHITESPACE_PATTERN.sub(" ", query).strip()
+    query = _LIST_PATTERN.sub(r"\1 (?)", query)
+    return query
+
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|%\(\w+\)s|%s|\$\d+|\b\d+(?:\.\d+)?\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_LIST_PATTERN = re.compile(r"\b(IN|VALUES) ?\(\?(?:, ?\?)*\)(?:, ?\(\?(?:, ?\?)*\))*", re.IGNORECASE)
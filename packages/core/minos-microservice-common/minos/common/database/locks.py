@@ -1,46 +1,213 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from asyncio import Lock as AsyncLock
+from asyncio import (
+    sleep,
+)
 from collections.abc import (
+    Awaitable,
+    Callable,
     Hashable,
 )
 from typing import (
-    AsyncContextManager,
+    Any,
     Optional,
 )
 
-from aiopg import (
-    Connection,
-    Cursor,
+from ..exceptions import (
+    MinosLockException,
 )
-
 from ..locks import (
     Lock,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class PostgreSqlLock(Lock):
-    """ "PostgreSql Lock class."""
+    """PostgreSql Lock class.
 
-    cursor: Optional[Cursor]
+    The lock is implemented as an advisory lock held by the session connection of a ``PostgreSqlLockManager``, so it
+    does not occupy any pool connection while the critical section is being executed.
+    """
 
-    def __init__(self, wrapped_connection: AsyncContextManager[Connection], key: Hashable, *args, **kwargs):
+    def __init__(self, manager: PostgreSqlLockManager, key: Hashable, *args, **kwargs):
         super().__init__(key, *args, **kwargs)
+        self.manager = manager
 
-        self.wrapped_connection = wrapped_connection
-        self.cursor = None
+    async def __aenter__(self) -> PostgreSqlLock:
+        await self.manager.acquire(self.hashed_key)
+        return self
 
-        self._args = args
-        self._kwargs = kwargs
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.manager.release(self.hashed_key)
 
-    async def __aenter__(self):
-        connection = await self.wrapped_connection.__aenter__()
-        cursor = await connection.cursor(*self._args, **self._kwargs).__aenter__()
 
-        self.cursor = cursor
-        await self.cursor.execute("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
-        return self
+class PostgreSqlLockManager:
+    """PostgreSql Lock Manager class.
+
+    Multiplexes all the advisory locks of the process over a single session connection. The waiters for the same key
+    are coalesced in memory, so the server-side lock is taken only once and it is handed over between local holders
+    without additional round trips. As the session connection is shared, the locks are taken with
+    ``pg_try_advisory_lock`` and retried with an exponential backoff, instead of blocking the connection.
+
+    The local handovers are faster than going through the server, but they would starve the other sessions waiting
+    for the same key, so after ``max_handovers`` consecutive handovers the lock is released on the server and the
+    next local holder must take it again. The sessions blocked on ``pg_advisory_lock`` get it as soon as it is
+    released, but the ones that poll it (as other managers do) only get it if they retry in between, so greater values
+    improve the throughput of the local holders at the expense of the latency of the rest of sessions.
+
+    If the session connection is closed, the locks held by it are released by the server. In that case, the holders
+    get a ``MinosLockException`` on release, and the next holders take the locks again on the server. The session
+    connection is reopened on demand, and if it cannot be opened after ``max_connection_attempts`` attempts, the
+    pending acquire or release raises a ``MinosLockException`` instead of waiting for the database indefinitely.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Optional[Any]]],
+        disconnect: Callable[[Any], Awaitable[None]],
+        retry_delay: float = 0.01,
+        max_retry_delay: float = 0.5,
+        max_handovers: int = 8,
+        max_connection_attempts: int = 3,
+    ):
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_handovers = max_handovers
+        self.max_connection_attempts = max_connection_attempts
+
+        self._connect = connect
+        self._disconnect = disconnect
+        self._connection = None
+        self._connection_lock = AsyncLock()
+        self._entries: dict[int, _LockEntry] = dict()
+
+    async def acquire(self, key: int) -> None:
+        """Acquire the lock identified by the given key.
+
+        :param key: The hashed key of the lock.
+        :return: This method does not return anything.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _LockEntry()
+        entry.count += 1
+
+        try:
+            await entry.lock.acquire()
+        except BaseException:
+            self._discard(key, entry)
+            raise
+
+        try:
+            if not entry.held or self._disconnected:
+                await self._lock(key)
+                entry.held = True
+        except BaseException:
+            entry.lock.release()
+            self._discard(key, entry)
+            raise
+
+    async def release(self, key: int) -> None:
+        """Release the lock identified by the given key.
+
+        If there are local waiters for the same key, the server-side lock is handed over to the next one (up to
+        ``max_handovers`` consecutive times).
+
+        :param key: The hashed key of the lock.
+        :return: This method does not return anything.
+        """
+        entry = self._entries[key]
+        lost = not entry.held or self._disconnected
+        try:
+            if lost:
+                entry.held = False
+                self._discard(key, entry)
+            elif self._discard(key, entry) or entry.handovers >= self.max_handovers:
+                entry.held = False
+                await self._unlock(key)
+            else:
+                entry.handovers += 1
+        finally:
+            if not entry.held:
+                entry.handovers = 0
+            entry.lock.release()
+
+        if lost:
+            raise MinosLockException(f"The {key!r} lock was released by the server, as its session was closed.")
+
+    async def close(self) -> None:
+        """Close the session connection, waiting for the locks to be released.
+
+        :return: This method does not return anything.
+        """
+        if len(self._entries):
+            logger.info("Waiting for locks releasing...")
+            while len(self._entries):
+                await sleep(0.1)
+
+        async with self._connection_lock:
+            if self._connection is not None:
+                await self._disconnect(self._connection)
+                self._connection = None
+
+    def _discard(self, key: int, entry: _LockEntry) -> bool:
+        entry.count -= 1
+        if entry.count > 0:
+            return False
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+        return True
+
+    async def _lock(self, key: int) -> None:
+        delay = self.retry_delay
+        while not await self._submit("SELECT pg_try_advisory_lock(%s);", key):
+            await sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    async def _unlock(self, key: int) -> None:
+        await self._submit("SELECT pg_advisory_unlock(%s);", key)
+
+    async def _submit(self, operation: str, key: int) -> bool:
+        async with self._connection_lock:
+            connection = await self._get_connection()
+            async with connection.cursor() as cursor:
+                await cursor.execute(operation, (key,))
+                (result,) = await cursor.fetchone()
+        return result
+
+    @property
+    def _disconnected(self) -> bool:
+        return self._connection is None or self._connection.closed
+
+    async def _get_connection(self) -> Any:
+        if not self._disconnected:
+            return self._connection
+
+        if self._connection is not None:
+            logger.warning("The lock session connection was closed, so the locks held by it were released.")
+            for entry in self._entries.values():
+                entry.held = False
+
+        self._connection = None
+        for _ in range(self.max_connection_attempts):
+            connection = await self._connect()
+            if connection is not None:
+                self._connection = connection
+                return connection
+
+        raise MinosLockException(
+            f"The lock session connection could not be opened after {self.max_connection_attempts} attempts."
+        )
+
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.cursor.execute("select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
-        if not self.cursor.closed:
-            self.cursor.close()
-        self.cursor = None
-        await self.wrapped_connection.__aexit__(exc_type, exc_val, exc_tb)
+class _LockEntry:
+    def __init__(self):
+        self.lock = AsyncLock()
+        self.count = 0
+        self.held = False
+        self.handovers = 0
@@ -0,0 +1,73 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from typing import (
+    Any,
+)
+
+
+class PostgreSqlMigration:
+    """PostgreSql Migration class.
+
+    Represents the versioned schema of a component, as a sequence of steps in which each one contains the operations
+    needed to upgrade the schema from the previous version. The version of the schema is the number of steps, so the new
+    changes must be appended as new steps instead of modifying the existing ones. As the first step can be applied over
+    schemas created before the versioning was available, its operations must be idempotent.
+    """
+
+    def __init__(self, name: str, steps: Iterable[Sequence[Any]]):
+        self.name = name
+        self.steps = tuple(tuple(step) for step in steps)
+
+    @property
+    def version(self) -> int:
+        """Get the version of the schema.
+
+        :return: An integer value.
+        """
+        return len(self.steps)
+
+    def get_pending_steps(self, version: int) -> tuple[Sequence[Any], ...]:
+        """Get the steps that must be applied to upgrade the schema from the given version.
+
+        :param version: The current version of the schema.
+        :return: A tuple of steps.
+        """
+        return self.steps[version:]
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, type(self)) and self.name == other.name and self.steps == other.steps
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.version))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, version={self.version!r})"
+
+
+SCHEMA_VERSION_TABLE_NAME = "minos_schema_version"
+
+_SCHEMA_VERSION_TABLE_EXISTS_QUERY = f"SELECT to_regclass('{SCHEMA_VERSION_TABLE_NAME}') IS NOT NULL;"
+
+_CREATE_SCHEMA_VERSION_TABLE_QUERY = f"""
+CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE_NAME} (
+    name TEXT PRIMARY KEY,
+    version INT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+""".strip()
+
+_SELECT_SCHEMA_VERSIONS_QUERY = f"SELECT name, version FROM {SCHEMA_VERSION_TABLE_NAME} WHERE name IN %s;"
+
+_UPSERT_SCHEMA_VERSION_QUERY = f"""
+INSERT INTO {SCHEMA_VERSION_TABLE_NAME} (name, version)
+VALUES (%s, %s)
+ON CONFLICT (name)
+DO
+   UPDATE SET version = EXCLUDED.version, updated_at = NOW();
+""".strip()
@@ -1,11 +1,24 @@
+from __future__ import (
+    annotations,
+)
+
 import logging
 from asyncio import (
     sleep,
+    wait_for,
 )
 from collections.abc import (
     Hashable,
+    Iterable,
+)
+from itertools import (
+    count,
+)
+from time import (
+    monotonic,
 )
 from typing import (
+    Any,
     Optional,
 )
 
@@ -23,27 +36,176 @@ from psycopg2 import (
 from ..pools import (
     MinosPool,
 )
+from .aiopg import (
+    AiopgCursor,
+)
 from .locks import (
     PostgreSqlLock,
+    PostgreSqlLockManager,
+)
+from .migrations import (
+    PostgreSqlMigration,
 )
 
 logger = logging.getLogger(__name__)
 
+REPLICA_BALANCING_STRATEGIES = ("round-robin", "least-connections")
+
 
 class PostgreSqlPool(MinosPool[ContextManager]):
-    """Postgres Pool class."""
+    """Postgres Pool class.
+
+    Optionally, the pool can be set up with a set of read replicas, that are used by ``select_replica`` to route the
+    read-only queries. The replicas are balanced with ``round-robin`` or ``least-connections`` strategies, and the
+    ones that are not reachable or whose replication lag is greater than ``max_replication_lag`` seconds are skipped.
+    The lag of each replica is probed with a timeout of ``replica_check_timeout`` seconds and cached for
+    ``replica_check_interval`` seconds, but the replicas that fail the probe are considered down for
+    ``replica_down_backoff`` seconds, so an unreachable replica does not delay the read-only queries on every check.
+
+    The schema migrations that have been checked through the pool are stored in ``checked_migrations``, so that the
+    databases sharing it do not check them again.
+    """
+
+    replica_check_interval: float = 1.0
+    replica_check_timeout: float = 0.1
+    replica_down_backoff: float = 30.0
 
-    def __init__(self, host: str, port: int, database: str, user: str, password: str, *args, **kwargs):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: str,
+        password: str,
+        *args,
+        replicas: Iterable[dict[str, Any]] = (),
+        replica_balancing: str = "round-robin",
+        max_replication_lag: Optional[float] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        if replica_balancing not in REPLICA_BALANCING_STRATEGIES:
+            raise ValueError(
+                f"The replica balancing must be one of {REPLICA_BALANCING_STRATEGIES!r}. "
+                f"Obtained: {replica_balancing!r}"
+            )
+
         self.host = host
         self.port = port
         self.database = database
         self.user = user
         self.password = password
+        self.replicas = tuple(replicas)
+        self.replica_balancing = replica_balancing
+        self.max_replication_lag = max_replication_lag
+
+        self.lock_manager = PostgreSqlLockManager(self._create_instance, self._destroy_instance)
+        self.checked_migrations: set[PostgreSqlMigration] = set()
+
+        self._replica_pools = None
+        self._replica_counter = count()
+        self._replication_lag = None
 
     @classmethod
     def _from_config(cls, *args, config, **kwargs):
-        return cls(*args, **config.repository._asdict(), **kwargs)
+        return cls(*args, **(config.repository._asdict() | kwargs))
+
+    async def _destroy(self) -> None:
+        await super()._destroy()
+        await self.lock_manager.close()
+        self.checked_migrations.clear()
+
+        if self._replica_pools is not None:
+            for replica_pool in self._replica_pools:
+                await replica_pool.destroy()
+            self._replica_pools = None
+
+    @property
+    def replica_pools(self) -> list[PostgreSqlPool]:
+        """Get the pools of the read replicas.
+
+        :return: A list of ``PostgreSqlPool`` instances.
+        """
+        if self._replica_pools is None:
+            self._replica_pools = [self._build_replica_pool(**replica) for replica in self.replicas]
+        return self._replica_pools
+
+    def _build_replica_pool(self, **kwargs) -> PostgreSqlPool:
+        return PostgreSqlPool(**self._get_replica_kwargs(**kwargs))
+
+    def _get_replica_kwargs(self, host: str, port: Optional[int] = None, **kwargs) -> dict[str, Any]:
+        return {
+            "host": host,
+            "port": self.port if port is None else int(port),
+            "database": self.database,
+            "user": self.user,
+            "password": self.password,
+        } | kwargs
+
+    async def select_replica(self) -> PostgreSqlPool:
+        """Select the pool to be used by a read-only query.
+
+        :return: The pool of one of the available replicas, or the pool itself if there are not any available replica.
+        """
+        replica_pools = self.replica_pools
+        if not replica_pools:
+            return self
+
+        if self.replica_balancing == "least-connections":
+            candidates = sorted(replica_pools, key=lambda replica_pool: replica_pool.metrics.in_use)
+        else:
+            start = next(self._replica_counter) % len(replica_pools)
+            candidates = replica_pools[start:] + replica_pools[:start]
+
+        for replica_pool in candidates:
+            lag = await replica_pool.get_replication_lag()
+            if lag is None:
+                continue
+            if self.max_replication_lag is not None and lag > self.max_replication_lag:
+                continue
+            return replica_pool
+
+        return self
+
+    async def get_replication_lag(self) -> Optional[float]:
+        """Get the replication lag of the database.
+
+        The value is cached for ``replica_check_interval`` seconds, or for ``replica_down_backoff`` seconds if the
+        database is not reachable within ``replica_check_timeout`` seconds.
+
+        :return: The lag in seconds (``0`` if the database is not a replica) or ``None`` if it is not reachable.
+        """
+        if self._replication_lag is not None:
+            checked_at, lag = self._replication_lag
+            expiration = self.replica_check_interval if lag is not None else self.replica_down_backoff
+            if monotonic() - checked_at < expiration:
+                return lag
+
+        try:
+            lag = await wait_for(self._fetch_replication_lag(), self.replica_check_timeout)
+        except Exception as exc:
+            logger.warning(f"There was an {exc!r} while trying to get the replication lag of {self.host!r}.")
+            lag = None
+
+        self._replication_lag = (monotonic(), lag)
+        return lag
+
+    async def _fetch_replication_lag(self) -> float:
+        async with self.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(_SELECT_REPLICATION_LAG_QUERY)
+                (lag,) = await cursor.fetchone()
+        return lag
+
+    async def open_cursor(self, connection: Connection, *args, **kwargs) -> AiopgCursor:
+        """Open a new cursor on a connection acquired from the pool.
+
+        :param connection: The connection.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: An ``AiopgCursor`` instance.
+        """
+        return AiopgCursor(await connection.cursor(*args, **kwargs))
 
     async def _create_instance(self) -> Optional[Connection]:
         try:
@@ -52,7 +214,7 @@ class PostgreSqlPool(MinosPool[ContextManager]):
             )
         except OperationalError as exc:
             logger.warning(f"There was an {exc!r} while trying to get a database connection.")
-            await sleep(1)
+            await sleep(self._get_creation_retry_delay())
             return None
 
         logger.info(f"Created {self.database!r} database connection identified by {id(connection)}!")
@@ -85,4 +247,14 @@ class PostgreSqlLockPool(PostgreSqlPool):
         :param key: The key to be used for locking.
         :return: A ``PostgreSqlLock`` instance.
         """
-        return PostgreSqlLock(super().acquire(), key, *args, **kwargs)
+        return PostgreSqlLock(self.lock_manager, key, *args, **kwargs)
+
+
+_SELECT_REPLICATION_LAG_QUERY = """
+SELECT (
+    CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+)::float8;
+""".strip()
@@ -0,0 +1,67 @@
+from collections.abc import (
+    Iterable,
+)
+from itertools import (
+    islice,
+)
+from typing import (
+    Any,
+    Iterator,
+    Union,
+)
+
+from psycopg2.extensions import (
+    adapt,
+)
+from psycopg2.sql import (
+    SQL,
+    Composable,
+    Composed,
+    Identifier,
+    Literal,
+    Placeholder,
+)
+
+
+def render_query(operation: Union[str, Composable]) -> str:
+    """Render a ``psycopg2`` query as a string without the need of a connection.
+
+    :param operation: A ``str`` or a ``Composable`` instance.
+    :return: A ``str`` instance.
+    """
+    if isinstance(operation, str):
+        return operation
+
+    if isinstance(operation, Composed):
+        return "".join(render_query(part) for part in operation.seq)
+
+    if isinstance(operation, SQL):
+        return operation.string
+
+    if isinstance(operation, Identifier):
+        return ".".join('"{}"'.format(string.replace('"', '""')) for string in operation.strings)
+
+    if isinstance(operation, Literal):
+        value = operation.wrapped
+        if isinstance(value, str):
+            return "'{}'".format(value.replace("'", "''"))
+        return adapt(value).getquoted().decode()
+
+    if isinstance(operation, Placeholder):
+        if operation.name is None:
+            return "%s"
+        return f"%({operation.name})s"
+
+    raise TypeError(f"The given operation is not supported. Obtained: {operation!r}")
+
+
+def paginate(values: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split the given values into pages of the given size, so that each page can be sent on a single round trip.
+
+    :param values: The values to be split. It can be any iterable, including generators, as it is consumed lazily.
+    :param size: The maximum number of values on each page.
+    :return: An iterator of non-empty lists.
+    """
+    iterator = iter(values)
+    while page := list(islice(iterator, size)):
+        yield page
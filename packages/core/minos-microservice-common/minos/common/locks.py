@@ -4,6 +4,9 @@ from collections.abc import (
 from contextlib import (
     AbstractAsyncContextManager,
 )
+from hashlib import (
+    blake2b,
+)
 
 from cached_property import (
     cached_property,
@@ -25,8 +28,19 @@ class Lock(AbstractAsyncContextManager):
     def hashed_key(self) -> int:
         """Get the hashed key.
 
-        :return: An integer value.
+        The value is derived from the key bytes instead of the builtin ``hash`` (that is salted for ``str`` values), so
+        it is the same across processes.
+
+        :return: An integer value, within the signed 64 bits range if the key is not an integer.
         """
-        if not isinstance(self.key, int):
-            return hash(self.key)
-        return self.key
+        if isinstance(self.key, int):
+            return self.key
+
+        if isinstance(self.key, bytes):
+            raw = self.key
+        elif isinstance(self.key, str):
+            raw = self.key.encode()
+        else:
+            raw = repr(self.key).encode()
+
+        return int.from_bytes(blake2b(raw, digest_size=8).digest(), "big", signed=True)
@@ -1,7 +1,17 @@
 from .abc import (
     Model,
 )
+from .codecs import (
+    MODEL_CODECS,
+    AvroModelCodec,
+    JsonModelCodec,
+    ModelCodec,
+)
+from .contextvars import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+)
 from .declarative import (
+    CompactDeclarativeModel,
     DeclarativeModel,
     MinosModel,
 )
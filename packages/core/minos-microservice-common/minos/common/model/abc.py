@@ -14,6 +14,7 @@ from collections.abc import (
     Mapping,
 )
 from typing import (
+    TYPE_CHECKING,
     Any,
     Iterable,
     Iterator,
@@ -38,6 +39,9 @@ from ..meta import (
 from ..protocol import (
     MinosAvroProtocol,
 )
+from .contextvars import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+)
 from .fields import (
     Field,
 )
@@ -55,6 +59,14 @@ from .types import (
     MissingSentinel,
     ModelType,
 )
+from .types.caches import (
+    identity_lru_cache,
+)
+
+if TYPE_CHECKING:
+    from ..protocol import (
+        AvroSchemaRegistry,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -113,36 +125,80 @@ class Model(Mapping):
 
     # noinspection PyUnusedLocal
     @classmethod
-    def from_avro_bytes(cls: Type[T], raw: bytes, batch_mode: bool = False, **kwargs) -> Union[T, list[T]]:
+    def from_avro_bytes(
+        cls: Type[T],
+        raw: Union[bytes, bytearray, memoryview],
+        batch_mode: bool = False,
+        trusted: bool = False,
+        **kwargs,
+    ) -> Union[T, list[T]]:
         """Build a single instance or a sequence of instances from bytes
 
-        :param raw: A ``bytes`` representation of the model.
+        :param raw: A ``bytes`` (or any other bytes-like object) representation of the model.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+        single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
+        :param kwargs: Additional named arguments.
+        :return: A single instance or a sequence of instances.
+        """
+        schema, data = MinosAvroProtocol.decode_with_schema(raw, batch_mode=batch_mode)
+
+        if batch_mode:
+            return [cls.from_avro(schema, entry, trusted=trusted) for entry in data]
+
+        return cls.from_avro(schema, data, trusted=trusted)
+
+    # noinspection PyUnusedLocal
+    @classmethod
+    async def from_avro_bytes_with_registry(
+        cls: Type[T],
+        raw: Union[bytes, bytearray, memoryview],
+        registry: AvroSchemaRegistry,
+        batch_mode: bool = False,
+        trusted: bool = False,
+        **kwargs,
+    ) -> Union[T, list[T]]:
+        """Build a single instance or a sequence of instances from bytes encoded with the schema registry wire format.
+
+        :param raw: A ``bytes`` (or any other bytes-like object) representation of the model.
+        :param registry: The schema registry from which the schema is obtained.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
         single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
         :param kwargs: Additional named arguments.
         :return: A single instance or a sequence of instances.
         """
-        schema = MinosAvroProtocol.decode_schema(raw)
-        data = MinosAvroProtocol.decode(raw, batch_mode=batch_mode)
+        schema = await MinosAvroProtocol.decode_schema_with_registry(raw, registry)
+        data = await MinosAvroProtocol.decode_with_registry(raw, registry, batch_mode=batch_mode)
 
         if batch_mode:
-            return [cls.from_avro(schema, entry) for entry in data]
+            return [cls.from_avro(schema, entry, trusted=trusted) for entry in data]
 
-        return cls.from_avro(schema, data)
+        return cls.from_avro(schema, data, trusted=trusted)
 
     @classmethod
-    def from_avro(cls: Type[T], schema: Any, data: Any) -> T:
+    def from_avro(cls: Type[T], schema: Any, data: Any, trusted: bool = False) -> T:
         """Build a new instance from the ``avro`` schema and data.
 
         :param schema: The avro schema of the model.
         :param data: The avro data of the model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded. This mode must
+            only be used with data that comes from a trusted source, like the own repositories or the broker.
         :return: A new ``DynamicModel`` instance.
         """
         schema_decoder = AvroSchemaDecoder()
         type_ = schema_decoder.build(schema)
 
         data_decoder = AvroDataDecoder()
-        instance = data_decoder.build(data, type_)
+
+        if not trusted:
+            return data_decoder.build(data, type_)
+
+        token = IS_TRUSTED_MODEL_CONTEXT_VAR.set(True)
+        try:
+            instance = data_decoder.build(data, type_)
+        finally:
+            IS_TRUSTED_MODEL_CONTEXT_VAR.reset(token)
 
         return instance
 
@@ -162,19 +218,28 @@ class Model(Mapping):
         :param models: A sequence of minos models.
         :return: A bytes object.
         """
-        if len(models) == 0:
-            raise EmptyMinosModelSequenceException("'models' parameter cannot be empty.")
-
-        model_type = type(models[0])
-        if not all(model_type == type(model) for model in models):
-            raise MultiTypeMinosModelSequenceException(
-                f"Every model must have type {model_type} to be valid. Found types: {[type(model) for model in models]}"
-            )
+        _check_models(models)
 
         avro_schema = models[0].avro_schema
         # noinspection PyTypeChecker
         return MinosAvroProtocol.encode([model.avro_data for model in models], avro_schema, batch_mode=True)
 
+    @classmethod
+    async def to_avro_bytes_with_registry(cls: Type[T], models: list[T], registry: AvroSchemaRegistry) -> bytes:
+        """Create a ``bytes`` representation of the given object instances with the schema registry wire format.
+
+        :param models: A sequence of minos models.
+        :param registry: The schema registry on which the schema is registered.
+        :return: A bytes object.
+        """
+        _check_models(models)
+
+        avro_schema = models[0].avro_schema
+        # noinspection PyTypeChecker
+        return await MinosAvroProtocol.encode_with_registry(
+            [model.avro_data for model in models], avro_schema, registry, batch_mode=True
+        )
+
     # noinspection PyMethodParameters
     @property_or_classproperty
     def model_type(self_or_cls) -> ModelType:
@@ -223,6 +288,9 @@ class Model(Mapping):
         """Fields getter"""
         return self._fields
 
+    def _field_items(self) -> Iterable[tuple[str, Any]]:
+        return ((name, field.value) for name, field in self._fields.items())
+
     def __setitem__(self, key: str, value: Any) -> None:
         try:
             setattr(self, key, value)
@@ -254,11 +322,14 @@ class Model(Mapping):
     def avro_schema(self_or_cls) -> list[dict[str, Any]]:
         """Compute the avro schema of the model.
 
+        The schema is computed in deterministic mode, so it is cached by model class (or by model type when it is
+        called from an instance). The returned value is shared, so it must not be modified.
+
         :return: A dictionary object.
         """
-        # noinspection PyTypeChecker
-        encoder = AvroSchemaEncoder()
-        return encoder.build(self_or_cls)
+        if isinstance(self_or_cls, type):
+            return _build_avro_schema(self_or_cls)
+        return [_build_avro_schema(self_or_cls.model_type)]
 
     @property
     def avro_data(self) -> dict[str, Any]:
@@ -287,6 +358,18 @@ class Model(Mapping):
         # noinspection PyTypeChecker
         return MinosAvroProtocol.encode(self.avro_data, self.avro_schema)
 
+    async def avro_bytes_with_registry(self, registry: AvroSchemaRegistry) -> bytes:
+        """Generate bytes representation of the current instance with the schema registry wire format.
+
+        Instead of the whole schema, the encoded value only contains its fingerprint, so the schema is registered on
+        the given registry to be able to decode the value later (see ``Model.from_avro_bytes_with_registry``).
+
+        :param registry: The schema registry on which the schema is registered.
+        :return: A bytes object.
+        """
+        # noinspection PyTypeChecker
+        return await MinosAvroProtocol.encode_with_registry(self.avro_data, self.avro_schema, registry)
+
     # noinspection PyUnusedLocal
     @staticmethod
     def encode_schema(encoder: SchemaEncoder, target: Any, **kwargs) -> Any:
@@ -304,6 +387,10 @@ class Model(Mapping):
     def decode_schema(decoder: SchemaDecoder, target: Any, **kwargs) -> Any:
         """Decode schema with the given encoder.
 
+        The ``AvroSchemaDecoder`` caches the types decoded from each schema, so this hook is only called the first time
+        a given schema is decoded (unless additional named arguments are given). Hence, the result must only depend on
+        the given schema.
+
         :param decoder: The decoder instance.
         :param target: The schema to be decoded.
         :param kwargs: Additional named arguments.
@@ -350,7 +437,7 @@ class Model(Mapping):
         return False
 
     def __hash__(self) -> int:
-        return hash(tuple(self.fields.values()))
+        return hash(tuple(self._field_items()))
 
     def __iter__(self) -> Iterable[str]:
         yield from self.fields.keys()
@@ -364,3 +451,35 @@ class Model(Mapping):
 
 
 T = TypeVar("T", bound=Model)
+
+AVRO_SCHEMA_CACHE_MAXSIZE = 1024
+
+
+def _check_models(models: list[Model]) -> None:
+    if len(models) == 0:
+        raise EmptyMinosModelSequenceException("'models' parameter cannot be empty.")
+
+    model_type = type(models[0])
+    if not all(model_type == type(model) for model in models):
+        raise MultiTypeMinosModelSequenceException(
+            f"Every model must have type {model_type} to be valid. Found types: {[type(model) for model in models]}"
+        )
+
+
+def _build_avro_schema(type_: Union[Type[Model], ModelType]) -> Any:
+    try:
+        hash(type_)
+    except TypeError:
+        # The type contains unhashable type hints, so it cannot be cached.
+        return _encode_avro_schema(type_)
+    return _encode_avro_schema_cached(type_)
+
+
+def _encode_avro_schema(type_: Union[Type[Model], ModelType]) -> Any:
+    encoder = AvroSchemaEncoder(deterministic=True)
+    return encoder.build(type_)
+
+
+# The model types have loose equality semantics (i.e. ``Union[int, str]`` equals ``Union[str, int]``), so the schemas
+# are cached by identity. The ``ModelType`` instances are interned, so structurally identical types share the entry.
+_encode_avro_schema_cached = identity_lru_cache(maxsize=AVRO_SCHEMA_CACHE_MAXSIZE)(_encode_avro_schema)
@@ -0,0 +1,501 @@
+from __future__ import (
+    annotations,
+)
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Any,
+    ClassVar,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import orjson
+
+from ..exceptions import (
+    EmptyMinosModelSequenceException,
+    MinosImportException,
+    MinosModelException,
+    MultiTypeMinosModelSequenceException,
+)
+from ..importlib import (
+    import_module,
+)
+from .abc import (
+    Model,
+)
+from .contextvars import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+)
+from .declarative import (
+    DeclarativeModel,
+)
+from .serializers import (
+    AvroDataDecoder,
+    AvroDataEncoder,
+    AvroSchemaDecoder,
+    AvroSchemaEncoder,
+)
+from .types import (
+    ModelType,
+    TypeHintBuilder,
+)
+from .types.caches import (
+    TypeHintKey,
+)
+
+T = TypeVar("T", bound=Model)
+
+JSON_MAGIC_BYTE = b"\x01"
+JSON_TYPE_TABLE_LENGTH_SIZE = 4
+JSON_TYPE_TABLE_CACHE_MAXSIZE = 1024
+
+
+class ModelCodec(ABC):
+    """Base class for the binary representations of models.
+
+    Every encoded value is self-describing, so the codec that must be used to decode it can be detected from its first
+    bytes (see ``ModelCodec.detect``). The ``avro`` and ``json`` codecs are provided, but additional codecs can be used
+    once they are registered into ``MODEL_CODECS`` with ``ModelCodec.register``, so that the values encoded with them
+    are detected later.
+    """
+
+    name: ClassVar[str]
+
+    @classmethod
+    def get(cls, codec: Union[str, ModelCodec, Type[ModelCodec]]) -> ModelCodec:
+        """Get a codec instance.
+
+        :param codec: The name of a registered codec (i.e. ``avro`` or ``json``), the classname of a registered codec, a
+            registered codec class or an instance of it.
+        :return: A ``ModelCodec`` instance.
+        """
+        if isinstance(codec, ModelCodec):
+            cls._check_registered(type(codec))
+            return codec
+
+        if isinstance(codec, str):
+            codec = MODEL_CODECS.get(codec) or import_module(codec)
+
+        if not isinstance(codec, type) or not issubclass(codec, ModelCodec):
+            raise MinosModelException(f"The given value is not a codec. Obtained: {codec!r}")
+
+        cls._check_registered(codec)
+        return codec()
+
+    @staticmethod
+    def _check_registered(codec_cls: Type[ModelCodec]) -> None:
+        if MODEL_CODECS.get(codec_cls.name) is not codec_cls:
+            raise MinosModelException(
+                f"The {codec_cls!r} codec is not registered, so the values encoded with it could not be detected. "
+                f"It must be registered with 'ModelCodec.register' before being used."
+            )
+
+    @staticmethod
+    def register(codec_cls: Type[ModelCodec]) -> None:
+        """Register a codec class into ``MODEL_CODECS``, so that the values encoded with it can be detected.
+
+        :param codec_cls: The codec class to be registered.
+        :return: This method does not return anything.
+        """
+        registered = MODEL_CODECS.setdefault(codec_cls.name, codec_cls)
+        if registered is not codec_cls:
+            raise MinosModelException(
+                f"The {codec_cls.name!r} codec name is already registered by another class. Obtained: {registered!r}"
+            )
+
+    @classmethod
+    def detect(cls, raw: Union[bytes, bytearray, memoryview]) -> ModelCodec:
+        """Detect the codec that was used to encode the given bytes.
+
+        :param raw: A bytes-like object.
+        :return: A ``ModelCodec`` instance. If no codec matches, the ``avro`` one is returned.
+        """
+        for codec_cls in MODEL_CODECS.values():
+            if codec_cls is not AvroModelCodec and codec_cls.matches(raw):
+                return codec_cls()
+        return AvroModelCodec()
+
+    @staticmethod
+    @abstractmethod
+    def matches(raw: Union[bytes, bytearray, memoryview]) -> bool:
+        """Check if the given bytes were encoded with this codec.
+
+        :param raw: A bytes-like object.
+        :return: ``True`` if the bytes were encoded with this codec or ``False`` otherwise.
+        """
+
+    def encode(self, value: Union[Model, list[Model]]) -> bytes:
+        """Encode a model, or a sequence of models of the same type, into bytes.
+
+        :param value: A model instance or a list of model instances.
+        :return: A ``bytes`` instance.
+        """
+        if isinstance(value, Model):
+            return self._encode_one(value)
+
+        if len(value) == 0:
+            raise EmptyMinosModelSequenceException("'models' parameter cannot be empty.")
+
+        model_type = type(value[0])
+        if not all(model_type == type(model) for model in value):
+            raise MultiTypeMinosModelSequenceException(
+                f"Every model must have type {model_type} to be valid. Found types: {[type(model) for model in value]}"
+            )
+
+        return self._encode_many(value)
+
+    @abstractmethod
+    def _encode_one(self, model: Model) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _encode_many(self, models: list[Model]) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(
+        self,
+        raw: Union[bytes, bytearray, memoryview],
+        model_cls: Type[T] = Model,
+        batch_mode: bool = False,
+        trusted: bool = False,
+    ) -> Union[T, list[T]]:
+        """Decode a model, or a sequence of models, from bytes.
+
+        :param raw: A bytes-like object.
+        :param model_cls: The model class used to build the instances.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
+        :return: A single instance or a sequence of instances.
+        """
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class AvroModelCodec(ModelCodec):
+    """Avro Model Codec class.
+
+    This is the default codec, so it supports schema evolution and is compatible with the schema registries.
+    """
+
+    name = "avro"
+
+    @staticmethod
+    def matches(raw: Union[bytes, bytearray, memoryview]) -> bool:
+        """Check if the given bytes were encoded with this codec.
+
+        :param raw: A bytes-like object.
+        :return: ``True`` if the bytes were encoded with this codec or ``False`` otherwise.
+        """
+        return not any(codec_cls.matches(raw) for codec_cls in MODEL_CODECS.values() if codec_cls is not AvroModelCodec)
+
+    def _encode_one(self, model: Model) -> bytes:
+        return model.avro_bytes
+
+    def _encode_many(self, models: list[Model]) -> bytes:
+        return Model.to_avro_bytes(models)
+
+    def decode(
+        self,
+        raw: Union[bytes, bytearray, memoryview],
+        model_cls: Type[T] = Model,
+        batch_mode: bool = False,
+        trusted: bool = False,
+    ) -> Union[T, list[T]]:
+        """Decode a model, or a sequence of models, from bytes.
+
+        :param raw: A bytes-like object.
+        :param model_cls: The model class used to build the instances.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
+        :return: A single instance or a sequence of instances.
+        """
+        return model_cls.from_avro_bytes(raw, batch_mode=batch_mode, trusted=trusted)
+
+
+class JsonModelCodec(ModelCodec):
+    """Json Model Codec class.
+
+    The encoded value starts with a magic byte, followed by the length of the type table, the type table itself and
+    the ``avro`` data, both of them as ``json``. The type table identifies the model class by its classname, and it only
+    describes (as ``avro`` schemas) the fields that cannot be decoded from the type hints of the class, so the types of
+    the static models are not computed for each value. It is cheaper to produce and parse than the ``avro`` format, but
+    it does not support schema evolution nor ``bytes`` fields, so it is intended for internal traffic.
+    """
+
+    name = "json"
+
+    @staticmethod
+    def matches(raw: Union[bytes, bytearray, memoryview]) -> bool:
+        """Check if the given bytes were encoded with this codec.
+
+        :param raw: A bytes-like object.
+        :return: ``True`` if the bytes were encoded with this codec or ``False`` otherwise.
+        """
+        return bytes(memoryview(raw)[0:1]) == JSON_MAGIC_BYTE
+
+    def _encode_one(self, model: Model) -> bytes:
+        return self._encode(_build_type_table(model), model)
+
+    def _encode_many(self, models: list[Model]) -> bytes:
+        return self._encode(_build_type_table(models[0]), models)
+
+    @staticmethod
+    def _encode(type_table: Any, data: Union[Model, list[Model]]) -> bytes:
+        type_table = orjson.dumps(type_table)
+        return b"".join(
+            (
+                JSON_MAGIC_BYTE,
+                len(type_table).to_bytes(JSON_TYPE_TABLE_LENGTH_SIZE, "big"),
+                type_table,
+                AvroDataEncoder().build_json(data),
+            )
+        )
+
+    def decode(
+        self,
+        raw: Union[bytes, bytearray, memoryview],
+        model_cls: Type[T] = Model,
+        batch_mode: bool = False,
+        trusted: bool = False,
+    ) -> Union[T, list[T]]:
+        """Decode a model, or a sequence of models, from bytes.
+
+        :param raw: A bytes-like object.
+        :param model_cls: The model class used to build the instances.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
+        :return: A single instance or a sequence of instances.
+        """
+        raw = memoryview(raw).cast("B")
+        if not self.matches(raw):
+            raise MinosModelException(f"The given value was not encoded with the {self.name!r} codec.")
+
+        offset = len(JSON_MAGIC_BYTE)
+        start = offset + JSON_TYPE_TABLE_LENGTH_SIZE
+        end = start + int.from_bytes(raw[offset:start], "big")
+
+        type_ = self._build_type(bytes(raw[start:end]))
+        data = orjson.loads(raw[end:])
+
+        if not trusted:
+            return self._build_data(data, type_, batch_mode)
+
+        token = IS_TRUSTED_MODEL_CONTEXT_VAR.set(True)
+        try:
+            return self._build_data(data, type_, batch_mode)
+        finally:
+            IS_TRUSTED_MODEL_CONTEXT_VAR.reset(token)
+
+    @staticmethod
+    def _build_data(data: Any, type_: type, batch_mode: bool) -> Union[Model, list[Model]]:
+        data_decoder = AvroDataDecoder()
+
+        if batch_mode:
+            return [data_decoder.build(entry, type_) for entry in data]
+
+        return data_decoder.build(data, type_)
+
+    @staticmethod
+    @lru_cache(maxsize=JSON_TYPE_TABLE_CACHE_MAXSIZE)
+    def _build_type(type_table: bytes) -> type:
+        type_table = orjson.loads(type_table)
+
+        if isinstance(type_table, dict):
+            return AvroSchemaDecoder().build(type_table["schema"])
+
+        if isinstance(type_table, str):
+            return _import_model_cls(type_table)
+
+        classname, fields = type_table
+
+        type_hints = dict()
+        if (model_cls := _import_model_cls(classname)) is not None:
+            type_hints |= model_cls.type_hints
+
+        schema_decoder = AvroSchemaDecoder()
+        type_hints |= {name: schema_decoder.build(schema) for name, schema in fields.items()}
+
+        namespace, _, name = classname.rpartition(".")
+        return ModelType.build(name, type_hints, namespace_=namespace)
+
+
+def _build_type_table(model: Model) -> Any:
+    """Build the type table of the given model.
+
+    The type table is the classname if the model can be decoded only from the type hints of its class, a pair of the
+    classname and the ``avro`` schemas of the fields that cannot be decoded that way, or the ``avro`` schema of the
+    whole model if its class overrides the serialization hooks.
+    """
+    model_cls = type(model)
+    if _has_serialization_hooks(model_cls):
+        return {"schema": model.avro_schema}
+
+    static_fields = _get_static_fields(model_cls) or dict()
+
+    fields = dict()
+    for name, field in model.fields.items():
+        if name in static_fields and _conforms(field.value, static_fields[name]):
+            continue
+        fields[name] = _build_field_schema(_JsonTypeHintBuilder(field.value, field.type).build())
+
+    if not fields:
+        return model.classname
+
+    return [model.classname, fields]
+
+
+class _JsonTypeHintBuilder(TypeHintBuilder):
+    """Type Hint Builder that keeps the classes of the static models, so that their types are not computed again."""
+
+    def _build(self, value, type_: Optional[type]) -> type:
+        if isinstance(value, Model):
+            model_cls = type(value)
+            if _get_static_fields(model_cls) is not None and _conforms(value, frozenset((model_cls,))):
+                return model_cls
+
+        return super()._build(value, type_)
+
+
+def _build_field_schema(type_hint: type) -> Any:
+    try:
+        key = TypeHintKey(type_hint)
+    except TypeError:
+        # The type hint contains unhashable values, so it cannot be cached.
+        return _encode_field_schema(type_hint)
+    return _encode_field_schema_cached(key)
+
+
+def _encode_field_schema(type_hint: type) -> Any:
+    return AvroSchemaEncoder(deterministic=True).build(type_hint)
+
+
+@lru_cache(maxsize=JSON_TYPE_TABLE_CACHE_MAXSIZE)
+def _encode_field_schema_cached(key: TypeHintKey) -> Any:
+    return _encode_field_schema(key.type_)
+
+
+JSON_SERIALIZATION_HOOK_NAMES = ("encode_schema", "decode_schema", "encode_data", "decode_data")
+
+
+@lru_cache(maxsize=JSON_TYPE_TABLE_CACHE_MAXSIZE)
+def _has_serialization_hooks(model_cls: Type[Model]) -> bool:
+    return any(getattr(model_cls, name) != getattr(Model, name) for name in JSON_SERIALIZATION_HOOK_NAMES)
+
+
+@lru_cache(maxsize=JSON_TYPE_TABLE_CACHE_MAXSIZE)
+def _import_model_cls(classname: str) -> Optional[Type[Model]]:
+    try:
+        model_cls = import_module(classname)
+    except MinosImportException:
+        return None
+
+    if not isinstance(model_cls, type) or not issubclass(model_cls, Model):
+        return None
+
+    return model_cls
+
+
+@lru_cache(maxsize=JSON_TYPE_TABLE_CACHE_MAXSIZE)
+def _get_static_fields(model_cls: Type[Model]) -> Optional[dict[str, frozenset[Type[Model]]]]:
+    """Get the fields of the given class if all of them can be decoded only from their type hint.
+
+    :return: A mapping from the field names to the model classes that their values can contain, or ``None`` if the
+        class is not static.
+    """
+    if not _is_static_model_cls(model_cls, set()):
+        return None
+
+    return {name: frozenset(_iter_model_classes(type_hint)) for name, type_hint in model_cls.type_hints.items()}
+
+
+def _is_static_model_cls(model_cls: type, visited: set[type]) -> bool:
+    if model_cls in visited:
+        return True
+    visited.add(model_cls)
+
+    if not issubclass(model_cls, DeclarativeModel) or _has_serialization_hooks(model_cls):
+        return False
+
+    if _import_model_cls(model_cls.classname) is not model_cls:
+        return False
+
+    return all(_is_static_type_hint(type_hint, visited) for type_hint in model_cls.type_hints.values())
+
+
+def _is_static_type_hint(type_hint: Any, visited: set[type]) -> bool:
+    if isinstance(type_hint, (TypeVar, ModelType)) or type_hint is Any:
+        return False
+
+    if (origin := get_origin(type_hint)) is not None:
+        if isinstance(origin, type) and issubclass(origin, Model):
+            return False
+        return all(_is_static_type_hint(arg, visited) for arg in get_args(type_hint))
+
+    if not isinstance(type_hint, type):
+        return False
+
+    if issubclass(type_hint, Model):
+        return _is_static_model_cls(type_hint, visited)
+
+    return not issubclass(type_hint, (list, tuple, set, dict))
+
+
+def _iter_model_classes(type_hint: Any) -> Iterator[Type[Model]]:
+    if isinstance(type_hint, type) and issubclass(type_hint, Model):
+        yield type_hint
+    for arg in get_args(type_hint):
+        yield from _iter_model_classes(arg)
+
+
+def _conforms(value: Any, model_classes: frozenset[Type[Model]]) -> bool:
+    """Check if the models contained in the given value are instances of exactly one of the given classes.
+
+    The values are already validated by their type hints, so only the subclasses of the hinted classes can lead to a
+    different type.
+    """
+    if not model_classes:
+        return True
+
+    if isinstance(value, Model):
+        model_cls = type(value)
+        if model_cls not in model_classes:
+            return False
+        static_fields = _get_static_fields(model_cls)
+        return all(_conforms(getattr(value, name), classes) for name, classes in static_fields.items())
+
+    if isinstance(value, (list, tuple, set)):
+        return all(_conforms(item, model_classes) for item in value)
+
+    if isinstance(value, dict):
+        return all(_conforms(item, model_classes) for item in value.values())
+
+    return True
+
+
+MODEL_CODECS: dict[str, Type[ModelCodec]] = {
+    AvroModelCodec.name: AvroModelCodec,
+    JsonModelCodec.name: JsonModelCodec,
+}
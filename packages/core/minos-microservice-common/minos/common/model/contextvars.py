@@ -0,0 +1,8 @@
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    Final,
+)
+
+IS_TRUSTED_MODEL_CONTEXT_VAR: Final[ContextVar[bool]] = ContextVar("is_trusted_model", default=False)
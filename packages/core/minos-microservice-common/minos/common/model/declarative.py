@@ -3,11 +3,15 @@ from __future__ import (
 )
 
 import logging
+from functools import (
+    lru_cache,
+)
 from itertools import (
     zip_longest,
 )
 from typing import (
     Any,
+    Iterable,
     Iterator,
     Optional,
     Type,
@@ -21,11 +25,19 @@ from ..meta import (
 from .abc import (
     Model,
 )
+from .fields import (
+    Field,
+)
 from .types import (
     MissingSentinel,
     ModelType,
+    TypeHintBuilder,
     TypeHintComparator,
 )
+from .types.caches import (
+    TypeHintKey,
+    identity_lru_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,40 +66,300 @@ class DeclarativeModel(Model):
         return cls(*args, **kwargs)
 
     def _build_fields(self, *args, additional_type_hints: Optional[dict[str, type]] = None, **kwargs) -> None:
-        for (name, type_val), value in zip_longest(
-            self._type_hints(additional_type_hints), args, fillvalue=MissingSentinel
-        ):
-            if name in kwargs and value is not MissingSentinel:
-                raise TypeError(f"got multiple values for argument {repr(name)}")
-
-            if value is MissingSentinel and name in kwargs:
-                value = kwargs[name]
+        for name, type_val, value in _iter_field_values(self._type_hints(additional_type_hints), args, kwargs):
+            self._fields[name] = self._build_field(name, type_val, value)
 
-            self._fields[name] = self._field_cls(
-                name, type_val, value, getattr(self, f"parse_{name}", None), getattr(self, f"validate_{name}", None)
-            )
+    def _build_field(self, name: str, type_val: type, value: Any) -> Field:
+        parser_name, validator_name = _get_field_hook_names(type(self), name)
+        return self._field_cls(
+            name,
+            type_val,
+            value,
+            getattr(self, parser_name) if parser_name is not None else None,
+            getattr(self, validator_name) if validator_name is not None else None,
+        )
 
     # noinspection PyMethodParameters
     @self_or_classmethod
     def _type_hints(self_or_cls, additional_type_hints: Optional[dict[str, type]] = None) -> Iterator[tuple[str, Any]]:
-        type_hints = dict()
         if isinstance(self_or_cls, type):
             cls = self_or_cls
         else:
             cls = type(self_or_cls)
-        for b in cls.__mro__[::-1]:
-            list_fields = {k: v for k, v in get_type_hints(b).items() if not k.startswith("_")}
-            type_hints |= list_fields
-        logger.debug(f"The obtained type hints are: {type_hints!r}")
 
-        if additional_type_hints:
-            for name, hint in additional_type_hints.items():
-                if name not in type_hints or TypeHintComparator(hint, type_hints[name]).match():
-                    type_hints[name] = hint
+        type_hints = _get_type_hints(cls, additional_type_hints)
+
+        if instance_type_hints := dict(super()._type_hints()):
+            type_hints = type_hints | instance_type_hints
 
-        type_hints |= super()._type_hints()
         yield from type_hints.items()
 
 
+class CompactDeclarativeModel(DeclarativeModel):
+    """Base class for ``minos`` declarative model entities with a compact storage of the field values.
+
+    The values are stored in a flat list, and the names and types of the fields are stored in a table shared by all the
+    instances with the same type hints, so no ``Field`` instances are kept. The ``fields`` are built on demand as views
+    over the stored values, so reading or writing them does not change the storage.
+    """
+
+    _field_table: Optional[FieldTable] = None
+    _values: Optional[list[Any]] = None
+
+    def _build_fields(self, *args, additional_type_hints: Optional[dict[str, type]] = None, **kwargs) -> None:
+        type_hints = _get_type_hints(type(self), additional_type_hints)
+
+        values = list()
+        self._field_table = _get_field_table(type_hints)
+        self._values = values
+
+        for name, type_val, value in _iter_field_values(type_hints.items(), args, kwargs):
+            values.append(self._build_field_value(name, type_val, value))
+
+    def _build_field_value(self, name: str, type_val: type, value: Any) -> Any:
+        parser_name, validator_name = _get_field_hook_names(type(self), name)
+        # noinspection PyProtectedMember
+        return self._field_cls._build_value(
+            name,
+            type_val,
+            value,
+            getattr(self, parser_name) if parser_name is not None else None,
+            getattr(self, validator_name) if validator_name is not None else None,
+        )
+
+    @property
+    def _fields(self) -> dict[str, Field]:
+        if self._values is None:
+            return dict()
+        return {name: _CompactFieldView(self, index) for index, name in enumerate(self._field_table.names)}
+
+    @_fields.setter
+    def _fields(self, fields: dict[str, Field]) -> None:
+        type_hints = {name: field.type for name, field in fields.items()}
+
+        table = self._field_table
+        if not type_hints:
+            table = _EMPTY_FIELD_TABLE
+        elif (
+            table is None
+            or table.names != tuple(type_hints.keys())
+            or any(a is not b for a, b in zip(table.types, type_hints.values()))
+        ):
+            table = FieldTable(type_hints)
+
+        self._values = [field.value for field in fields.values()]
+        self._field_table = table
+
+    # noinspection PyMethodParameters
+    @self_or_classmethod
+    def _type_hints(self_or_cls, additional_type_hints: Optional[dict[str, type]] = None) -> Iterator[tuple[str, Any]]:
+        if isinstance(self_or_cls, type) or self_or_cls._values is None:
+            yield from super()._type_hints(additional_type_hints)
+            return
+
+        table = self_or_cls._field_table
+        type_hints = _get_type_hints(type(self_or_cls), additional_type_hints)
+        type_hints = type_hints | {
+            name: TypeHintBuilder(value, type_val).build()
+            for name, type_val, value in zip(table.names, table.types, self_or_cls._values)
+        }
+        yield from type_hints.items()
+
+    def _field_items(self) -> Iterable[tuple[str, Any]]:
+        if self._values is None:
+            return super()._field_items()
+        return zip(self._field_table.names, self._values)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key.startswith("_") or self._values is None:
+            super().__setattr__(key, value)
+            return
+
+        try:
+            index = self._field_table.indexes[key]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} does not contain the {key!r} field")
+
+        self._values[index] = self._build_field_value(key, self._field_table.types[index], value)
+
+    def __getattr__(self, item: str) -> Any:
+        if self._values is None:
+            return super().__getattr__(item)
+
+        try:
+            return self._values[self._field_table.indexes[item]]
+        except (KeyError, IndexError):
+            raise AttributeError(f"{type(self).__name__!r} does not contain the {item!r} field.")
+
+    def __eq__(self, other: Any) -> bool:
+        if (
+            type(self) is type(other)
+            and self._values is not None
+            and other._values is not None
+            and self._field_table is other._field_table
+        ):
+            return self._values == other._values
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    def __iter__(self) -> Iterable[str]:
+        if self._values is None:
+            yield from super().__iter__()
+            return
+        yield from self._field_table.names
+
+    def __len__(self) -> int:
+        if self._values is None:
+            return super().__len__()
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        if self._values is None:
+            return super().__repr__()
+        fields_repr = ", ".join(f"{name}={value!r}" for name, value in self._field_items())
+        return f"{type(self).__name__}({fields_repr})"
+
+
 T = TypeVar("T", bound=DeclarativeModel)
 MinosModel = DeclarativeModel
+
+
+class _CompactFieldView(Field):
+    """Field of a ``CompactDeclarativeModel`` whose value is read from and written to the model storage."""
+
+    __slots__ = "_model", "_index"
+
+    # noinspection PyMissingConstructor
+    def __init__(self, model: CompactDeclarativeModel, index: int):
+        name = model._field_table.names[index]
+        parser_name, validator_name = _get_field_hook_names(type(model), name)
+
+        self._name = name
+        self._type = model._field_table.types[index]
+        self._parser = getattr(model, parser_name) if parser_name is not None else None
+        self._validator = getattr(model, validator_name) if validator_name is not None else None
+
+        self._model = model
+        self._index = index
+
+    @property
+    def value(self) -> Any:
+        """Value getter."""
+        return self._model._values[self._index]
+
+    @value.setter
+    def value(self, data: Any) -> None:
+        """Set the value on the model, so it is checked in the same way as the attribute assignments.
+
+        :param data: new value.
+        :return: This method does not return anything.
+        """
+        setattr(self._model, self._name, data)
+
+    def __eq__(self, other: Field) -> bool:
+        return isinstance(other, Field) and self._equal_content(other)
+
+    __hash__ = Field.__hash__
+
+
+class FieldTable:
+    """Names, types and positions of the fields of a ``CompactDeclarativeModel``, shared between instances."""
+
+    __slots__ = "names", "types", "indexes"
+
+    def __init__(self, type_hints: dict[str, type]):
+        self.names = tuple(type_hints.keys())
+        self.types = tuple(type_hints.values())
+        self.indexes = {name: index for index, name in enumerate(self.names)}
+
+
+_EMPTY_FIELD_TABLE = FieldTable(dict())
+
+FIELD_TABLE_CACHE_MAXSIZE = 1024
+
+
+@identity_lru_cache(maxsize=FIELD_TABLE_CACHE_MAXSIZE)
+def _get_field_table(type_hints: dict[str, type]) -> FieldTable:
+    return FieldTable(type_hints)
+
+
+def _iter_field_values(
+    type_hints: Iterable[tuple[str, type]], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Iterator[tuple[str, type, Any]]:
+    for (name, type_val), value in zip_longest(type_hints, args, fillvalue=MissingSentinel):
+        if name in kwargs and value is not MissingSentinel:
+            raise TypeError(f"got multiple values for argument {repr(name)}")
+
+        if value is MissingSentinel and name in kwargs:
+            value = kwargs[name]
+
+        yield name, type_val, value
+
+
+TYPE_HINTS_CACHE_MAXSIZE = 1024
+
+
+def _get_type_hints(cls: type, additional_type_hints: Optional[dict[str, type]]) -> dict[str, type]:
+    if not additional_type_hints:
+        return _get_class_type_hints(cls)
+
+    # The decoders pass the same type hints instance for every model they build, so it is looked up by identity first,
+    # checking that it has not been modified since it was cached.
+    items, type_hints = _get_type_hints_by_identity(cls, additional_type_hints)
+    if len(items) == len(additional_type_hints) and all(
+        additional_type_hints.get(name, MissingSentinel) is hint for name, hint in items
+    ):
+        return type_hints
+
+    return _get_type_hints_by_key(cls, additional_type_hints)
+
+
+@identity_lru_cache(maxsize=TYPE_HINTS_CACHE_MAXSIZE)
+def _get_type_hints_by_identity(
+    cls: type, additional_type_hints: dict[str, type]
+) -> tuple[tuple[tuple[str, type], ...], dict[str, type]]:
+    return tuple(additional_type_hints.items()), _get_type_hints_by_key(cls, additional_type_hints)
+
+
+def _get_type_hints_by_key(cls: type, additional_type_hints: dict[str, type]) -> dict[str, type]:
+    try:
+        keys = tuple((name, TypeHintKey(hint)) for name, hint in additional_type_hints.items())
+    except TypeError:
+        # The additional type hints are not hashable, so they cannot be cached.
+        return _merge_type_hints(cls, tuple(additional_type_hints.items()))
+    return _merge_type_hints_cached(cls, keys)
+
+
+@lru_cache(maxsize=TYPE_HINTS_CACHE_MAXSIZE)
+def _get_class_type_hints(cls: type) -> dict[str, type]:
+    type_hints = dict()
+    for b in cls.__mro__[::-1]:
+        list_fields = {k: v for k, v in get_type_hints(b).items() if not k.startswith("_")}
+        type_hints |= list_fields
+    logger.debug(f"The obtained type hints are: {type_hints!r}")
+    return type_hints
+
+
+def _merge_type_hints(cls: type, additional_type_hints: tuple[tuple[str, type], ...]) -> dict[str, type]:
+    type_hints = dict(_get_class_type_hints(cls))
+    for name, hint in additional_type_hints:
+        if name not in type_hints or TypeHintComparator(hint, type_hints[name]).match():
+            type_hints[name] = hint
+    return type_hints
+
+
+@lru_cache(maxsize=TYPE_HINTS_CACHE_MAXSIZE)
+def _merge_type_hints_cached(cls: type, additional_type_hints: tuple[tuple[str, TypeHintKey], ...]) -> dict[str, type]:
+    return _merge_type_hints(cls, tuple((name, key.type_) for name, key in additional_type_hints))
+
+
+@lru_cache(maxsize=TYPE_HINTS_CACHE_MAXSIZE)
+def _get_field_hook_names(cls: type, name: str) -> tuple[Optional[str], Optional[str]]:
+    parser_name = f"parse_{name}"
+    validator_name = f"validate_{name}"
+    return (
+        parser_name if hasattr(cls, parser_name) else None,
+        validator_name if hasattr(cls, validator_name) else None,
+    )
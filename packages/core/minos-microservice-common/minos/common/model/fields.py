@@ -21,6 +21,9 @@ from ..exceptions import (
     MinosReqAttributeException,
     MinosTypeAttributeException,
 )
+from .contextvars import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+)
 from .serializers import (
     AvroDataDecoder,
     AvroDataEncoder,
@@ -107,30 +110,45 @@ class Field:
     def value(self, data: Any) -> None:
         """Check if the given value is correct and stores it if ``True``, otherwise raises an exception.
 
+        If the ``IS_TRUSTED_MODEL_CONTEXT_VAR`` is set, the given value is considered as already decoded, so it is
+        stored without being parsed, decoded or validated again.
+
         :param data: new value.
         :return: This method does not return anything.
         """
-        logger.debug(f"Setting {data!r} value to {self._name!r} field with {self._type!r} type...")
+        logger.debug("Setting %r value to %r field with %r type...", data, self._name, self._type)
+        self._value = self._build_value(self._name, self._type, data, self._parser, self._validator)
+
+    @staticmethod
+    def _build_value(
+        name: str,
+        type_: type,
+        data: Any,
+        parser: Optional[Callable[[Any], Any]] = None,
+        validator: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        if data is not MissingSentinel and IS_TRUSTED_MODEL_CONTEXT_VAR.get():
+            return data
 
-        if self._parser is not None:
+        if parser is not None:
             try:
-                data = self.parser(data)
+                data = parser(data)
             except Exception as exc:
-                raise MinosParseAttributeException(self.name, data, exc)
+                raise MinosParseAttributeException(name, data, exc)
 
         try:
-            value = AvroDataDecoder(self.type).build(data)
+            value = AvroDataDecoder(type_).build(data)
         except DataDecoderMalformedTypeException as exc:
-            raise MinosMalformedAttributeException(f"{self.name!r} field is malformed. {exc}")
+            raise MinosMalformedAttributeException(f"{name!r} field is malformed. {exc}")
         except DataDecoderRequiredValueException as exc:
-            raise MinosReqAttributeException(f"{self.name!r} field is required. {exc}")
+            raise MinosReqAttributeException(f"{name!r} field is required. {exc}")
         except DataDecoderTypeException:
-            raise MinosTypeAttributeException(self.name, self.type, data)
+            raise MinosTypeAttributeException(name, type_, data)
 
-        if self.validator is not None and value is not None and not self.validator(value):
-            raise MinosAttributeValidationException(self.name, value)
+        if validator is not None and value is not None and not validator(value):
+            raise MinosAttributeValidationException(name, value)
 
-        self._value = value
+        return value
 
     @property
     def avro_schema(self) -> dict[str, Any]:
@@ -162,9 +180,11 @@ class Field:
         return cls(schema["name"], type_val, value)
 
     def __eq__(self, other: Field) -> bool:
+        return type(self) == type(other) and self._equal_content(other)
+
+    def _equal_content(self, other: Field) -> bool:
         return (
-            type(self) == type(other)
-            and self.name == other.name
+            self.name == other.name
             and self.value == other.value
             and self._parser_function == other._parser_function
             and self._validator_function == other._validator_function
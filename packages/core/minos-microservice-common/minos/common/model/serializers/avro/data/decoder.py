@@ -17,12 +17,16 @@ from datetime import (
     timedelta,
     timezone,
 )
+from functools import (
+    lru_cache,
+)
 from itertools import (
     zip_longest,
 )
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Optional,
     Type,
     TypeVar,
@@ -48,6 +52,9 @@ from ....types import (
     is_type_subclass,
     unpack_typevar,
 )
+from ....types.caches import (
+    TypeHintKey,
+)
 from ...abc import (
     DataDecoder,
 )
@@ -59,6 +66,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+COMPILED_DECODER_CACHE_MAXSIZE = 1024
+
+CompiledDecoder = Callable[..., Any]
+
 
 class AvroDataDecoder(DataDecoder):
     """Avro Data Decoder class."""
@@ -78,81 +89,152 @@ class AvroDataDecoder(DataDecoder):
         return self._build(type_, data, **kwargs)
 
     def _build(self, type_: type, data: Any, **kwargs) -> Any:
+        return self._compile(type_)(self, data, **kwargs)
+
+    @classmethod
+    def _compile(cls, type_: type) -> CompiledDecoder:
+        """Get the compiled decoder for the given type.
+
+        Compiled decoders are cached by type, so that the type inspection is only performed the first time a type is
+        decoded. Unhashable types are compiled on each call.
+
+        :param type_: The type to be decoded.
+        :return: A function that receives the decoder instance, the data and additional named arguments.
+        """
+        try:
+            key = TypeHintKey(type_)
+        except TypeError:
+            return cls._compile_uncached(type_)
+        return cls._compile_cached(key)
+
+    @classmethod
+    @lru_cache(maxsize=COMPILED_DECODER_CACHE_MAXSIZE)
+    def _compile_cached(cls, key: TypeHintKey) -> CompiledDecoder:
+        return cls._compile_uncached(key.type_)
+
+    @classmethod
+    def _compile_uncached(cls, type_: type) -> CompiledDecoder:
         origin = get_origin(type_)
         if origin is not Union:
-            return self._build_single(type_, data, **kwargs)
-        return self._build_union(type_, data, **kwargs)
+            return cls._compile_single(type_)
+        return cls._compile_union(type_)
 
-    def _build_union(self, type_: type, data: Any, **kwargs) -> Any:
-        alternatives = get_args(type_)
-        for alternative_type in alternatives:
-            with suppress(Exception):
-                return self._build_single(alternative_type, data, **kwargs)
+    @classmethod
+    def _compile_union(cls, type_: type) -> CompiledDecoder:
+        alternatives = tuple(cls._compile_single(alternative_type) for alternative_type in get_args(type_))
+        accepts_none = NoneType in get_args(type_)
+
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            if data is None and accepts_none:
+                return None
+
+            for alternative in alternatives:
+                with suppress(Exception):
+                    return alternative(decoder, data, **kwargs)
 
-        if type_ is not NoneType:
             if data is None:
                 raise DataDecoderRequiredValueException(f"Value is {None!r}.")
 
             if data is MissingSentinel:
                 raise DataDecoderRequiredValueException("Value is missing.")
 
-        raise DataDecoderTypeException(type_, data)
+            raise DataDecoderTypeException(type_, data)
+
+        return _decode
 
-    def _build_single(self, type_: type, data: Any, **kwargs) -> Any:
+    @classmethod
+    def _compile_single(cls, type_: type) -> CompiledDecoder:
         if type_ is Any:
-            type_ = TypeHintBuilder(data).build()
+            return cls._compile_any()
+
         if isinstance(type_, TypeVar):
-            unpacked_type = unpack_typevar(type_)
-            return self._build(unpacked_type, data, **kwargs)
+            return cls._compile(unpack_typevar(type_))
 
         if type_ is NoneType:
-            return self._build_none(type_, data, **kwargs)
+            build_none = cls._build_none
+
+            def _decode_none(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+                return build_none(type_, data, **kwargs)
+
+            return _decode_none
+
+        return cls._compile_required(cls._compile_value(type_))
 
-        if data is None:
-            raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+    @classmethod
+    def _compile_any(cls) -> CompiledDecoder:
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            return cls._compile(TypeHintBuilder(data).build())(decoder, data, **kwargs)
 
-        if data is MissingSentinel:
-            raise DataDecoderRequiredValueException("Value is missing.")
+        return _decode
 
+    @staticmethod
+    def _compile_required(fn: CompiledDecoder) -> CompiledDecoder:
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            if data is None:
+                raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+
+            if data is MissingSentinel:
+                raise DataDecoderRequiredValueException("Value is missing.")
+
+            return fn(decoder, data, **kwargs)
+
+        return _decode
+
+    @classmethod
+    def _compile_value(cls, type_: type) -> CompiledDecoder:
         if is_model_subclass(type_):
             # noinspection PyTypeChecker
-            return self._build_model(type_, data, **kwargs)
+            return cls._compile_model(type_)
 
         if is_type_subclass(type_):
             if issubclass(type_, bool):
-                return self._build_bool(data, **kwargs)
+                return cls._compile_leaf(cls._build_bool)
 
             if issubclass(type_, int):
-                return self._build_int(type_, data, **kwargs)
+                return cls._compile_leaf(cls._build_int, type_)
 
             if issubclass(type_, float):
-                return self._build_float(data, **kwargs)
+                return cls._compile_leaf(cls._build_float)
 
             if issubclass(type_, str):
-                return self._build_string(type_, data, **kwargs)
+                return cls._compile_leaf(cls._build_string, type_)
 
             if issubclass(type_, bytes):
-                return self._build_bytes(data, **kwargs)
+                return cls._compile_leaf(cls._build_bytes)
 
             if issubclass(type_, datetime):
-                return self._build_datetime(data, **kwargs)
+                return cls._compile_leaf(cls._build_datetime)
 
             if issubclass(type_, timedelta):
-                return self._build_timedelta(data, **kwargs)
+                return cls._compile_leaf(cls._build_timedelta)
 
             if issubclass(type_, date):
-                return self._build_date(data, **kwargs)
+                return cls._compile_leaf(cls._build_date)
 
             if issubclass(type_, time):
-                return self._build_time(data, **kwargs)
+                return cls._compile_leaf(cls._build_time)
 
             if issubclass(type_, UUID):
-                return self._build_uuid(data, **kwargs)
+                return cls._compile_leaf(cls._build_uuid)
 
             if isinstance(type_, ModelType):
-                return self._build_model_type(type_, data, **kwargs)
+                return cls._compile_model_type(type_)
+
+        return cls._compile_collection(type_)
+
+    @staticmethod
+    def _compile_leaf(fn: Callable, *args) -> CompiledDecoder:
+        if args:
 
-        return self._build_collection(type_, data, **kwargs)
+            def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+                return fn(*args, data, **kwargs)
+
+        else:
+
+            def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+                return fn(data, **kwargs)
+
+        return _decode
 
     @staticmethod
     def _build_none(type_: type, data: Any, **kwargs) -> Any:
@@ -241,71 +323,106 @@ class AvroDataDecoder(DataDecoder):
                 pass
         raise DataDecoderTypeException(UUID, data)
 
-    def _build_model(self, type_: Type[Model], data: Any, **kwargs) -> Any:
-        if is_type_subclass(type_) and isinstance(data, type_):
-            return data
-        return self._build_model_type(ModelType.from_model(type_), data, **kwargs)
+    @classmethod
+    def _compile_model(cls, type_: Type[Model]) -> CompiledDecoder:
+        decode_model_type = cls._compile_model_type(ModelType.from_model(type_))
+
+        if not is_type_subclass(type_):
+            return decode_model_type
 
-    def _build_model_type(self, type_: ModelType, data: Any, **kwargs) -> Any:
-        if hasattr(data, "model_type"):
-            if ModelType.from_model(data) >= type_:
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            if isinstance(data, type_):
                 return data
+            return decode_model_type(decoder, data, **kwargs)
+
+        return _decode
 
-        if (ans := type_.model_cls.decode_data(self, data, type_, **kwargs)) is not MissingSentinel:
-            return ans
+    @classmethod
+    def _compile_model_type(cls, type_: ModelType) -> CompiledDecoder:
+        model_cls = type_.model_cls
+        type_hints = type_.type_hints
+        # Field decoders are compiled lazily to support self-referencing models.
+        fields: Optional[dict[str, CompiledDecoder]] = None
+
+        def _get_fields() -> dict[str, CompiledDecoder]:
+            nonlocal fields
+            if fields is None:
+                fields = {n: cls._compile(t) for n, t in type_hints.items()}
+            return fields
+
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            if hasattr(data, "model_type"):
+                if ModelType.from_model(data) >= type_:
+                    return data
+
+            if (ans := model_cls.decode_data(decoder, data, type_, **kwargs)) is not MissingSentinel:
+                return ans
+
+            if isinstance(data, dict):
+                with suppress(Exception):
+                    decoded_data = {n: fn(decoder, data.get(n, None), **kwargs) for n, fn in _get_fields().items()}
+                    return model_cls.from_model_type(type_, **decoded_data, additional_type_hints=type_hints)
 
-        if isinstance(data, dict):
             with suppress(Exception):
-                decoded_data = {n: self._build(t, data.get(n, None), **kwargs) for n, t in type_.type_hints.items()}
-                return type_(**decoded_data, additional_type_hints=type_.type_hints)
+                decoded_data = (fn(decoder, d, **kwargs) for d, fn in zip_longest((data,), _get_fields().values()))
+                return model_cls.from_model_type(type_, *decoded_data, additional_type_hints=type_hints)
 
-        with suppress(Exception):
-            decoded_data = (self._build(t, d, **kwargs) for d, t in zip_longest((data,), type_.type_hints.values()))
-            return type_(*decoded_data, additional_type_hints=type_.type_hints)
+            raise DataDecoderTypeException(type_, data)
 
-        raise DataDecoderTypeException(type_, data)
+        return _decode
 
-    def _build_collection(self, type_: type, data: Any, **kwargs) -> Any:
+    @classmethod
+    def _compile_collection(cls, type_: type) -> CompiledDecoder:
         origin_type = get_origin(type_)
         if origin_type is None:
-            raise DataDecoderMalformedTypeException(f"Type is malformed. Obtained: '{type_}'.")
+
+            def _decode_malformed(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+                raise DataDecoderMalformedTypeException(f"Type is malformed. Obtained: '{type_}'.")
+
+            return _decode_malformed
 
         if origin_type is list:
-            return self._build_list(data, type_, **kwargs)
+            return cls._compile_iterable(list, get_args(type_)[0])
 
         if origin_type is set:
-            return self._build_set(data, type_, **kwargs)
+            return cls._compile_iterable(set, get_args(type_)[0])
 
         if origin_type is dict:
-            return self._build_dict(data, type_, **kwargs)
+            return cls._compile_dict(type_)
 
-        raise DataDecoderTypeException(type_, data)
+        def _decode_unknown(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            raise DataDecoderTypeException(type_, data)
+
+        return _decode_unknown
 
-    def _build_list(self, data: Any, type_values: Any, **kwargs) -> list[Any]:
-        type_values = get_args(type_values)[0]
-        if isinstance(data, str) or not isinstance(data, Iterable):
-            raise DataDecoderTypeException(list, data)
+    @classmethod
+    def _compile_iterable(cls, collection_type: type, type_values: type) -> CompiledDecoder:
+        decode_value = cls._compile(type_values)
 
-        return list(self._build_iterable(data, type_values, **kwargs))
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> Any:
+            if isinstance(data, str) or not isinstance(data, Iterable):
+                raise DataDecoderTypeException(collection_type, data)
 
-    def _build_set(self, data: Any, type_values: Any, **kwargs) -> set[Any]:
-        type_values = get_args(type_values)[0]
-        if isinstance(data, str) or not isinstance(data, Iterable):
-            raise DataDecoderTypeException(set, data)
+            return collection_type(decode_value(decoder, item, **kwargs) for item in data)
 
-        return set(self._build_iterable(data, type_values, **kwargs))
+        return _decode
 
-    def _build_dict(self, data: dict, type_: type, **kwargs) -> dict[str, Any]:
+    @classmethod
+    def _compile_dict(cls, type_: type) -> CompiledDecoder:
         type_keys, type_values = get_args(type_)
-        if not isinstance(data, Mapping):
-            raise DataDecoderTypeException(dict, data)
+        decode_key = cls._compile(type_keys)
+        decode_value = cls._compile(type_values)
+
+        def _decode(decoder: AvroDataDecoder, data: Any, **kwargs) -> dict[str, Any]:
+            if not isinstance(data, Mapping):
+                raise DataDecoderTypeException(dict, data)
 
-        if type_keys is not str:
-            raise DataDecoderMalformedTypeException(f"dictionary keys must be {str!r}. Obtained: {type_keys!r}")
+            if type_keys is not str:
+                raise DataDecoderMalformedTypeException(f"dictionary keys must be {str!r}. Obtained: {type_keys!r}")
 
-        keys = self._build_iterable(data.keys(), type_keys, **kwargs)
-        values = self._build_iterable(data.values(), type_values, **kwargs)
-        return dict(zip(keys, values))
+            return {
+                decode_key(decoder, key, **kwargs): decode_value(decoder, value, **kwargs)
+                for key, value in data.items()
+            }
 
-    def _build_iterable(self, data: Iterable, type_params: type, **kwargs) -> Iterable:
-        return (self._build(type_params, item, **kwargs) for item in data)
+        return _decode
@@ -13,19 +13,29 @@ from datetime import (
 from decimal import (
     Decimal,
 )
+from functools import (
+    lru_cache,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Container,
+    Iterable,
+    Optional,
 )
 from uuid import (
     UUID,
 )
 
+import orjson
+
 from .....exceptions import (
     MinosMalformedAttributeException,
 )
 from ....types import (
     MissingSentinel,
+    NoneType,
 )
 from ...abc import (
     DataEncoder,
@@ -41,6 +51,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DISPATCH_CACHE_MAXSIZE = 1024
+
 
 class AvroDataEncoder(DataEncoder):
     """Avro Data Encoder class."""
@@ -58,83 +70,177 @@ class AvroDataEncoder(DataEncoder):
             value = self.value
         return self._build(value, **kwargs)
 
-    def _build(self, value: Any, **kwargs) -> Any:
-        if value is None:
-            return None
+    def build_json(self, value=MissingSentinel, exclude: Optional[Container[str]] = None, **kwargs) -> bytes:
+        """Build the ``json`` representation of the avro data of the given value.
 
-        from ....abc import (
-            Model,
-        )
+        The result is equivalent to dumping the output of ``build`` as ``json``, but models, fields and the values that
+        are not natively supported by ``orjson`` are encoded on demand, so the intermediate data structure is not built.
 
-        if isinstance(value, Model):
-            return self._build_model(value, **kwargs)
+        :param value: The value to be encoded.
+        :param exclude: The names of the top-level fields to be skipped if the value is a model.
+        :return: A ``bytes`` instance.
+        """
+        if value is MissingSentinel:
+            value = self.value
 
-        from ....abc import (
-            Field,
-        )
+        if exclude is not None:
+            value = self._build_model_json_excluding(value, exclude, **kwargs)
 
-        if isinstance(value, Field):
-            return self._build_field(value, **kwargs)
+        errors = list()
 
-        if isinstance(value, (str, int, bool, float, bytes)):
-            return value
+        def _default(v: Any) -> Any:
+            try:
+                return self._get_json_builder(type(v))(self, v, **kwargs)
+            except MinosMalformedAttributeException as exc:
+                errors.append(exc)
+                raise exc
 
-        if isinstance(value, memoryview):
-            return value.tobytes()
+        try:
+            return orjson.dumps(value, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError as exc:
+            if errors:
+                raise errors[0]
+            raise MinosMalformedAttributeException(f"The given value could not be encoded as json: {exc}")
 
-        if isinstance(value, Decimal):
-            return float(value)
+    def _build(self, value: Any, **kwargs) -> Any:
+        return self._get_builder(type(value))(self, value, **kwargs)
 
-        if isinstance(value, datetime):
-            return self._build_datetime(value, **kwargs)
+    @classmethod
+    @lru_cache(maxsize=DISPATCH_CACHE_MAXSIZE)
+    def _get_builder(cls, type_: type) -> Callable[..., Any]:
+        """Get the builder function for the given type.
 
-        if isinstance(value, timedelta):
-            return self._build_timedelta(value, **kwargs)
+        The exact type is looked up first on the dispatch table, falling back to the first entry of which the type is
+        a subclass. The result is cached, so the fallback is only computed the first time a type is encoded.
 
-        if isinstance(value, date):
-            return self._build_date(value, **kwargs)
+        :param type_: The type of the value to be encoded.
+        :return: A function that receives the encoder instance, the value and additional named arguments.
+        """
+        table = cls._build_dispatch_table()
 
-        if isinstance(value, time):
-            return self._build_time(value, **kwargs)
+        if type_ in table:
+            return getattr(cls, table[type_])
 
-        if isinstance(value, UUID):
-            return self._build_uuid(value, **kwargs)
+        for base, name in table.items():
+            if issubclass(type_, base):
+                return getattr(cls, name)
 
-        if isinstance(value, (list, set)):
-            return [self._build(v, **kwargs) for v in value]
+        return cls._build_unsupported
 
-        if isinstance(value, dict):
-            return {k: self._build(v, **kwargs) for k, v in value.items()}
+    @staticmethod
+    def _build_dispatch_table() -> dict[type, str]:
+        from ....abc import (
+            Model,
+        )
+        from ....fields import (
+            Field,
+        )
 
+        return {
+            NoneType: "_build_none",
+            Model: "_build_model",
+            Field: "_build_field",
+            str: "_build_identity",
+            int: "_build_identity",
+            bool: "_build_identity",
+            float: "_build_identity",
+            bytes: "_build_identity",
+            memoryview: "_build_memoryview",
+            Decimal: "_build_decimal",
+            datetime: "_build_datetime",
+            timedelta: "_build_timedelta",
+            date: "_build_date",
+            time: "_build_time",
+            UUID: "_build_uuid",
+            list: "_build_iterable",
+            set: "_build_iterable",
+            dict: "_build_dict",
+        }
+
+    @classmethod
+    @lru_cache(maxsize=DISPATCH_CACHE_MAXSIZE)
+    def _get_json_builder(cls, type_: type) -> Callable[..., Any]:
+        from ....abc import (
+            Model,
+        )
+
+        if issubclass(type_, Model):
+            if type_.encode_data is Model.encode_data:
+                return cls._build_model_json
+            return cls._build_model
+
+        if issubclass(type_, set):
+            return cls._build_set_json
+
+        return cls._get_builder(type_)
+
+    # noinspection PyUnusedLocal
+    def _build_none(self, value: None, **kwargs) -> None:
+        return None
+
+    # noinspection PyUnusedLocal
+    def _build_identity(self, value: Any, **kwargs) -> Any:
+        return value
+
+    # noinspection PyUnusedLocal
+    def _build_unsupported(self, value: Any, **kwargs) -> Any:
         raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
 
     def _build_model(self, model: Model, **kwargs) -> Any:
-        raw = {name: self._build_field(field, **kwargs) for name, field in model.fields.items()}
+        raw = {name: self._build(value, **kwargs) for name, value in model._field_items()}
 
         if (ans := model.encode_data(self, raw, **kwargs)) is not MissingSentinel:
             return ans
 
-        return self._build(raw, **kwargs)
+        return raw
+
+    # noinspection PyUnusedLocal
+    def _build_model_json(self, model: Model, **kwargs) -> dict[str, Any]:
+        return dict(model._field_items())
+
+    def _build_model_json_excluding(self, value: Any, exclude: Container[str], **kwargs) -> Any:
+        raw = self._get_json_builder(type(value))(self, value, **kwargs)
+        if not isinstance(raw, dict):
+            return raw
+        return {name: field_value for name, field_value in raw.items() if name not in exclude}
 
     def _build_field(self, field: Field, **kwargs) -> Any:
         return self._build(field.value, **kwargs)
 
-    @staticmethod
-    def _build_date(value: date, **kwargs) -> int:
+    def _build_iterable(self, value: Iterable[Any], **kwargs) -> list[Any]:
+        return [self._build(v, **kwargs) for v in value]
+
+    # noinspection PyUnusedLocal
+    def _build_set_json(self, value: set[Any], **kwargs) -> list[Any]:
+        return list(value)
+
+    def _build_dict(self, value: dict[str, Any], **kwargs) -> dict[str, Any]:
+        return {k: self._build(v, **kwargs) for k, v in value.items()}
+
+    # noinspection PyUnusedLocal
+    def _build_memoryview(self, value: memoryview, **kwargs) -> bytes:
+        return value.tobytes()
+
+    # noinspection PyUnusedLocal
+    def _build_decimal(self, value: Decimal, **kwargs) -> float:
+        return float(value)
+
+    # noinspection PyUnusedLocal
+    def _build_date(self, value: date, **kwargs) -> int:
         return (value - date(1970, 1, 1)).days
 
-    @staticmethod
-    def _build_time(value: time, **kwargs) -> int:
+    # noinspection PyUnusedLocal
+    def _build_time(self, value: time, **kwargs) -> int:
         return (datetime.combine(date(1, 1, 1), value) - datetime(1, 1, 1)) // timedelta(microseconds=1)
 
-    @staticmethod
-    def _build_datetime(value: datetime, **kwargs) -> int:
+    # noinspection PyUnusedLocal
+    def _build_datetime(self, value: datetime, **kwargs) -> int:
         return (value.astimezone(timezone.utc) - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
 
-    @staticmethod
-    def _build_timedelta(value: timedelta, **kwargs) -> int:
+    # noinspection PyUnusedLocal
+    def _build_timedelta(self, value: timedelta, **kwargs) -> int:
         return value // timedelta(microseconds=1)
 
-    @staticmethod
-    def _build_uuid(value: UUID, **kwargs) -> str:
+    # noinspection PyUnusedLocal
+    def _build_uuid(self, value: UUID, **kwargs) -> str:
         return str(value)
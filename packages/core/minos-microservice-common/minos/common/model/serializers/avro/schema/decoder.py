@@ -12,14 +12,20 @@ from datetime import (
     time,
     timedelta,
 )
+from functools import (
+    lru_cache,
+)
 from typing import (
     Any,
+    Optional,
     Union,
 )
 from uuid import (
     UUID,
 )
 
+import orjson
+
 from .....exceptions import (
     MinosImportException,
     MinosMalformedAttributeException,
@@ -58,6 +64,9 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+DECODED_SCHEMA_CACHE_MAXSIZE = 1024
+IMPORT_CACHE_MAXSIZE = 1024
+
 
 class AvroSchemaDecoder(SchemaDecoder):
     """Avro Schema Decoder class."""
@@ -68,13 +77,37 @@ class AvroSchemaDecoder(SchemaDecoder):
     def build(self, schema: Any = MissingSentinel, **kwargs) -> type:
         """Build type from given avro schema item.
 
+        If no additional named arguments are given, the result is cached by the canonical representation of the
+        schema, so the ``decode_schema`` hooks of the models are not called again for an already decoded schema.
+
         :param schema: The schema to be decoded as a type.
         :return: A type object.
         """
         if schema is MissingSentinel:
             schema = self._schema
+
+        if not kwargs and isinstance(schema, (dict, list)):
+            try:
+                fingerprint = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                pass
+            else:
+                return self._build_cached(fingerprint)
+
         return self._build(schema, **kwargs)
 
+    @classmethod
+    @lru_cache(maxsize=DECODED_SCHEMA_CACHE_MAXSIZE)
+    def _build_cached(cls, fingerprint: bytes) -> type:
+        """Build the type from the canonical ``json`` representation of the schema.
+
+        The canonical representation sorts the keys of the objects, so equivalent schemas share the same cache entry.
+
+        :param fingerprint: The canonical representation of the schema.
+        :return: A type object.
+        """
+        return cls()._build(orjson.loads(fingerprint))
+
     def _build(self, schema: Union[dict, list, str], **kwargs) -> type:
         if isinstance(schema, dict):
             return self._build_from_dict(schema, **kwargs)
@@ -128,11 +161,7 @@ class AvroSchemaDecoder(SchemaDecoder):
 
         sub_schema = {k: v for k, v in schema.items() if k != "logicalType"}
 
-        try:
-            cls_ = import_module(logical_type)
-        except MinosImportException:
-            cls_ = None
-
+        cls_ = _import_module_or_none(logical_type)
         if cls_ is not None:
             # noinspection PyUnresolvedReferences
             if is_model_subclass(cls_) and (ans := cls_.decode_schema(self, sub_schema)) is not MissingSentinel:
@@ -176,10 +205,7 @@ class AvroSchemaDecoder(SchemaDecoder):
         else:
             classname = name
 
-        try:
-            cls_ = import_module(classname)
-        except MinosImportException:
-            cls_ = None
+        cls_ = _import_module_or_none(classname)
 
         if is_model_subclass(cls_) and (ans := cls_.decode_schema(self, schema, **kwargs)) is not MissingSentinel:
             return ans
@@ -221,3 +247,14 @@ class AvroSchemaDecoder(SchemaDecoder):
             return bytes
 
         raise MinosMalformedAttributeException(f"Given field type is not supported: {type_!r}")
+
+
+def _import_module_or_none(name: str) -> Optional[type]:
+    try:
+        return _import_module_cached(name)
+    except MinosImportException:
+        # The failures are not cached, as the module could be importable later.
+        return None
+
+
+_import_module_cached = lru_cache(maxsize=IMPORT_CACHE_MAXSIZE)(import_module)
@@ -24,11 +24,15 @@ from typing import (
 from uuid import (
     UUID,
     uuid4,
+    uuid5,
 )
 
 from .....importlib import (
     classname,
 )
+from .....uuid import (
+    NULL_UUID,
+)
 from ....types import (
     FieldType,
     MissingSentinel,
@@ -71,8 +75,10 @@ logger = logging.getLogger(__name__)
 class AvroSchemaEncoder(SchemaEncoder):
     """Avro Schema Encoder class."""
 
-    def __init__(self, type_: type = None):
+    def __init__(self, type_: type = None, deterministic: bool = False):
         self.type_ = type_
+        self.deterministic = deterministic
+        self._occurrences = dict()
 
     def build(self, type_=MissingSentinel, **kwargs) -> Union[dict, list, str]:
         """Build the avro schema for the given field.
@@ -176,18 +182,28 @@ class AvroSchemaEncoder(SchemaEncoder):
 
         schema = {
             "name": type_.name,
-            "namespace": self._patch_namespace(type_.namespace),
+            "namespace": self._patch_namespace(type_),
             "type": "record",
             "fields": [self._build_field(FieldType(n, t), **kwargs) for n, t in type_.type_hints.items()],
         }
         return schema
 
-    @classmethod
-    def _patch_namespace(cls, namespace: Optional[str]) -> Optional[str]:
+    def _patch_namespace(self, type_: ModelType) -> Optional[str]:
+        namespace = type_.namespace
         if len(namespace) > 0:
-            namespace += f".{cls.generate_random_str()}"
+            namespace += f".{self._generate_namespace_suffix(type_)}"
         return namespace
 
+    def _generate_namespace_suffix(self, type_: ModelType) -> str:
+        if not self.deterministic:
+            return self.generate_random_str()
+
+        # The occurrence counter avoids redefinitions when the same record appears more than once on the schema.
+        occurrence = self._occurrences.get(type_.classname, 0)
+        self._occurrences[type_.classname] = occurrence + 1
+
+        return self.generate_deterministic_str(f"{type_.classname}:{occurrence}")
+
     def _build_field(self, field: Union[Field, FieldType], **kwargs):
         return {"name": field.name, "type": self._build(field.type, **kwargs)}
 
@@ -222,3 +238,12 @@ class AvroSchemaEncoder(SchemaEncoder):
         :return: A random string value.
         """
         return str(uuid4())
+
+    @staticmethod
+    def generate_deterministic_str(seed: str) -> str:
+        """Generate a deterministic string based on the given seed.
+
+        :param seed: The seed to be used.
+        :return: A string value.
+        """
+        return str(uuid5(NULL_UUID, seed))
@@ -6,6 +6,9 @@ import logging
 from collections.abc import (
     Iterable,
 )
+from itertools import (
+    islice,
+)
 from typing import (
     Any,
     Optional,
@@ -38,9 +41,17 @@ def build_union(options: Iterable[type, ...]) -> type:
 class TypeHintBuilder:
     """Type Hint Builder class."""
 
-    def __init__(self, value: Any, type_: Optional[type] = None):
+    def __init__(self, value: Any, type_: Optional[type] = None, sample_size: Optional[int] = None):
+        """Initialize a new instance.
+
+        :param value: The value from which the type hint is built.
+        :param type_: The optional static type hint of the value.
+        :param sample_size: If set, only the first ``sample_size`` elements of each collection are inspected. This
+            speeds up the building of very large collections, at the cost of ignoring the types of the rest of elements.
+        """
         self.value = value
         self.type_ = type_
+        self.sample_size = sample_size
 
     def build(self) -> type:
         """Build type hint from an instance..
@@ -77,13 +88,27 @@ class TypeHintBuilder:
         return type(value)
 
     def _build_from_iterable(self, values: Iterable, type_: Optional[type]) -> type:
-        values = tuple(values)
+        if self.sample_size is not None:
+            values = tuple(islice(values, self.sample_size))
+        else:
+            values = tuple(values)
+
         if len(values) == 0:
             return type_
 
+        first = values[0]
+        if self._is_leaf(first):
+            first_type = type(first)
+            if all(type(value) is first_type for value in values):
+                return self._build(first, type_)
+
         options = tuple(self._build(value, type_) for value in values)
         return build_union(options)
 
+    @staticmethod
+    def _is_leaf(value: Any) -> bool:
+        return not isinstance(value, (tuple, list, set, dict)) and not is_model_type(value)
+
     @staticmethod
     def _build_from_dynamic(dynamic: type, static: Optional[type]) -> type:
         return dynamic if not len(get_args(static)) and TypeHintComparator(dynamic, static).match() else static
@@ -0,0 +1,99 @@
+from collections import (
+    OrderedDict,
+)
+from functools import (
+    wraps,
+)
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def identity_lru_cache(maxsize: int) -> Callable[[F], F]:
+    """Decorator to cache the results of a function, keyed by the identity of the positional arguments.
+
+    Unlike ``functools.lru_cache``, the arguments are never compared by equality, which is required for types with
+    loose equality semantics (like ``ModelType``), whose comparison may call the cached function again. The cache keeps
+    a reference to the arguments of each entry, so their identities cannot be reused while they are cached.
+
+    :param maxsize: The maximum number of entries.
+    :return: A decorator.
+    """
+
+    def _decorator(func: F) -> F:
+        entries = OrderedDict()
+
+        @wraps(func)
+        def _wrapper(*args):
+            key = tuple(map(id, args))
+            try:
+                entry = entries[key]
+            except KeyError:
+                result = func(*args)
+                entries[key] = (args, result)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+                return result
+
+            entries.move_to_end(key)
+            return entry[1]
+
+        _wrapper.cache_clear = entries.clear
+        return _wrapper
+
+    return _decorator
+
+
+class TypeHintKey:
+    """Hashable key of a type hint, to be used on caches.
+
+    Unlike the type hints themselves, the keys are compared structurally and preserving the order of the arguments (so
+    ``Union[int, float]`` and ``Union[float, int]`` lead to different keys), while the classes (including the
+    ``ModelType`` instances, that have loose equality semantics) are compared by identity. If the type hint contains
+    unhashable values, a ``TypeError`` is raised.
+    """
+
+    __slots__ = ("type_", "_key", "_hash")
+
+    def __init__(self, type_: Any):
+        self.type_ = type_
+        self._key = _build_type_hint_key(type_)
+        self._hash = hash(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, TypeHintKey) and self._key == other._key
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.type_!r})"
+
+
+def _build_type_hint_key(type_: Any) -> Hashable:
+    origin = get_origin(type_)
+    if origin is not None:
+        return _IdentityKey(origin), tuple(_build_type_hint_key(arg) for arg in get_args(type_))
+    if isinstance(type_, type):
+        return _IdentityKey(type_)
+    return type(type_), type_
+
+
+class _IdentityKey:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _IdentityKey) and self.value is other.value
@@ -11,6 +11,9 @@ from typing import (
     get_origin,
 )
 
+from .caches import (
+    identity_lru_cache,
+)
 from .generics import (
     unpack_typevar,
 )
@@ -62,8 +65,7 @@ class TypeHintComparator:
 
         :return: ``True`` if there is a match or ``False`` otherwise.
         """
-
-        return self._compare(self._first, self._second)
+        return _match_cached(type(self), self._first, self._second)
 
     def _compare(self, first: T, second: K) -> bool:
         if isinstance(first, TypeVar):
@@ -108,3 +110,11 @@ class TypeHintComparator:
         if len(first_args) != len(second_args):
             return False
         return all(self._compare(fi, si) for fi, si in zip(first_args, second_args))
+
+
+TYPE_HINT_COMPARISON_CACHE_MAXSIZE = 4096
+
+
+@identity_lru_cache(maxsize=TYPE_HINT_COMPARISON_CACHE_MAXSIZE)
+def _match_cached(comparator_cls: type[TypeHintComparator], first: type, second: type) -> bool:
+    return comparator_cls(first, second)._compare(first, second)
@@ -10,6 +10,9 @@ from typing import (
     Optional,
     Type,
 )
+from weakref import (
+    WeakValueDictionary,
+)
 
 from ...exceptions import (
     MinosImportException,
@@ -17,6 +20,10 @@ from ...exceptions import (
 from ...importlib import (
     import_module,
 )
+from .caches import (
+    TypeHintKey,
+    identity_lru_cache,
+)
 from .generics import (
     GenericTypeProjector,
 )
@@ -40,6 +47,9 @@ class ModelType(type):
     ) -> ModelType:
         """Build a new ``ModelType`` instance.
 
+        Instances are interned, so structurally identical types (same name, namespace and type hints, compared in an
+        order-preserving way) are represented by the same object while it is alive.
+
         :param name_: Name of the new type.
         :param type_hints_: Type hints of the new type.
         :param namespace_: Namespace of the new type.
@@ -58,8 +68,20 @@ class ModelType(type):
             except ValueError:
                 namespace_ = str()
 
+        try:
+            key = (mcs, name_, namespace_, tuple((name, TypeHintKey(hint)) for name, hint in type_hints_.items()))
+            return _INTERNED_MODEL_TYPES[key]
+        except TypeError:
+            # The type hints are not hashable, so the type cannot be interned.
+            # noinspection PyTypeChecker
+            return mcs(name_, tuple(), {"type_hints": type_hints_, "namespace": namespace_})
+        except KeyError:
+            pass
+
         # noinspection PyTypeChecker
-        return mcs(name_, tuple(), {"type_hints": type_hints_, "namespace": namespace_})
+        return _INTERNED_MODEL_TYPES.setdefault(
+            key, mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+        )
 
     @classmethod
     def from_typed_dict(mcs, typed_dict) -> ModelType:
@@ -77,7 +99,9 @@ class ModelType(type):
         :param type_: The model class.
         :return: A new ``ModelType`` instance.
         """
-        return ModelType.build(name_=type_.classname, type_hints_=GenericTypeProjector.from_model(type_).build())
+        if isinstance(type_, type):
+            return _from_model_cls(type_)
+        return _from_model(type_)
 
     def __call__(cls, *args, **kwargs) -> Model:
         return cls.model_cls.from_model_type(cls, *args, **kwargs)
@@ -86,17 +110,27 @@ class ModelType(type):
     def model_cls(cls) -> Type[Model]:
         """Get the model class if defined or ``DataTransferObject`` otherwise.
 
+        The resolution is performed only once per ``ModelType`` instance.
+
         :return: A model class.
         """
+        try:
+            return cls.__dict__["_model_cls"]
+        except KeyError:
+            pass
+
         try:
             # noinspection PyTypeChecker
-            return import_module(cls.classname)
+            model_cls = import_module(cls.classname)
         except MinosImportException:
             from ..dynamic import (
                 DataTransferObject,
             )
 
-            return DataTransferObject
+            model_cls = DataTransferObject
+
+        cls._model_cls = model_cls
+        return model_cls
 
     @property
     def name(cls) -> str:
@@ -169,6 +203,15 @@ class ModelType(type):
         )
 
     def __eq__(cls, other: Any) -> bool:
+        if cls is other:
+            return True
+
+        if isinstance(other, type):
+            return _equal_cached(cls, other)
+
+        return cls._equal(other)
+
+    def _equal(cls, other: Any) -> bool:
         conditions = (
             cls._equal_with_model_type,
             cls._equal_with_model,
@@ -211,7 +254,12 @@ class ModelType(type):
         )
 
     def __hash__(cls) -> int:
-        return hash(tuple(cls))
+        try:
+            return cls.__dict__["_hash"]
+        except KeyError:
+            pass
+        cls._hash = hash(tuple(cls))
+        return cls._hash
 
     def __iter__(cls) -> Iterable:
         # noinspection PyRedundantParentheses
@@ -221,6 +269,24 @@ class ModelType(type):
         return f"{type(cls).__name__}(name={cls.name!r}, namespace={cls.namespace!r}, type_hints={cls.type_hints!r})"
 
 
+MODEL_TYPE_COMPARISON_CACHE_MAXSIZE = 4096
+MODEL_TYPE_FROM_MODEL_CACHE_MAXSIZE = 1024
+
+_INTERNED_MODEL_TYPES: WeakValueDictionary[tuple, ModelType] = WeakValueDictionary()
+
+
+def _from_model(type_) -> ModelType:
+    return ModelType.build(name_=type_.classname, type_hints_=GenericTypeProjector.from_model(type_).build())
+
+
+_from_model_cls = identity_lru_cache(maxsize=MODEL_TYPE_FROM_MODEL_CACHE_MAXSIZE)(_from_model)
+
+
+@identity_lru_cache(maxsize=MODEL_TYPE_COMPARISON_CACHE_MAXSIZE)
+def _equal_cached(first: ModelType, second: type) -> bool:
+    return first._equal(second)
+
+
 class FieldType(NamedTuple):
     """Field Type class."""
 
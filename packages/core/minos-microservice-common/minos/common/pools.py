@@ -3,8 +3,16 @@ from abc import (
     ABC,
 )
 from asyncio import (
+    LifoQueue,
+    gather,
     sleep,
 )
+from bisect import (
+    bisect_left,
+)
+from random import (
+    random,
+)
 from typing import (
     Any,
     Generic,
@@ -27,21 +35,72 @@ logger = logging.getLogger(__name__)
 
 P = TypeVar("P")
 
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
 
 class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
-    """Base class for Pool implementations in minos"""
+    """Base class for Pool implementations in minos.
+
+    The pool keeps at least ``minsize`` instances (that are created on ``setup``) and grows on demand up to
+    ``maxsize`` instances. The idle instances are reused in LIFO order, so that the ones that are not required by the
+    current load stay idle and are destroyed once they have been idle for ``idle_timeout`` seconds.
 
-    def __init__(self, *args, maxsize: int = 10, recycle: Optional[int] = 300, already_setup: bool = True, **kwargs):
+    The size is also adapted to the acquisition wait times: when an acquisition waits at least
+    ``wait_time_threshold`` seconds and there are no idle instances, a spare instance is created in background so that
+    the next acquisition does not have to wait for it, and the idle instances are not destroyed until no acquisition
+    has exceeded the threshold for ``idle_timeout`` seconds.
+    """
+
+    creation_retry_delay: float = 0.1
+    max_creation_retry_delay: float = 5.0
+
+    def __init__(
+        self,
+        *args,
+        minsize: int = 0,
+        maxsize: int = 10,
+        recycle: Optional[int] = 300,
+        idle_timeout: Optional[float] = 60,
+        wait_time_threshold: Optional[float] = 0.1,
+        already_setup: bool = True,
+        **kwargs,
+    ):
         MinosSetup.__init__(self, *args, already_setup=already_setup, **kwargs)
+        if not 0 <= minsize <= maxsize:
+            raise ValueError(f"The minsize must be between 0 and maxsize ({maxsize!r}). Obtained: {minsize!r}")
+
         PoolBase.__init__(self, maxsize=maxsize, recycle=recycle)
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.wait_time_threshold = wait_time_threshold
+        self.metrics = PoolMetrics(self)
+
+        self._instances = _IdleQueue()
+        self._idle_since = dict()
+        self._slow_acquired_at = None
 
-    async def __acquire(self) -> Any:  # pragma: no cover
+        if idle_timeout is not None:
+            self._PoolBase__create_task(self.__shrinker())
+
+    async def setup(self) -> None:
+        """Setup the pool, creating the ``minsize`` instances (if they are not already created).
+
+        :return: This method does not return anything.
+        """
+        await super().setup()
+        await gather(*(self.__create_new_instance() for _ in range(self.minsize - len(self))))
+
+    async def __acquire(self, started_at: Optional[float] = None) -> Any:  # pragma: no cover
         # FIXME: This method inheritance should be improved.
+        if started_at is None:
+            started_at = self._loop.time()
 
         if self._instances.empty() and not self._semaphore.locked():
-            await self._PoolBase__create_new_instance()
+            await self.__create_new_instance()
 
         instance = await self._instances.get()
+        self._idle_since.pop(instance, None)
 
         try:
             result = await self._check_instance(instance)
@@ -50,11 +109,82 @@ class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
         else:
             if not result:
                 self._PoolBase__recycle_instance(instance)
-                return await self._PoolBase__acquire()
+                return await self.__acquire(started_at)
 
         self._used.add(instance)
+
+        wait_time = self._loop.time() - started_at
+        self.metrics.observe_acquisition(wait_time)
+        self._adapt(wait_time)
+
         return instance
 
+    async def __create_new_instance(self) -> None:
+        await self._semaphore.acquire()
+
+        try:
+            instance = await self._create_instance()
+        except BaseException:
+            self._semaphore.release()
+            self.metrics.observe_creation(failed=True)
+            raise
+
+        self.metrics.observe_creation(failed=instance is None)
+        self._len += 1
+
+        if self._recycle:
+            self._recycle_times[instance] += self._recycle * (1 + random())
+
+        await self._instances.put(instance)
+
+    def _adapt(self, wait_time: float) -> None:
+        if self.wait_time_threshold is None or wait_time < self.wait_time_threshold:
+            return
+
+        self._slow_acquired_at = self._loop.time()
+        if self._instances.empty():
+            self._PoolBase__create_task(self.__create_spare_instance())
+
+    async def __create_spare_instance(self) -> None:
+        if not self._instances.empty() or self._semaphore.locked():
+            return
+
+        try:
+            await self.__create_new_instance()
+        except Exception as exc:
+            logger.warning(f"There was an {exc!r} while trying to create a spare instance.")
+
+    async def __release(self, instance: Any) -> None:
+        await self._PoolBase__release(instance)
+        if instance in self._instances:
+            self._idle_since[instance] = self._loop.time()
+
+    async def __shrinker(self) -> None:
+        while True:
+            await sleep(self.idle_timeout / 2)
+            self._shrink()
+
+    def _shrink(self) -> None:
+        now = self._loop.time()
+        if self._slow_acquired_at is not None and now - self._slow_acquired_at < self.idle_timeout:
+            return
+
+        while len(self) > self.minsize and not self._instances.empty():
+            oldest = self._instances.oldest()
+            if now - self._idle_since.get(oldest, now) < self.idle_timeout:
+                break
+            self._instances.pop_oldest()
+            self._idle_since.pop(oldest, None)
+            self._PoolBase__recycle_instance(oldest)
+
+    def _get_creation_retry_delay(self) -> float:
+        """Get the time to wait before retrying a failed instance creation.
+
+        :return: The delay in seconds, that grows exponentially with the consecutive creation failures.
+        """
+        delay = self.creation_retry_delay * 2**self.metrics.consecutive_creation_failures
+        return min(delay, self.max_creation_retry_delay)
+
     def acquire(self, *args, **kwargs) -> P:
         """Acquire a new instance wrapped on an asynchronous context manager.
 
@@ -62,7 +192,7 @@ class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
         :param kwargs: Additional named arguments.
         :return: An asynchronous context manager.
         """
-        return ContextManager(self.__acquire, self._PoolBase__release)
+        return ContextManager(self.__acquire, self.__release)
 
     async def _destroy(self) -> None:
         if len(self._used):
@@ -74,3 +204,95 @@ class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
 
     async def _check_instance(self, instance: P) -> bool:
         return True
+
+
+class PoolMetrics:
+    """Pool Metrics class.
+
+    Contains the counters of a pool since it was created, as well as the histogram of the acquisition wait times, in
+    which each bucket counts the acquisitions that waited up to its bound (the last bucket counts the rest).
+    """
+
+    def __init__(self, pool: MinosPool):
+        self._pool = pool
+
+        self.acquisitions = 0
+        self.wait_time_sum = 0.0
+        self.wait_time_buckets = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+        self.creations = 0
+        self.creation_failures = 0
+        self.consecutive_creation_failures = 0
+
+    @property
+    def in_use(self) -> int:
+        """Get the number of instances that are currently acquired.
+
+        :return: An integer value.
+        """
+        return len(self._pool._used)
+
+    @property
+    def idle(self) -> int:
+        """Get the number of instances that are currently available.
+
+        :return: An integer value.
+        """
+        return self._pool._instances.qsize()
+
+    @property
+    def size(self) -> int:
+        """Get the number of instances of the pool.
+
+        :return: An integer value.
+        """
+        return len(self._pool)
+
+    def observe_acquisition(self, wait_time: float) -> None:
+        """Register a new acquisition.
+
+        :param wait_time: The time in seconds that the acquisition waited for an instance.
+        :return: This method does not return anything.
+        """
+        self.acquisitions += 1
+        self.wait_time_sum += wait_time
+        self.wait_time_buckets[bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    def observe_creation(self, failed: bool = False) -> None:
+        """Register a new instance creation.
+
+        :param failed: ``True`` if the instance could not be created or ``False`` otherwise.
+        :return: This method does not return anything.
+        """
+        if failed:
+            self.creation_failures += 1
+            self.consecutive_creation_failures += 1
+        else:
+            self.creations += 1
+            self.consecutive_creation_failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the metrics as a dictionary.
+
+        :return: A dictionary in which the keys are the metric names.
+        """
+        return {
+            "acquisitions": self.acquisitions,
+            "wait_time_sum": self.wait_time_sum,
+            "wait_time_buckets": dict(zip(WAIT_TIME_BUCKETS + (float("inf"),), self.wait_time_buckets)),
+            "in_use": self.in_use,
+            "idle": self.idle,
+            "size": self.size,
+            "creations": self.creations,
+            "creation_failures": self.creation_failures,
+        }
+
+
+class _IdleQueue(LifoQueue):
+    def oldest(self) -> Any:
+        return self._queue[0]
+
+    def pop_oldest(self) -> Any:
+        return self._queue.pop(0)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._queue
@@ -2,9 +2,12 @@ from .abc import (
     MinosBinaryProtocol,
 )
 from .avro import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
+    PostgreSqlAvroSchemaRegistry,
 )
 from .json import (
     MinosJsonBinaryProtocol,
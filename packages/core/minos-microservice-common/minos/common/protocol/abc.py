@@ -1,6 +1,7 @@
 import abc
 from typing import (
     Any,
+    Union,
 )
 
 
@@ -20,10 +21,12 @@ class MinosBinaryProtocol(abc.ABC):
 
     @classmethod
     @abc.abstractmethod
-    def decode(cls, data: bytes, *args, **kwargs) -> Any:
+    def decode(cls, data: Union[bytes, bytearray, memoryview], *args, **kwargs) -> Any:
         """Decodes the given bytes data.
 
-        :param data: bytes data to be decoded.
+        Implementations must accept any bytes-like object, so that buffers can be decoded without being copied first.
+
+        :param data: bytes-like data to be decoded.
         :return: De decoded data.
         """
         raise NotImplementedError
@@ -7,3 +7,8 @@ from .databases import (
 from .messages import (
     MinosAvroMessageProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+    PostgreSqlAvroSchemaRegistry,
+)
@@ -1,12 +1,23 @@
+from __future__ import (
+    annotations,
+)
+
 import io
+from functools import (
+    lru_cache,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Union,
 )
 
+import orjson
 from fastavro import (
     parse_schema,
     reader,
+    schemaless_reader,
+    schemaless_writer,
     writer,
 )
 
@@ -17,6 +28,16 @@ from ..abc import (
     MinosBinaryProtocol,
 )
 
+if TYPE_CHECKING:
+    from .registries import (
+        AvroSchemaRegistry,
+    )
+
+PARSED_SCHEMA_CACHE_MAXSIZE = 1024
+
+REGISTRY_MAGIC_BYTE = b"\x00"
+REGISTRY_FINGERPRINT_SIZE = 8
+
 
 class MinosAvroProtocol(MinosBinaryProtocol):
     """Minos Avro Protocol class."""
@@ -47,13 +68,32 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         except Exception as exc:
             raise MinosProtocolException(f"Error encoding data: {exc!r}")
 
+    @classmethod
+    def _parse_schema(cls, schema: list[dict[str, Any]]) -> dict[str, Any]:
+        try:
+            raw = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return cls._parse_schema_uncached(schema)
+        return cls._parse_raw_schema(raw)
+
+    @classmethod
+    @lru_cache(maxsize=PARSED_SCHEMA_CACHE_MAXSIZE)
+    def _parse_raw_schema(cls, raw: bytes) -> dict[str, Any]:
+        return cls._parse_schema_uncached(orjson.loads(raw))
+
     @staticmethod
-    def _parse_schema(schema: list[dict[str, Any]]) -> dict[str, Any]:
+    def _parse_schema_uncached(schema: list[dict[str, Any]]) -> dict[str, Any]:
         named_schemas = {}
         for item in schema[1::-1]:
             parse_schema(item, named_schemas)
         return parse_schema(schema[0], named_schemas, expand=True)
 
+    @staticmethod
+    def _clean_parsed_schema(schema: Any) -> Any:
+        if isinstance(schema, dict):
+            schema = {k: v for k, v in schema.items() if not k.startswith("__")}
+        return schema
+
     @staticmethod
     def _write_data(value: list[dict[str, Any]], schema: dict[str, Any]):
         with io.BytesIO() as file:
@@ -63,23 +103,70 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         return content
 
     @classmethod
-    def decode(cls, data: bytes, *args, batch_mode: bool = False, **kwargs) -> Any:
+    def decode(cls, data: Union[bytes, bytearray, memoryview], *args, batch_mode: bool = False, **kwargs) -> Any:
         """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
 
-        :param data: A bytes object.
+        :param data: A bytes-like object.
         :param args: Additional positional arguments.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
         single model.
         :param kwargs: Additional named arguments.
         :return: A dictionary or a list of dictionaries.
         """
+        _, ans = cls._read(data)
+        return cls._unpack(ans, batch_mode)
+
+    # noinspection PyUnusedLocal
+    @classmethod
+    def decode_schema(
+        cls, data: Union[bytes, bytearray, memoryview], *args, **kwargs
+    ) -> Union[dict[str, Any], list[dict[str, Any]]]:
+        """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
+
+        :param data: A bytes-like object.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: A tuple or a list of tuples.
+        """
+
+        try:
+            with io.BytesIO(data) as file:
+                r = reader(file)
+                schema = r.writer_schema
+
+        except Exception as exc:
+            raise MinosProtocolException(f"Error getting avro schema: {exc}")
+
+        return schema
+
+    # noinspection PyUnusedLocal
+    @classmethod
+    def decode_with_schema(
+        cls, data: Union[bytes, bytearray, memoryview], *args, batch_mode: bool = False, **kwargs
+    ) -> tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]:
+        """Decode both the schema and the data of the given bytes, parsing them only once.
+
+        :param data: A bytes-like object.
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+        single model.
+        :param kwargs: Additional named arguments.
+        :return: A tuple containing the schema and the decoded data.
+        """
+        schema, ans = cls._read(data)
+        return schema, cls._unpack(ans, batch_mode)
 
+    @staticmethod
+    def _read(data: Union[bytes, bytearray, memoryview]) -> tuple[Any, list[Any]]:
         try:
             with io.BytesIO(data) as file:
-                ans = list(reader(file))
+                r = reader(file)
+                return r.writer_schema, list(r)
         except Exception as exc:
             raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
 
+    @staticmethod
+    def _unpack(ans: list[Any], batch_mode: bool) -> Any:
         if not batch_mode:
             if len(ans) > 1:
                 raise MinosProtocolException(
@@ -89,23 +176,111 @@ class MinosAvroProtocol(MinosBinaryProtocol):
 
         return ans
 
-    # noinspection PyUnusedLocal
     @classmethod
-    def decode_schema(cls, data: bytes, *args, **kwargs) -> Union[dict[str, Any], list[dict[str, Any]]]:
-        """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
+    async def encode_with_registry(
+        cls, value: Any, schema: Any, registry: AvroSchemaRegistry, *args, batch_mode: bool = False, **kwargs
+    ) -> bytes:
+        """Encode the given value using the schema registry wire format.
+
+        Instead of an object container file with the whole schema on its header, the encoded value is composed by a
+        magic byte, the 64-bit fingerprint of the schema (that is stored on the registry) and the schemaless records.
+
+        :param value: The data to be stored.
+        :param schema: The schema relative to the data.
+        :param registry: The schema registry.
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+        single model.
+        :param kwargs: Additional named arguments.
+        :return: A bytes object.
+        """
+        if not batch_mode:
+            value = [value]
+
+        if not isinstance(schema, list):
+            schema = [schema]
 
-        :param data: A bytes object.
+        try:
+            raw_schema = cls._parse_schema(schema)
+            fingerprint = await registry.register(cls._clean_parsed_schema(raw_schema))
+
+            with io.BytesIO() as file:
+                file.write(REGISTRY_MAGIC_BYTE)
+                file.write(fingerprint.to_bytes(REGISTRY_FINGERPRINT_SIZE, "big"))
+                for item in value:
+                    schemaless_writer(file, raw_schema, item)
+                content = file.getvalue()
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+
+        return content
+
+    @classmethod
+    async def decode_with_registry(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+        registry: AvroSchemaRegistry,
+        *args,
+        batch_mode: bool = False,
+        **kwargs,
+    ) -> Any:
+        """Decode the given bytes of data, encoded with the schema registry wire format.
+
+        :param data: A bytes-like object.
+        :param registry: The schema registry.
         :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+        single model.
         :param kwargs: Additional named arguments.
-        :return: A tuple or a list of tuples.
+        :return: A dictionary or a list of dictionaries.
         """
+        schema = await cls.decode_schema_with_registry(data, registry)
 
         try:
+            raw_schema = cls._parse_schema([schema])
             with io.BytesIO(data) as file:
-                r = reader(file)
-                schema = r.writer_schema
-
+                file.seek(len(REGISTRY_MAGIC_BYTE) + REGISTRY_FINGERPRINT_SIZE)
+                ans = list()
+                while file.tell() < len(data):
+                    ans.append(schemaless_reader(file, raw_schema))
         except Exception as exc:
-            raise MinosProtocolException(f"Error getting avro schema: {exc}")
+            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
 
-        return schema
+        if not batch_mode:
+            if len(ans) != 1:
+                raise MinosProtocolException(
+                    f"The 'batch_mode' argument was set to {False!r} but data does not contain a single value: {ans!r}"
+                )
+            ans = ans[0]
+
+        return ans
+
+    @staticmethod
+    def is_registry_encoded(data: Union[bytes, bytearray, memoryview]) -> bool:
+        """Check if the given bytes of data are encoded with the schema registry wire format.
+
+        :param data: A bytes-like object.
+        :return: ``True`` if the data starts with the schema registry magic byte or ``False`` otherwise.
+        """
+        return bytes(memoryview(data)[0 : len(REGISTRY_MAGIC_BYTE)]) == REGISTRY_MAGIC_BYTE
+
+    @classmethod
+    async def decode_schema_with_registry(
+        cls, data: Union[bytes, bytearray, memoryview], registry: AvroSchemaRegistry, *args, **kwargs
+    ) -> Any:
+        """Decode the schema of the given bytes of data, encoded with the schema registry wire format.
+
+        :param data: A bytes-like object.
+        :param registry: The schema registry.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: The schema.
+        """
+        if not cls.is_registry_encoded(data):
+            raise MinosProtocolException("The given data is not encoded with the schema registry wire format.")
+
+        start = len(REGISTRY_MAGIC_BYTE)
+        end = start + REGISTRY_FINGERPRINT_SIZE
+        fingerprint = int.from_bytes(memoryview(data)[start:end], "big")
+
+        return await registry.get(fingerprint)
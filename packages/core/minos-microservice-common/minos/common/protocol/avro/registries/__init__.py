@@ -0,0 +1,9 @@
+from .abc import (
+    AvroSchemaRegistry,
+)
+from .memory import (
+    InMemoryAvroSchemaRegistry,
+)
+from .pg import (
+    PostgreSqlAvroSchemaRegistry,
+)
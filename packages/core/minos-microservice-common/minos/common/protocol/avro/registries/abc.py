@@ -0,0 +1,81 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Any,
+)
+
+import orjson
+from fastavro.schema import (
+    fingerprint,
+)
+
+from ....setup import (
+    MinosSetup,
+)
+
+FINGERPRINT_CACHE_MAXSIZE = 1024
+
+
+class AvroSchemaRegistry(ABC, MinosSetup):
+    """Avro Schema Registry base class.
+
+    The registry stores schemas indexed by their 64-bit fingerprint, so that encoded values only need to carry the
+    fingerprint instead of the whole schema. Known schemas are also kept in memory to avoid round trips.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._schemas = dict()
+
+    async def register(self, schema: Any) -> int:
+        """Register a schema.
+
+        :param schema: The schema to be registered.
+        :return: The fingerprint of the schema.
+        """
+        fingerprint_ = self.fingerprint(schema)
+        if fingerprint_ not in self._schemas:
+            await self._register(fingerprint_, schema)
+            self._schemas[fingerprint_] = schema
+        return fingerprint_
+
+    @abstractmethod
+    async def _register(self, fingerprint_: int, schema: Any) -> None:
+        raise NotImplementedError
+
+    async def get(self, fingerprint_: int) -> Any:
+        """Get a schema by fingerprint.
+
+        :param fingerprint_: The fingerprint of the schema.
+        :return: The schema.
+        """
+        if fingerprint_ not in self._schemas:
+            self._schemas[fingerprint_] = await self._get(fingerprint_)
+        return self._schemas[fingerprint_]
+
+    @abstractmethod
+    async def _get(self, fingerprint_: int) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    def fingerprint(schema: Any) -> int:
+        """Compute the fingerprint of the given schema.
+
+        The fingerprint is the ``CRC-64-AVRO`` of the canonical ``json`` representation of the schema (sorted keys and
+        without whitespaces). The full representation is used instead of the ``Parsing Canonical Form`` because the
+        latter discards the logical types, which are needed to rebuild the models.
+
+        :param schema: The schema.
+        :return: An unsigned 64-bit integer.
+        """
+        return _fingerprint_raw_schema(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_MAXSIZE)
+def _fingerprint_raw_schema(raw: bytes) -> int:
+    return int(fingerprint(raw.decode(), "CRC-64-AVRO"), 16)
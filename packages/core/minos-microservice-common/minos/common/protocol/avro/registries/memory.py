@@ -0,0 +1,20 @@
+from typing import (
+    Any,
+)
+
+from ....exceptions import (
+    MinosProtocolException,
+)
+from .abc import (
+    AvroSchemaRegistry,
+)
+
+
+class InMemoryAvroSchemaRegistry(AvroSchemaRegistry):
+    """In Memory Avro Schema Registry class."""
+
+    async def _register(self, fingerprint_: int, schema: Any) -> None:
+        """Schemas are already stored in memory by the base class."""
+
+    async def _get(self, fingerprint_: int) -> Any:
+        raise MinosProtocolException(f"There is not any schema identified by the {fingerprint_!r} fingerprint.")
@@ -0,0 +1,76 @@
+from typing import (
+    Any,
+)
+
+import orjson
+
+from ....database import (
+    PostgreSqlMigration,
+    PostgreSqlMinosDatabase,
+)
+from ....exceptions import (
+    MinosProtocolException,
+)
+from .abc import (
+    AvroSchemaRegistry,
+)
+
+
+class PostgreSqlAvroSchemaRegistry(PostgreSqlMinosDatabase, AvroSchemaRegistry):
+    """PostgreSql Avro Schema Registry class."""
+
+    @classmethod
+    def _from_config(cls, *args, config, **kwargs) -> AvroSchemaRegistry:
+        return cls(*args, **config.repository._asdict(), **kwargs)
+
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        return (_MIGRATION,)
+
+    async def _setup(self) -> None:
+        await self.migrate()
+
+    async def _register(self, fingerprint_: int, schema: Any) -> None:
+        params = {"fingerprint": _to_signed(fingerprint_), "schema": orjson.dumps(schema).decode()}
+        await self.submit_query(_INSERT_QUERY, params)
+
+    async def _get(self, fingerprint_: int) -> Any:
+        try:
+            row = await self.submit_query_and_fetchone(_SELECT_QUERY, {"fingerprint": _to_signed(fingerprint_)})
+        except StopAsyncIteration:
+            raise MinosProtocolException(f"There is not any schema identified by the {fingerprint_!r} fingerprint.")
+        return row[0]
+
+
+def _to_signed(value: int) -> int:
+    # PostgreSql does not support unsigned integers, so the fingerprint is stored as a signed 64-bit integer.
+    if value >= 1 << 63:
+        value -= 1 << 64
+    return value
+
+
+_CREATE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS avro_schema_registry (
+    fingerprint BIGINT PRIMARY KEY,
+    schema JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+""".strip()
+
+_MIGRATION = PostgreSqlMigration("avro_schema_registry", [[_CREATE_TABLE_QUERY]])
+
+_INSERT_QUERY = """
+INSERT INTO avro_schema_registry (fingerprint, schema)
+VALUES (%(fingerprint)s, %(schema)s)
+ON CONFLICT (fingerprint) DO NOTHING;
+""".strip()
+
+_SELECT_QUERY = """
+SELECT schema
+FROM avro_schema_registry
+WHERE fingerprint = %(fingerprint)s;
+""".strip()
@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    Union,
 )
 
 import orjson
@@ -24,10 +25,12 @@ class MinosJsonBinaryProtocol(MinosBinaryProtocol):
         return orjson.dumps(data)
 
     @classmethod
-    def decode(cls, data: bytes, *args, **kwargs) -> Any:
+    def decode(cls, data: Union[bytes, bytearray, memoryview, str], *args, **kwargs) -> Any:
         """Decodes the given bytes data.
 
-        :param data: bytes data to be decoded.
+        The data is parsed directly from the given buffer, so ``memoryview`` instances are not copied before decoding.
+
+        :param data: bytes-like data to be decoded.
         :return: De decoded data.
         """
         return orjson.loads(data)
@@ -7,6 +7,7 @@ from pathlib import (
 )
 from typing import (
     Any,
+    Union,
 )
 from uuid import (
     uuid4,
@@ -17,6 +18,61 @@ import aiopg
 from .configuration import (
     MinosConfig,
 )
+from .model import (
+    Model,
+    ModelCodec,
+)
+
+
+def remove_namespace_suffixes(schema: Any) -> Any:
+    """Remove the suffixes from the namespaces of the given avro schema, so that it can be compared with another one.
+
+    :param schema: The avro schema.
+    :return: The avro schema without namespace suffixes.
+    """
+    if isinstance(schema, list):
+        return [remove_namespace_suffixes(item) for item in schema]
+    if isinstance(schema, dict):
+        schema = {key: remove_namespace_suffixes(value) for key, value in schema.items()}
+        if schema.get("type") == "record" and "namespace" in schema:
+            schema["namespace"] = schema["namespace"].rpartition(".")[0]
+    return schema
+
+
+class FakeModelCodec(ModelCodec):
+    """Fake Model Codec class, that prefixes the ``avro`` representation of the models with a fixed header."""
+
+    name = "fake"
+
+    @staticmethod
+    def matches(raw: Union[bytes, bytearray, memoryview]) -> bool:
+        """Check if the given bytes were encoded with this codec.
+
+        :param raw: A bytes-like object.
+        :return: ``True`` if the bytes were encoded with this codec or ``False`` otherwise.
+        """
+        return bytes(memoryview(raw)[0:4]) == b"fake"
+
+    def _encode_one(self, model: Model) -> bytes:
+        return b"fake" + model.avro_bytes
+
+    def _encode_many(self, models: list[Model]) -> bytes:
+        return b"fake" + Model.to_avro_bytes(models)
+
+    def decode(self, raw, model_cls=Model, batch_mode=False, trusted=False):
+        """Decode a model, or a sequence of models, from bytes.
+
+        :param raw: A bytes-like object.
+        :param model_cls: The model class used to build the instances.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param trusted: If ``True`` the fields are not parsed nor validated again after being decoded.
+        :return: A single instance or a sequence of instances.
+        """
+        return model_cls.from_avro_bytes(bytes(memoryview(raw)[4:]), batch_mode=batch_mode, trusted=trusted)
+
+
+ModelCodec.register(FakeModelCodec)
 
 
 class PostgresAsyncTestCase(unittest.IsolatedAsyncioTestCase):
@@ -27,12 +83,14 @@ class PostgresAsyncTestCase(unittest.IsolatedAsyncioTestCase):
         self._config = MinosConfig(self.CONFIG_FILE_PATH)
 
         self._meta_repository_db = self._config.repository._asdict()
+        self._pop_replication(self._meta_repository_db)
 
         self._meta_broker_queue_db = self._config.broker.queue._asdict()
         self._meta_broker_queue_db.pop("records")
         self._meta_broker_queue_db.pop("retry")
 
         self._meta_snapshot_db = self._config.snapshot._asdict()
+        self._pop_replication(self._meta_snapshot_db)
 
         self._test_db = {"database": f"test_db_{self._uuid.hex}", "user": f"test_user_{self._uuid.hex}"}
 
@@ -50,6 +108,12 @@ class PostgresAsyncTestCase(unittest.IsolatedAsyncioTestCase):
             snapshot_user=self.snapshot_db["user"],
         )
 
+    @staticmethod
+    def _pop_replication(db: dict[str, Any]) -> None:
+        db.pop("replicas")
+        db.pop("replica_balancing")
+        db.pop("max_replication_lag")
+
     async def asyncSetUp(self):
         pairs = self._drop_duplicates(
             [
@@ -11,6 +11,7 @@ from uuid import (
 )
 
 from minos.common import (
+    CompactDeclarativeModel,
     DeclarativeModel,
     MinosModel,
     MissingSentinel,
@@ -188,3 +189,22 @@ class Status(str, Enum):
     PENDING = "pending"
     SUCCESS = "success"
     ERROR = "error"
+
+
+class CompactUser(CompactDeclarativeModel):
+    """For testing purposes."""
+
+    id: int
+    username: Optional[str]
+    tags: Optional[list[str]]
+
+    @staticmethod
+    def parse_username(value: Optional[str]) -> Optional[str]:
+        """For testing purposes."""
+        if value is None:
+            return None
+        return value.lower()
+
+    def validate_id(self, value: int) -> bool:
+        """For testing purposes."""
+        return value >= 0
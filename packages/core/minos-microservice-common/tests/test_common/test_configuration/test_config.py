@@ -4,6 +4,7 @@ from unittest.mock import (
 )
 
 from minos.common import (
+    CODECS,
     MinosConfig,
     MinosConfigException,
 )
@@ -78,6 +79,25 @@ class TestMinosConfig(unittest.TestCase):
         self.assertEqual("min0s", repository.password)
         self.assertEqual("localhost", repository.host)
         self.assertEqual(5432, repository.port)
+        self.assertEqual((), repository.replicas)
+        self.assertEqual("round-robin", repository.replica_balancing)
+        self.assertEqual(None, repository.max_replication_lag)
+
+    def test_config_repository_replicas(self):
+        config = MinosConfig(path=self.config_file_path, with_environment=False)
+        original = config._get
+        values = {
+            "repository.replicas": [{"host": "replica-1"}, {"host": "replica-2", "port": 5433}],
+            "repository.replica_balancing": "least-connections",
+            "repository.max_replication_lag": "2.5",
+        }
+
+        with patch.object(MinosConfig, "_get", side_effect=lambda key: values.get(key) or original(key)):
+            repository = config.repository
+
+        self.assertEqual(({"host": "replica-1"}, {"host": "replica-2", "port": 5433}), repository.replicas)
+        self.assertEqual("least-connections", repository.replica_balancing)
+        self.assertEqual(2.5, repository.max_replication_lag)
 
     def test_config_snapshot(self):
         config = MinosConfig(path=self.config_file_path, with_environment=False)
@@ -87,6 +107,7 @@ class TestMinosConfig(unittest.TestCase):
         self.assertEqual("min0s", snapshot.password)
         self.assertEqual("localhost", snapshot.host)
         self.assertEqual(5432, snapshot.port)
+        self.assertEqual((), snapshot.replicas)
 
     def test_config_discovery(self):
         config = MinosConfig(path=self.config_file_path, with_environment=False)
@@ -95,6 +116,17 @@ class TestMinosConfig(unittest.TestCase):
         self.assertEqual("localhost", discovery.host)
         self.assertEqual(8080, discovery.port)
 
+    def test_config_codecs(self):
+        config = MinosConfig(path=self.config_file_path, with_environment=False)
+        codecs = config.codecs
+        self.assertEqual("avro", codecs.default)
+        self.assertEqual("minos.common.testing.FakeModelCodec", codecs.repository)
+        self.assertEqual({"TicketAdded": "minos.common.testing.FakeModelCodec"}, codecs.topics)
+
+    def test_config_codecs_not_defined(self):
+        with patch("minos.common.MinosConfig._get", side_effect=MinosConfigException("")):
+            self.assertEqual(CODECS(default="avro", repository="avro", topics=dict()), self.config.codecs)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,3 +38,11 @@ class TestMinosConfigParameterized(unittest.TestCase):
         self.assertEqual("some-type", discovery.client)
         self.assertEqual("some-host", discovery.host)
         self.assertEqual(333, discovery.port)
+
+    def test_config_codecs(self):
+        config = MinosConfig(
+            path=self.config_file_path, codecs_default="minos.common.testing.FakeModelCodec", codecs_repository="avro"
+        )
+        codecs = config.codecs
+        self.assertEqual("minos.common.testing.FakeModelCodec", codecs.default)
+        self.assertEqual("avro", codecs.repository)
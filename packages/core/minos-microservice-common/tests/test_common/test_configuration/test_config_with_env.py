@@ -36,3 +36,10 @@ class TestMinosConfigWithEnvironment(unittest.TestCase):
         self.assertEqual("some-type", discovery.client)
         self.assertEqual("some-host", discovery.host)
         self.assertEqual("333", discovery.port)
+
+    @mock.patch.dict(os.environ, {"MINOS_CODECS_DEFAULT": "minos.common.testing.FakeModelCodec"})
+    @mock.patch.dict(os.environ, {"MINOS_CODECS_REPOSITORY": "avro"})
+    def test_config_codecs(self):
+        codecs = self.config.codecs
+        self.assertEqual("minos.common.testing.FakeModelCodec", codecs.default)
+        self.assertEqual("avro", codecs.repository)
@@ -1,12 +1,22 @@
 import sys
 import unittest
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 
 import aiopg
+from psycopg2 import (
+    IntegrityError,
+    ProgrammingError,
+)
 
 from minos.common import (
     DependencyInjector,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
     PostgreSqlPool,
+    QueryInstrumentation,
 )
 from minos.common.testing import (
     PostgresAsyncTestCase,
@@ -31,6 +41,14 @@ class TestPostgreSqlMinosDatabase(PostgresAsyncTestCase):
         async with PostgreSqlMinosDatabase(**self.repository_db) as database:
             self.assertIsInstance(database.pool, PostgreSqlPool)
 
+    async def test_pool_with_replicas(self):
+        database = PostgreSqlMinosDatabase(
+            **self.repository_db, replicas=[{"host": "localhost"}], max_replication_lag=2.5
+        )
+        async with database:
+            self.assertEqual(({"host": "localhost"},), database.pool.replicas)
+            self.assertEqual(2.5, database.pool.max_replication_lag)
+
     async def test_pool_with_dependency_injections(self):
         injector = DependencyInjector(self.config, postgresql_pool=PostgreSqlPool)
         await injector.wire(modules=[sys.modules[__name__]])
@@ -85,6 +103,44 @@ class TestPostgreSqlMinosDatabase(PostgresAsyncTestCase):
 
         self.assertEqual([(3,), (4,), (5,)], observed)
 
+    async def test_submit_query_and_iter_streaming_mode_true_with_fetch_size(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) SELECT generate_series(1, 5);")
+
+            iterable = database.submit_query_and_iter(
+                "SELECT * FROM foo WHERE id > %s ORDER BY id;", (1,), streaming_mode=True, fetch_size=2
+            )
+            observed = [v async for v in iterable]
+
+        self.assertEqual([(2,), (3,), (4,), (5,)], observed)
+
+    async def test_submit_query_and_iter_streaming_mode_true_break(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) SELECT generate_series(1, 5);")
+
+            iterable = database.submit_query_and_iter(
+                "SELECT * FROM foo ORDER BY id;", streaming_mode=True, fetch_size=2
+            )
+            observed = await iterable.__anext__()
+            await iterable.aclose()
+
+            self.assertEqual((1,), observed)
+            self.assertEqual((5,), await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;"))
+
+    async def test_submit_query_and_iter_read_only(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db, replicas=[{"host": "localhost"}]) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) VALUES (3), (4), (5);")
+
+            replica_pool = database.pool.replica_pools[0]
+            with patch.object(PostgreSqlPool, "select_replica", return_value=replica_pool) as mock:
+                observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo;", read_only=True)]
+
+        self.assertEqual([(3,), (4,), (5,)], observed)
+        self.assertEqual(1, mock.call_count)
+
     async def test_submit_query_and_iter_locked(self):
         async with PostgreSqlMinosDatabase(**self.repository_db) as database:
             await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
@@ -94,6 +150,182 @@ class TestPostgreSqlMinosDatabase(PostgresAsyncTestCase):
 
         self.assertEqual([(3,), (4,), (5,)], observed)
 
+    async def test_submit_many(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL, name TEXT);")
+            await database.submit_many(
+                "INSERT INTO foo (id, name) VALUES (%(id)s, %(name)s);",
+                ({"id": i, "name": f"n{i}"} for i in range(5)),
+                page_size=2,
+            )
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual([(i, f"n{i}") for i in range(5)], observed)
+
+    async def test_submit_many_rollback(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT PRIMARY KEY);")
+            with self.assertRaises(IntegrityError):
+                await database.submit_many("INSERT INTO foo (id) VALUES (%s);", [(1,), (2,), (1,)], page_size=1)
+
+            observed = await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        self.assertEqual((0,), observed)
+
+    async def test_copy_records(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL, data BYTEA, other TEXT);")
+            await database.copy_records("foo", ["id", "data"], [(i, bytes([i])) for i in range(5)], page_size=2)
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT id, data FROM foo ORDER BY id;")]
+
+        self.assertEqual([(i, bytes([i])) for i in range(5)], [(i, bytes(data)) for i, data in observed])
+
+    async def test_migrate(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(migration)
+            await database.submit_query("INSERT INTO foo (id) VALUES (1);")
+
+            observed = await database.submit_query_and_fetchone("SELECT name, version FROM minos_schema_version;")
+
+        self.assertEqual(("foo", 1), observed)
+
+    async def test_migrate_upgrade(self):
+        first = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        second = PostgreSqlMigration("foo", [*first.steps, ["ALTER TABLE foo ADD COLUMN name TEXT;"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(first)
+            await database.migrate(second)
+            await database.submit_query("INSERT INTO foo (id, name) VALUES (1, 'one');")
+
+            observed = await database.submit_query_and_fetchone("SELECT name, version FROM minos_schema_version;")
+
+        self.assertEqual(("foo", 2), observed)
+
+    async def test_migrate_up_to_date(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(migration)
+
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            with patch.object(PostgreSqlMinosDatabase, "locked_cursor") as mock:
+                await database.migrate(migration)
+
+        self.assertEqual(0, mock.call_count)
+
+    async def test_migrate_cached(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(migration)
+
+            with patch.object(PostgreSqlMinosDatabase, "cursor") as mock:
+                await database.migrate(migration)
+
+            self.assertEqual({migration}, database.pool.checked_migrations)
+
+        self.assertEqual(0, mock.call_count)
+
+    async def test_migrate_cached_by_pool(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(migration)
+
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            with patch.object(PostgreSqlMinosDatabase, "cursor", wraps=database.cursor) as mock:
+                await database.migrate(migration)
+
+        self.assertEqual(1, mock.call_count)
+
+    async def test_migrate_rollback(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);", "SELECT * FROM bar;"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            with self.assertRaises(ProgrammingError):
+                await database.migrate(migration)
+
+            observed = await database.submit_query_and_fetchone("SELECT to_regclass('foo');")
+
+        self.assertEqual((None,), observed)
+
+    def test_instrumentation(self):
+        instrumentation = QueryInstrumentation()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=instrumentation)
+        self.assertEqual(instrumentation, database.instrumentation)
+
+    async def test_instrumentation_submit_query(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) VALUES (%s);", (1,), lock=1234)
+
+        self.assertEqual(2, hook.call_count)
+        first, second = (c.args[0] for c in hook.call_args_list)
+        self.assertEqual("CREATE TABLE foo (id INT NOT NULL);", first.fingerprint)
+        self.assertEqual("INSERT INTO foo (id) VALUES (?);", second.fingerprint)
+        self.assertLess(0, second.duration)
+        self.assertLess(0, second.pool_wait_time)
+        self.assertLess(0, second.lock_wait_time)
+        self.assertEqual(0, first.lock_wait_time)
+        self.assertFalse(second.failed)
+
+    async def test_instrumentation_submit_query_and_iter(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            query = "SELECT * FROM generate_series(1, %s);"
+            self.assertEqual(3, len([row async for row in database.submit_query_and_iter(query, (3,))]))
+            self.assertEqual(
+                5, len([row async for row in database.submit_query_and_iter(query, (5,), streaming_mode=True)])
+            )
+
+        self.assertEqual(
+            [("SELECT * FROM generate_series(?, ?);", 3), ("SELECT * FROM generate_series(?, ?);", 5)],
+            [(c.args[0].fingerprint, c.args[0].rows) for c in hook.call_args_list],
+        )
+
+    async def test_instrumentation_failed(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            with self.assertRaises(ProgrammingError):
+                await database.submit_query("SELECT * FROM foo;")
+
+        self.assertEqual(1, hook.call_count)
+        self.assertTrue(hook.call_args.args[0].failed)
+
+    async def test_instrumentation_submit_many(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            hook.reset_mock()
+            await database.submit_many("INSERT INTO foo (id) VALUES (%s);", ((i,) for i in range(5)), page_size=2)
+            await database.copy_records("foo", ["id"], ((i,) for i in range(3)))
+
+        self.assertEqual(
+            [("INSERT INTO foo (id) VALUES (?);", 5), ('COPY "foo" ("id") FROM STDIN', 3)],
+            [(c.args[0].fingerprint, c.args[0].rows) for c in hook.call_args_list],
+        )
+
+    async def test_instrumentation_cursor(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            async with database.cursor() as cursor:
+                await cursor.execute("SELECT 1;")
+            async with database.locked_cursor(1234) as cursor:
+                await cursor.execute("SELECT 1;")
+
+        self.assertEqual(2, hook.call_count)
+        first, second = (c.args[0] for c in hook.call_args_list)
+        self.assertEqual(None, first.fingerprint)
+        self.assertLess(0, first.duration)
+        self.assertLess(0, first.pool_wait_time)
+        self.assertEqual(None, second.fingerprint)
+        self.assertLess(0, second.lock_wait_time)
+
 
 if __name__ == "__main__":
     unittest.main()
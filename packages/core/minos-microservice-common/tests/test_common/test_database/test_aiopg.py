@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from aiopg import (
+    Cursor,
+)
+
+from minos.common import (
+    AiopgCursor,
+    PostgreSqlPool,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestAiopgCursor(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = PostgreSqlPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    async def test_delegation(self):
+        async with self.pool.acquire() as connection:
+            async with await self.pool.open_cursor(connection) as cursor:
+                self.assertIsInstance(cursor, AiopgCursor)
+                self.assertIsInstance(cursor.impl, Cursor)
+                self.assertEqual(connection, cursor.connection)
+
+                await cursor.execute("SELECT * FROM generate_series(1, 3);")
+                observed = [row async for row in cursor]
+
+        self.assertEqual([(1,), (2,), (3,)], observed)
+        self.assertTrue(cursor.closed)
+
+    async def test_executemany(self):
+        async with self.pool.acquire() as connection:
+            async with await self.pool.open_cursor(connection) as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL);")
+                with patch.object(Cursor, "execute", wraps=cursor.impl.execute) as execute_mock:
+                    await cursor.executemany("INSERT INTO foo (id) VALUES (%s);", [(i,) for i in range(5)], page_size=2)
+                await cursor.execute("SELECT * FROM foo ORDER BY id;")
+                observed = await cursor.fetchall()
+
+        self.assertEqual([(i,) for i in range(5)], observed)
+        self.assertEqual(3, execute_mock.call_count)
+
+    async def test_copy_records(self):
+        async with self.pool.acquire() as connection:
+            async with await self.pool.open_cursor(connection) as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL, name TEXT);")
+                with patch.object(Cursor, "execute", wraps=cursor.impl.execute) as execute_mock:
+                    await cursor.copy_records("foo", ["id", "name"], [(i, f"n{i}") for i in range(5)], page_size=2)
+                await cursor.execute("SELECT * FROM foo ORDER BY id;")
+                observed = await cursor.fetchall()
+
+        self.assertEqual([(i, f"n{i}") for i in range(5)], observed)
+        self.assertEqual(3, execute_mock.call_count)
+
+    async def test_stream(self):
+        async with self.pool.acquire() as connection:
+            async with await self.pool.open_cursor(connection) as cursor:
+                iterable = cursor.stream("SELECT * FROM generate_series(1, 5) AS s(id) WHERE id > %s;", (1,), 2)
+                observed = [row async for row in iterable]
+
+        self.assertEqual([(2,), (3,), (4,), (5,)], observed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,437 @@
+import sys
+import unittest
+from asyncio import (
+    wait_for,
+)
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+from uuid import (
+    uuid4,
+)
+
+import asyncpg
+from psycopg2 import (
+    IntegrityError,
+)
+from psycopg2.extras import (
+    Json,
+)
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+    Literal,
+    Placeholder,
+)
+
+from minos.common import (
+    AsyncPgConnection,
+    AsyncPgCursor,
+    AsyncPgLockPool,
+    AsyncPgPool,
+    DependencyInjector,
+    PostgreSqlLock,
+    PostgreSqlMigration,
+    PostgreSqlMinosDatabase,
+    QueryInstrumentation,
+)
+from minos.common.database.asyncpg import (
+    count_statements,
+    translate_query,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestAsyncPgPool(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = AsyncPgPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    def test_from_config(self):
+        self.assertEqual(self.config.repository.database, self.pool.database)
+        self.assertEqual(self.config.repository.user, self.pool.user)
+        self.assertEqual(self.config.repository.password, self.pool.password)
+        self.assertEqual(self.config.repository.host, self.pool.host)
+        self.assertEqual(self.config.repository.port, self.pool.port)
+        self.assertEqual(1024, self.pool.statement_cache_size)
+
+    async def test_acquire(self):
+        async with self.pool.acquire() as c1:
+            self.assertIsInstance(c1, AsyncPgConnection)
+        async with self.pool.acquire() as c2:
+            self.assertEqual(c1, c2)
+
+    async def test_open_cursor(self):
+        async with self.pool.acquire() as connection:
+            cursor = await self.pool.open_cursor(connection)
+            self.assertIsInstance(cursor, AsyncPgCursor)
+
+    async def test_acquire_with_connection_error(self):
+        executed = [False]
+        original = asyncpg.connect
+
+        async def _side_effect(*args, **kwargs):
+            if not executed[0]:
+                executed[0] = True
+                raise ConnectionRefusedError
+            return await original(*args, **kwargs)
+
+        with patch("asyncpg.connect", side_effect=_side_effect):
+            async with self.pool.acquire() as connection:
+                self.assertIsInstance(connection, AsyncPgConnection)
+
+
+class TestAsyncPgLockPool(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = AsyncPgLockPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    async def test_acquire(self):
+        async with self.pool.acquire("foo") as lock:
+            self.assertIsInstance(lock, PostgreSqlLock)
+            self.assertEqual("foo", lock.key)
+            self.assertIsInstance(self.pool.lock_manager._connection, AsyncPgConnection)
+
+
+class TestAsyncPgCursor(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = AsyncPgPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    async def test_execute(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL);")
+                await cursor.execute("INSERT INTO foo (id) VALUES (%s), (%s), (%s);", (3, 4, 5))
+                await cursor.execute("SELECT * FROM foo WHERE id >= %(id)s ORDER BY id;", {"id": 4})
+
+                self.assertEqual((4,), await cursor.fetchone())
+                self.assertEqual([(5,)], await cursor.fetchall())
+                self.assertEqual(None, await cursor.fetchone())
+
+        self.assertTrue(cursor.closed)
+
+    async def test_execute_iter(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT * FROM generate_series(1, 3);")
+                observed = [row async for row in cursor]
+
+        self.assertEqual([(1,), (2,), (3,)], observed)
+
+    async def test_execute_multiple_statements(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL); INSERT INTO foo (id) VALUES (3);")
+                await cursor.execute("SELECT * FROM foo;")
+                observed = await cursor.fetchall()
+
+        self.assertEqual([(3,)], observed)
+
+    async def test_execute_multiple_statements_in_transaction(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                async with cursor.begin():
+                    await cursor.execute("CREATE TABLE foo (id INT NOT NULL); INSERT INTO foo (id) VALUES (3);")
+                await cursor.execute("SELECT * FROM foo;")
+                observed = await cursor.fetchall()
+
+        self.assertEqual([(3,)], observed)
+
+    async def test_execute_semicolon_literal(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT 'foo;bar'; -- one; two")
+                observed = await cursor.fetchall()
+
+        self.assertEqual([("foo;bar",)], observed)
+
+    async def test_execute_raises_syntax_error(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                with patch.object(asyncpg.Connection, "execute") as execute_mock:
+                    with self.assertRaises(asyncpg.PostgresSyntaxError):
+                        await cursor.execute("SELEC 1;")
+
+        self.assertEqual(0, execute_mock.call_count)
+
+    async def test_execute_composable(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                query = SQL("SELECT {value}, {name} FROM {table} WHERE {column} IN %(names)s;").format(
+                    value=Literal("it's"),
+                    name=Placeholder("name"),
+                    table=Identifier("pg_catalog", "pg_type"),
+                    column=Identifier("typname"),
+                )
+                await cursor.execute(query, {"name": "foo", "names": ("uuid", "bytea"), "ignored": 1})
+                observed = await cursor.fetchall()
+
+        self.assertEqual([("it's", "foo"), ("it's", "foo")], observed)
+
+    async def test_execute_tuple_parameter(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT * FROM generate_series(1, 5) AS s(id) WHERE id IN %s;", ((2, 4),))
+                observed = await cursor.fetchall()
+
+        self.assertEqual([(2,), (4,)], observed)
+
+    async def test_execute_types(self):
+        uuid = uuid4()
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (uuid UUID, data BYTEA, content JSONB, other JSON);")
+                await cursor.execute(
+                    "INSERT INTO foo VALUES (%(uuid)s, %(data)s, %(content)s, %(other)s)",
+                    {"uuid": uuid, "data": b"bar", "content": Json({"one": [1, 2]}), "other": '{"two": 2}'},
+                )
+                await cursor.execute("SELECT * FROM foo;")
+                observed = await cursor.fetchone()
+
+        self.assertEqual((uuid, b"bar", {"one": [1, 2]}, {"two": 2}), observed)
+
+    async def test_execute_raises_integrity_error(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT PRIMARY KEY);")
+                await cursor.execute("INSERT INTO foo (id) VALUES (%s);", (1,))
+                with self.assertRaises(IntegrityError):
+                    await cursor.execute("INSERT INTO foo (id) VALUES (%s);", (1,))
+
+    async def test_begin(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL);")
+                with self.assertRaises(ValueError):
+                    async with cursor.begin():
+                        await cursor.execute("INSERT INTO foo (id) VALUES (%s);", (1,))
+                        raise ValueError
+                await cursor.execute("SELECT COUNT(*) FROM foo;")
+                observed = await cursor.fetchone()
+
+        self.assertEqual((0,), observed)
+
+    async def test_listen(self):
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(SQL("LISTEN {}").format(Identifier("Foo")))
+                await cursor.execute(SQL("NOTIFY {}, 'bar'").format(Identifier("Foo")))
+                notify = await wait_for(connection.notifies.get(), 1)
+                await cursor.execute("UNLISTEN *;")
+
+        self.assertEqual(("Foo", "bar"), (notify.channel, notify.payload))
+
+
+class TestPostgreSqlMinosDatabaseWithAsyncPg(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.injector = DependencyInjector(self.config, postgresql_pool=AsyncPgPool)
+        await self.injector.wire(modules=[sys.modules[__name__]])
+
+    async def asyncTearDown(self):
+        await self.injector.unwire()
+        await super().asyncTearDown()
+
+    async def test_pool(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            self.assertIsInstance(database.pool, AsyncPgPool)
+
+    async def test_submit_query_and_iter(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) VALUES (3), (4), (5);")
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo;", streaming_mode=True)]
+
+        self.assertEqual([(3,), (4,), (5,)], observed)
+
+    async def test_submit_query_and_iter_streaming_mode_true_with_fetch_size(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) SELECT generate_series(1, 5);")
+
+            iterable = database.submit_query_and_iter(
+                "SELECT * FROM foo WHERE id > %s ORDER BY id;", (1,), streaming_mode=True, fetch_size=2
+            )
+            observed = [v async for v in iterable]
+
+        self.assertEqual([(2,), (3,), (4,), (5,)], observed)
+
+    async def test_submit_query_and_iter_streaming_mode_true_break(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_query("INSERT INTO foo (id) SELECT generate_series(1, 5);")
+
+            iterable = database.submit_query_and_iter(
+                "SELECT * FROM foo ORDER BY id;", streaming_mode=True, fetch_size=2
+            )
+            observed = await iterable.__anext__()
+            await iterable.aclose()
+
+            self.assertEqual((1,), observed)
+            self.assertEqual((5,), await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;"))
+
+    async def test_submit_query_and_fetchone_locked(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);", lock=1234)
+            await database.submit_query("INSERT INTO foo (id) VALUES (%s);", (3,), lock=1234)
+
+            observed = await database.submit_query_and_fetchone("SELECT * FROM foo;", lock=1234)
+
+        self.assertEqual((3,), observed)
+
+    async def test_submit_many(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL, name TEXT);")
+            await database.submit_many(
+                "INSERT INTO foo (id, name) VALUES (%(id)s, %(name)s);",
+                [{"id": 1, "name": "one"}, {"id": 2, "name": None}, {"id": 3, "name": "three"}],
+            )
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual([(1, "one"), (2, None), (3, "three")], observed)
+
+    async def test_submit_many_rollback(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT PRIMARY KEY);")
+            with self.assertRaises(IntegrityError):
+                await database.submit_many("INSERT INTO foo (id) VALUES (%s);", [(1,), (2,), (1,)])
+
+            observed = await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        self.assertEqual((0,), observed)
+
+    async def test_copy_records(self):
+        uuid = uuid4()
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL, uuid UUID, other TEXT);")
+            await database.copy_records("foo", ["id", "uuid"], [(i, uuid) for i in range(5)])
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT id, uuid FROM foo ORDER BY id;")]
+
+        self.assertEqual([(i, uuid) for i in range(5)], observed)
+
+    async def test_migrate(self):
+        migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT NOT NULL);"]])
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.migrate(migration)
+            await database.submit_query("INSERT INTO foo (id) VALUES (1);")
+
+            observed = await database.submit_query_and_fetchone("SELECT name, version FROM minos_schema_version;")
+
+        self.assertEqual(("foo", 1), observed)
+
+    async def test_instrumentation(self):
+        hook = MagicMock()
+        database = PostgreSqlMinosDatabase(**self.repository_db, instrumentation=QueryInstrumentation([hook]))
+        async with database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_many("INSERT INTO foo (id) VALUES (%s);", ((i,) for i in range(5)))
+            await database.copy_records("foo", ["id"], ((i,) for i in range(3)))
+            observed = [row async for row in database.submit_query_and_iter("SELECT * FROM foo;", streaming_mode=True)]
+
+        self.assertEqual(8, len(observed))
+        self.assertEqual(
+            [
+                ("CREATE TABLE foo (id INT NOT NULL);", None),
+                ("INSERT INTO foo (id) VALUES (?);", 5),
+                ('COPY "foo" ("id") FROM STDIN', 3),
+                ("SELECT * FROM foo;", 8),
+            ],
+            [(c.args[0].fingerprint, c.args[0].rows) for c in hook.call_args_list],
+        )
+
+
+class TestQueryTranslation(unittest.TestCase):
+    def test_count_statements(self):
+        self.assertEqual(0, count_statements(""))
+        self.assertEqual(1, count_statements("SELECT 1;"))
+        self.assertEqual(2, count_statements("SELECT 1; SELECT 2;"))
+        self.assertEqual(1, count_statements("SELECT ';', E'\\';', \"a;b\" FROM foo;"))
+        self.assertEqual(1, count_statements("SELECT $$;$$, $tag$;$tag$; -- one; two"))
+        self.assertEqual(1, count_statements("/* one; two */ SELECT 1;"))
+
+    def test_translate_query_positional(self):
+        observed = translate_query("SELECT %s, '%%' WHERE id = %s;", ("foo", "bar"))
+        self.assertEqual(("SELECT $1, '%' WHERE id = $2;", ["foo", "bar"]), observed)
+
+    def test_translate_query_named(self):
+        observed = translate_query("SELECT %(a)s, %(b)s, %(a)s;", {"a": "foo", "b": "bar", "c": "baz"})
+        self.assertEqual(("SELECT $1, $2, $1;", ["foo", "bar"]), observed)
+
+    def test_translate_query_tuples(self):
+        self.assertEqual(
+            ("SELECT $1 WHERE id IN ($2, $3);", ["a", "b", "c"]),
+            translate_query("SELECT %s WHERE id IN %s;", ("a", ("b", "c"))),
+        )
+        self.assertEqual(
+            ("SELECT $1 WHERE id IN ($2, $3);", ["a", "b", "c"]),
+            translate_query("SELECT %(a)s WHERE id IN %(b)s;", {"a": "a", "b": ("b", "c")}),
+        )
+
+    def test_translate_query_casts(self):
+        uuid = uuid4()
+        observed = translate_query(
+            "SELECT %(a)s, %(b)s, %(c)s, %(d)s, %(e)s, %(a)s;",
+            {"a": uuid, "b": 3, "c": 2**40, "d": b"foo", "e": True},
+        )
+        expected = (
+            "SELECT $1::uuid, $2::integer, $3::bigint, $4::bytea, $5::boolean, $1::uuid;",
+            [uuid, 3, 2**40, b"foo", True],
+        )
+        self.assertEqual(expected, observed)
+
+    def test_translate_query_null(self):
+        observed = translate_query("SELECT %(a)s, %(b)s, %(c)s, %(b)s;", {"a": "foo", "b": None, "c": "bar"})
+        self.assertEqual(("SELECT $1, NULL, $2, NULL;", ["foo", "bar"]), observed)
+
+    def test_translate_query_json(self):
+        observed = translate_query("SELECT %s::jsonb;", (Json({"foo": "bar"}),))
+        self.assertEqual(("SELECT $1::jsonb;", ['{"foo": "bar"}']), observed)
+
+    def test_translate_query_without_parameters(self):
+        self.assertEqual(("SELECT '%s';", []), translate_query("SELECT '%s';"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import (
+    MagicMock,
+)
+
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
+
+from minos.common import (
+    QUERY_PERCENTILES,
+    QueryEvent,
+    QueryInstrumentation,
+    QueryMetrics,
+    QueryTrace,
+    fingerprint_query,
+)
+
+
+class TestFingerprintQuery(unittest.TestCase):
+    def test_str(self):
+        observed = fingerprint_query("SELECT *\n  FROM foo\n WHERE id = %(id)s AND name = 'bar' AND value > 3.5;")
+        self.assertEqual("SELECT * FROM foo WHERE id = ? AND name = ? AND value > ?;", observed)
+
+    def test_bytes(self):
+        observed = fingerprint_query(b"SELECT * FROM foo WHERE id = 1234;")
+        self.assertEqual("SELECT * FROM foo WHERE id = ?;", observed)
+
+    def test_composable(self):
+        observed = fingerprint_query(SQL("SELECT * FROM {table} WHERE id = %s").format(table=Identifier("foo")))
+        self.assertEqual('SELECT * FROM "foo" WHERE id = ?', observed)
+
+    def test_identifiers(self):
+        observed = fingerprint_query("SELECT t1.id FROM foo_2 AS t1 WHERE t1.uuid = $1;")
+        self.assertEqual("SELECT t1.id FROM foo_2 AS t1 WHERE t1.uuid = ?;", observed)
+
+    def test_comments(self):
+        observed = fingerprint_query("SELECT 1; -- one\n/* two */ SELECT 2;")
+        self.assertEqual("SELECT ?; SELECT ?;", observed)
+
+    def test_lists(self):
+        one = fingerprint_query("SELECT * FROM foo WHERE id IN (1, 2, 3);")
+        two = fingerprint_query("SELECT * FROM foo WHERE id IN (%s,%s);")
+        self.assertEqual("SELECT * FROM foo WHERE id IN (?);", one)
+        self.assertEqual(one, two)
+
+    def test_values(self):
+        observed = fingerprint_query("INSERT INTO foo (id, name) VALUES (1, 'one'), (2, 'two'), (3, 'three');")
+        self.assertEqual("INSERT INTO foo (id, name) VALUES (?);", observed)
+
+
+class TestQueryTrace(unittest.TestCase):
+    def test_build_event(self):
+        trace = QueryTrace()
+        trace.rows = 3
+        trace.pool_wait_time = 0.1
+        trace.lock_wait_time = 0.2
+
+        observed = trace.build_event("SELECT * FROM foo WHERE id = 1;", 0.5, failed=True)
+        self.assertEqual(QueryEvent("SELECT * FROM foo WHERE id = ?;", 0.5, 3, 0.1, 0.2, True), observed)
+
+    def test_build_event_without_operation(self):
+        observed = QueryTrace().build_event(None, 0.5)
+        self.assertEqual(QueryEvent(None, 0.5), observed)
+
+
+class TestQueryInstrumentation(unittest.TestCase):
+    def test_enabled(self):
+        instrumentation = QueryInstrumentation()
+        self.assertFalse(instrumentation.enabled)
+
+        hook = MagicMock()
+        instrumentation.add_hook(hook)
+        self.assertTrue(instrumentation.enabled)
+        self.assertEqual((hook,), instrumentation.hooks)
+
+        instrumentation.remove_hook(hook)
+        self.assertFalse(instrumentation.enabled)
+
+    def test_notify(self):
+        one, two = MagicMock(side_effect=ValueError), MagicMock()
+        instrumentation = QueryInstrumentation([one, two])
+        event = QueryEvent("SELECT ?;", 0.5)
+
+        with self.assertLogs("minos.common.database.instrumentation", "WARNING"):
+            instrumentation.notify(event)
+
+        self.assertEqual([((event,), {})], [tuple(c) for c in one.call_args_list])
+        self.assertEqual([((event,), {})], [tuple(c) for c in two.call_args_list])
+
+
+class TestQueryMetrics(unittest.TestCase):
+    def test_call(self):
+        metrics = QueryMetrics()
+        for i in range(1, 101):
+            metrics(QueryEvent("SELECT ?;", i / 100, rows=1, pool_wait_time=0.01, lock_wait_time=0.02))
+        metrics(QueryEvent("SELECT * FROM foo;", 0.5, failed=True))
+        metrics(QueryEvent(None, 0.5))
+
+        self.assertEqual(("SELECT ?;", "SELECT * FROM foo;"), metrics.fingerprints)
+        self.assertEqual({50: 0.5, 95: 0.95, 99: 0.99}, metrics.get_percentiles("SELECT ?;"))
+
+        observed = metrics.as_dict()["SELECT ?;"]
+        self.assertEqual(100, observed["count"])
+        self.assertEqual(0, observed["failures"])
+        self.assertEqual(100, observed["rows"])
+        self.assertAlmostEqual(50.5, observed["duration_sum"])
+        self.assertAlmostEqual(1.0, observed["pool_wait_time_sum"])
+        self.assertAlmostEqual(2.0, observed["lock_wait_time_sum"])
+        self.assertEqual([0.5, 0.95, 0.99], [observed[f"p{p}"] for p in QUERY_PERCENTILES])
+
+        observed = metrics.as_dict()["SELECT * FROM foo;"]
+        self.assertEqual(1, observed["failures"])
+        self.assertEqual({50: 0.5, 95: 0.5, 99: 0.5}, metrics.get_percentiles("SELECT * FROM foo;"))
+
+    def test_window_size(self):
+        metrics = QueryMetrics(window_size=2)
+        for duration in (10, 1, 2):
+            metrics(QueryEvent("SELECT ?;", duration))
+
+        self.assertEqual({50: 1, 95: 2, 99: 2}, metrics.get_percentiles("SELECT ?;"))
+        self.assertEqual(3, metrics.as_dict()["SELECT ?;"]["count"])
+
+    def test_slow_query_threshold(self):
+        metrics = QueryMetrics(slow_query_threshold=0.5)
+
+        with self.assertLogs("minos.common.database.instrumentation", "WARNING") as cm:
+            metrics(QueryEvent("SELECT ?;", 0.1))
+            metrics(QueryEvent("SELECT * FROM foo;", 0.7))
+
+        self.assertEqual(1, len(cm.output))
+        self.assertIn("SELECT * FROM foo;", cm.output[0])
+
+    def test_reset(self):
+        metrics = QueryMetrics()
+        metrics(QueryEvent("SELECT ?;", 0.1))
+        metrics.reset()
+        self.assertEqual(tuple(), metrics.fingerprints)
+
+
+if __name__ == "__main__":
+    unittest.main()
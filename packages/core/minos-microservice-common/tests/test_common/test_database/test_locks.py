@@ -1,13 +1,21 @@
 import unittest
+from asyncio import (
+    create_task,
+    gather,
+    sleep,
+)
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
 
 import aiopg
-from aiopg import (
-    Cursor,
-)
 
 from minos.common import (
     Lock,
+    MinosLockException,
     PostgreSqlLock,
+    PostgreSqlLockManager,
 )
 from minos.common.testing import (
     PostgresAsyncTestCase,
@@ -17,36 +25,217 @@ from tests.utils import (
 )
 
 
-class TestPostgreSqlLock(PostgresAsyncTestCase):
+class _PostgreSqlLockManagerTestCase(PostgresAsyncTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
 
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.manager = PostgreSqlLockManager(self._connect, self._disconnect)
+
+    async def asyncTearDown(self):
+        await self.manager.close()
+        await super().asyncTearDown()
+
+    async def _connect(self):
+        return await aiopg.connect(**self.repository_db)
+
+    @staticmethod
+    async def _disconnect(connection):
+        await connection.close()
+
+    async def _count_locks(self) -> int:
+        async with aiopg.connect(**self.repository_db) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT COUNT(DISTINCT pid), COUNT(*) FROM pg_locks WHERE locktype = 'advisory';")
+                return await cursor.fetchone()
+
+    async def _try_lock(self, key: int) -> bool:
+        async with aiopg.connect(**self.repository_db) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT pg_try_advisory_lock(%s);", (key,))
+                (acquired,) = await cursor.fetchone()
+                if acquired:
+                    await cursor.execute("SELECT pg_advisory_unlock(%s);", (key,))
+        return acquired
+
+
+class TestPostgreSqlLock(_PostgreSqlLockManagerTestCase):
     def test_base(self):
         self.assertTrue(issubclass(PostgreSqlLock, Lock))
 
-    async def test_wrapped_connection(self):
-        wrapped_connection = aiopg.connect(**self.repository_db)
-        lock = PostgreSqlLock(wrapped_connection, "foo")
-        self.assertEqual(wrapped_connection, lock.wrapped_connection)
+    def test_manager(self):
+        lock = PostgreSqlLock(self.manager, "foo")
+        self.assertEqual(self.manager, lock.manager)
 
-    async def test_key(self):
-        wrapped_connection = aiopg.connect(**self.repository_db)
-        lock = PostgreSqlLock(wrapped_connection, "foo")
+    def test_key(self):
+        lock = PostgreSqlLock(self.manager, "foo")
         self.assertEqual("foo", lock.key)
 
-    async def test_key_raises(self):
-        wrapped_connection = aiopg.connect(**self.repository_db)
+    def test_key_raises(self):
         with self.assertRaises(ValueError):
-            PostgreSqlLock(wrapped_connection, [])
+            PostgreSqlLock(self.manager, [])
+
+    async def test_context_manager(self):
+        async with PostgreSqlLock(self.manager, "foo") as lock:
+            self.assertIsInstance(lock, PostgreSqlLock)
+            self.assertFalse(await self._try_lock(lock.hashed_key))
+
+        self.assertTrue(await self._try_lock(lock.hashed_key))
+
+
+class TestPostgreSqlLockManager(_PostgreSqlLockManagerTestCase):
+    async def test_acquire_release(self):
+        await self.manager.acquire(1234)
+        self.assertFalse(await self._try_lock(1234))
+
+        await self.manager.release(1234)
+        self.assertTrue(await self._try_lock(1234))
+
+    async def test_multiplexed(self):
+        for key in range(3):
+            await self.manager.acquire(key)
+
+        self.assertEqual((1, 3), await self._count_locks())
+
+        for key in range(3):
+            await self.manager.release(key)
+
+        self.assertEqual((0, 0), await self._count_locks())
+
+    async def test_coalesced(self):
+        observed = list()
+
+        async def _fn(name: str) -> None:
+            await self.manager.acquire(1234)
+            try:
+                observed.append(f"{name}-enter")
+                self.assertEqual((1, 1), await self._count_locks())
+                await sleep(0.05)
+                observed.append(f"{name}-exit")
+            finally:
+                await self.manager.release(1234)
+
+        await gather(_fn("one"), _fn("two"), _fn("three"))
+
+        self.assertEqual(
+            ["one-enter", "one-exit", "two-enter", "two-exit", "three-enter", "three-exit"],
+            observed,
+        )
+        self.assertEqual((0, 0), await self._count_locks())
+
+    async def test_acquire_waits_other_sessions(self):
+        async with aiopg.connect(**self.repository_db) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT pg_advisory_lock(%s);", (1234,))
+
+                task = create_task(self.manager.acquire(1234))
+                await sleep(0.1)
+                self.assertFalse(task.done())
+
+                await cursor.execute("SELECT pg_advisory_unlock(%s);", (1234,))
+
+        await task
+        self.assertFalse(await self._try_lock(1234))
+        await self.manager.release(1234)
+
+    async def test_reconnect(self):
+        await self.manager.acquire(1234)
+        await self.manager.release(1234)
+        await self.manager._connection.close()
+
+        await self.manager.acquire(1234)
+        self.assertFalse(await self._try_lock(1234))
+        await self.manager.release(1234)
+
+    async def test_reconnect_while_held(self):
+        await self.manager.acquire(1234)
+        await self.manager._connection.close()
+        self.assertTrue(await self._try_lock(1234))
+
+        with self.assertRaises(MinosLockException):
+            await self.manager.release(1234)
+
+        await self.manager.acquire(1234)
+        self.assertFalse(await self._try_lock(1234))
+        await self.manager.release(1234)
+        self.assertTrue(await self._try_lock(1234))
+
+    async def test_reconnect_while_held_by_other_key(self):
+        await self.manager.acquire(1234)
+        await self.manager._connection.close()
+
+        await self.manager.acquire(5678)
+        self.assertFalse(await self._try_lock(5678))
+        await self.manager.release(5678)
+
+        with self.assertRaises(MinosLockException):
+            await self.manager.release(1234)
+
+    async def test_reconnect_while_held_with_waiters(self):
+        await self.manager.acquire(1234)
+        task = create_task(self.manager.acquire(1234))
+        await sleep(0.1)
+        self.assertFalse(task.done())
+
+        await self.manager._connection.close()
+        with self.assertRaises(MinosLockException):
+            await self.manager.release(1234)
+
+        await task
+        self.assertFalse(await self._try_lock(1234))
+        await self.manager.release(1234)
+        self.assertTrue(await self._try_lock(1234))
+
+    async def test_connect_raises(self):
+        connect_mock = AsyncMock(return_value=None)
+        manager = PostgreSqlLockManager(connect_mock, self._disconnect, max_connection_attempts=2)
+
+        with self.assertRaises(MinosLockException):
+            await manager.acquire(1234)
+        self.assertEqual(2, connect_mock.call_count)
+        self.assertEqual(dict(), manager._entries)
+
+        with self.assertRaises(MinosLockException):
+            await manager.acquire(1234)
+        self.assertEqual(4, connect_mock.call_count)
+
+    async def test_reconnect_raises(self):
+        await self.manager.acquire(1234)
+        await self.manager.release(1234)
+        await self.manager._connection.close()
+
+        with patch.object(self.manager, "_connect", AsyncMock(return_value=None)):
+            with self.assertRaises(MinosLockException):
+                await self.manager.acquire(1234)
+
+        await self.manager.acquire(1234)
+        self.assertFalse(await self._try_lock(1234))
+        await self.manager.release(1234)
+
+    async def test_max_handovers(self):
+        self.manager.max_handovers = 1
+
+        async def _fn() -> None:
+            await self.manager.acquire(1234)
+            try:
+                self.assertFalse(await self._try_lock(1234))
+                await sleep(0.05)
+            finally:
+                await self.manager.release(1234)
 
-    async def test_hashed_key(self):
-        wrapped_connection = aiopg.connect(**self.repository_db)
-        lock = PostgreSqlLock(wrapped_connection, "foo")
-        self.assertEqual(hash("foo"), lock.hashed_key)
+        with patch.object(self.manager, "_submit", wraps=self.manager._submit) as submit_mock:
+            await gather(_fn(), _fn(), _fn())
 
-    async def test_cursor(self):
-        wrapped_connection = aiopg.connect(**self.repository_db)
-        async with PostgreSqlLock(wrapped_connection, "foo") as lock:
-            self.assertIsInstance(lock.cursor, Cursor)
+        self.assertEqual(
+            [
+                "SELECT pg_try_advisory_lock(%s);",
+                "SELECT pg_advisory_unlock(%s);",
+                "SELECT pg_try_advisory_lock(%s);",
+                "SELECT pg_advisory_unlock(%s);",
+            ],
+            [args[0] for args, _ in submit_mock.call_args_list],
+        )
+        self.assertEqual((0, 0), await self._count_locks())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+import unittest
+
+from minos.common import (
+    PostgreSqlMigration,
+)
+
+
+class TestPostgreSqlMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        self.migration = PostgreSqlMigration("foo", [["CREATE TABLE foo (id INT);"], ["ALTER TABLE foo ADD bar TEXT;"]])
+
+    def test_name(self):
+        self.assertEqual("foo", self.migration.name)
+
+    def test_steps(self):
+        self.assertEqual(
+            (("CREATE TABLE foo (id INT);",), ("ALTER TABLE foo ADD bar TEXT;",)),
+            self.migration.steps,
+        )
+
+    def test_version(self):
+        self.assertEqual(2, self.migration.version)
+
+    def test_get_pending_steps(self):
+        self.assertEqual(self.migration.steps, self.migration.get_pending_steps(0))
+        self.assertEqual((("ALTER TABLE foo ADD bar TEXT;",),), self.migration.get_pending_steps(1))
+        self.assertEqual(tuple(), self.migration.get_pending_steps(2))
+        self.assertEqual(tuple(), self.migration.get_pending_steps(3))
+
+    def test_eq(self):
+        self.assertEqual(PostgreSqlMigration("foo", self.migration.steps), self.migration)
+        self.assertNotEqual(PostgreSqlMigration("bar", self.migration.steps), self.migration)
+        self.assertNotEqual(PostgreSqlMigration("foo", self.migration.steps[:1]), self.migration)
+
+    def test_hash(self):
+        self.assertEqual(hash(PostgreSqlMigration("foo", self.migration.steps)), hash(self.migration))
+        self.assertEqual({self.migration}, {self.migration, PostgreSqlMigration("foo", self.migration.steps)})
+
+    def test_repr(self):
+        self.assertEqual("PostgreSqlMigration('foo', version=2)", repr(self.migration))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+from time import (
+    monotonic,
+)
 from unittest.mock import (
     PropertyMock,
     patch,
@@ -13,6 +16,7 @@ from psycopg2 import (
 )
 
 from minos.common import (
+    AiopgCursor,
     PostgreSqlLock,
     PostgreSqlLockPool,
     PostgreSqlPool,
@@ -53,6 +57,16 @@ class TestPostgreSqlPool(PostgresAsyncTestCase):
         async with self.pool.acquire() as c2:
             self.assertEqual(c1, c2)
 
+    async def test_open_cursor(self):
+        async with self.pool.acquire() as connection:
+            cursor = await self.pool.open_cursor(connection)
+            self.assertIsInstance(cursor, AiopgCursor)
+            await cursor.execute("SELECT 1;")
+            self.assertEqual([(1,)], await cursor.fetchall())
+            cursor.close()
+
+        self.assertTrue(cursor.closed)
+
     async def test_acquire_with_error(self):
         with patch("aiopg.Connection.isolation_level", new_callable=PropertyMock, side_effect=(OperationalError, None)):
             async with self.pool.acquire() as connection:
@@ -73,6 +87,113 @@ class TestPostgreSqlPool(PostgresAsyncTestCase):
                 self.assertIsInstance(connection, Connection)
 
 
+class TestPostgreSqlPoolWithReplicas(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = PostgreSqlPool.from_config(
+            self.config, replicas=[{"host": "localhost"}, {"host": "localhost", "port": "5432"}]
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            PostgreSqlPool.from_config(self.config, replica_balancing="foo")
+
+    def test_replica_pools(self):
+        self.assertEqual(2, len(self.pool.replica_pools))
+        for replica_pool in self.pool.replica_pools:
+            self.assertIsInstance(replica_pool, PostgreSqlPool)
+            self.assertEqual(self.pool.database, replica_pool.database)
+            self.assertEqual(self.pool.user, replica_pool.user)
+            self.assertEqual(self.pool.password, replica_pool.password)
+            self.assertEqual("localhost", replica_pool.host)
+            self.assertEqual(self.pool.port, replica_pool.port)
+
+    async def test_select_replica_without_replicas(self):
+        pool = PostgreSqlPool.from_config(self.config)
+        self.assertEqual(pool, await pool.select_replica())
+
+    async def test_select_replica_round_robin(self):
+        observed = [await self.pool.select_replica() for _ in range(4)]
+
+        expected = 2 * self.pool.replica_pools
+        self.assertEqual(expected, observed)
+
+    async def test_select_replica_least_connections(self):
+        self.pool.replica_balancing = "least-connections"
+        first, second = self.pool.replica_pools
+
+        async with first.acquire():
+            self.assertEqual(second, await self.pool.select_replica())
+        async with second.acquire():
+            self.assertEqual(first, await self.pool.select_replica())
+
+    async def test_select_replica_max_replication_lag(self):
+        self.pool.max_replication_lag = 5
+        first, second = self.pool.replica_pools
+
+        with patch.object(first, "get_replication_lag", return_value=10):
+            self.assertEqual(second, await self.pool.select_replica())
+            self.assertEqual(second, await self.pool.select_replica())
+
+        with patch.object(PostgreSqlPool, "get_replication_lag", return_value=10):
+            self.assertEqual(self.pool, await self.pool.select_replica())
+
+    async def test_select_replica_unreachable(self):
+        with patch.object(PostgreSqlPool, "get_replication_lag", return_value=None):
+            self.assertEqual(self.pool, await self.pool.select_replica())
+
+    async def test_get_replication_lag(self):
+        self.assertEqual(0, await self.pool.replica_pools[0].get_replication_lag())
+
+    async def test_get_replication_lag_cached(self):
+        replica_pool = self.pool.replica_pools[0]
+        with patch.object(PostgreSqlPool, "_fetch_replication_lag", return_value=3.5) as mock:
+            self.assertEqual(3.5, await replica_pool.get_replication_lag())
+            self.assertEqual(3.5, await replica_pool.get_replication_lag())
+
+        self.assertEqual(1, mock.call_count)
+
+    async def test_get_replication_lag_unreachable(self):
+        replica_pool = PostgreSqlPool.from_config(self.config, port=1)
+        try:
+            started_at = monotonic()
+            self.assertIsNone(await replica_pool.get_replication_lag())
+            self.assertLess(monotonic() - started_at, 0.5)
+        finally:
+            await replica_pool.close()
+
+    async def test_get_replication_lag_unreachable_backoff(self):
+        replica_pool = self.pool.replica_pools[0]
+        replica_pool.replica_check_interval = 0
+        with patch.object(PostgreSqlPool, "_fetch_replication_lag", side_effect=OperationalError) as mock:
+            self.assertIsNone(await replica_pool.get_replication_lag())
+            self.assertIsNone(await replica_pool.get_replication_lag())
+        self.assertEqual(1, mock.call_count)
+
+        replica_pool.replica_down_backoff = 0
+        with patch.object(PostgreSqlPool, "_fetch_replication_lag", return_value=3.5) as mock:
+            self.assertEqual(3.5, await replica_pool.get_replication_lag())
+            self.assertEqual(3.5, await replica_pool.get_replication_lag())
+        self.assertEqual(2, mock.call_count)
+
+    async def test_select_replica_unreachable_backoff(self):
+        first, second = self.pool.replica_pools
+        with patch.object(first, "_fetch_replication_lag", side_effect=OperationalError) as mock:
+            observed = [await self.pool.select_replica() for _ in range(4)]
+        self.assertEqual(4 * [second], observed)
+        self.assertEqual(1, mock.call_count)
+
+
 class TestPostgreSqlLockPool(PostgresAsyncTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
 
@@ -93,6 +214,10 @@ class TestPostgreSqlLockPool(PostgresAsyncTestCase):
             self.assertIsInstance(lock, PostgreSqlLock)
             self.assertEqual("foo", lock.key)
 
+    async def test_acquire_does_not_use_instances(self):
+        async with self.pool.acquire("foo"), self.pool.acquire("bar"):
+            self.assertEqual(0, len(self.pool._used))
+
 
 if __name__ == "__main__":
     unittest.main()
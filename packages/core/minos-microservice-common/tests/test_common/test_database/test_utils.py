@@ -0,0 +1,50 @@
+import unittest
+
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+    Literal,
+    Placeholder,
+)
+
+from minos.common import (
+    paginate,
+)
+from minos.common.database.utils import (
+    render_query,
+)
+
+
+class TestRenderQuery(unittest.TestCase):
+    def test_render_query(self):
+        query = SQL("SELECT {literal} FROM {table} WHERE {id} = {placeholder} AND name = {named};").format(
+            literal=Literal(3),
+            table=Identifier('f"oo'),
+            id=Identifier("id"),
+            placeholder=Placeholder(),
+            named=Placeholder("name"),
+        )
+        expected = 'SELECT 3 FROM "f""oo" WHERE "id" = %s AND name = %(name)s;'
+        self.assertEqual(expected, render_query(query))
+
+    def test_render_query_literal_str(self):
+        self.assertEqual("SELECT 'it''s';", render_query(SQL("SELECT {};").format(Literal("it's"))))
+
+    def test_render_query_raises(self):
+        with self.assertRaises(TypeError):
+            render_query(56)
+
+
+class TestPaginate(unittest.TestCase):
+    def test_paginate(self):
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], list(paginate(range(7), 3)))
+
+    def test_paginate_generator(self):
+        self.assertEqual([[0, 1], [2, 3]], list(paginate((i for i in range(4)), 2)))
+
+    def test_paginate_empty(self):
+        self.assertEqual([], list(paginate([], 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
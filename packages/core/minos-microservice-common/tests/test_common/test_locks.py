@@ -23,7 +23,20 @@ class TestLock(unittest.TestCase):
 
     def test_hashed_key(self):
         lock = FakeLock("foo")
-        self.assertEqual(hash("foo"), lock.hashed_key)
+        self.assertEqual(8359717351044633339, lock.hashed_key)
+
+    def test_hashed_key_int(self):
+        lock = FakeLock(1234)
+        self.assertEqual(1234, lock.hashed_key)
+
+    def test_hashed_key_bytes(self):
+        self.assertEqual(FakeLock("foo").hashed_key, FakeLock(b"foo").hashed_key)
+
+    def test_hashed_key_tuple(self):
+        lock = FakeLock(("foo", 1))
+        self.assertEqual(FakeLock(("foo", 1)).hashed_key, lock.hashed_key)
+        self.assertNotEqual(FakeLock(("foo", 2)).hashed_key, lock.hashed_key)
+        self.assertTrue(-(2**63) <= lock.hashed_key < 2**63)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+import unittest
+from typing import (
+    Any,
+)
+from unittest.mock import (
+    patch,
+)
+from uuid import (
+    uuid4,
+)
+
+import orjson
+
+from minos.common import (
+    MODEL_CODECS,
+    AvroModelCodec,
+    EmptyMinosModelSequenceException,
+    JsonModelCodec,
+    MinosImportException,
+    MinosMalformedAttributeException,
+    MinosModelException,
+    Model,
+    ModelCodec,
+    ModelType,
+    MultiTypeMinosModelSequenceException,
+)
+from minos.common.testing import (
+    FakeModelCodec,
+)
+from tests.model_classes import (
+    Auth,
+    Base,
+    Customer,
+    GenericUser,
+    ShoppingList,
+    User,
+)
+
+
+class _OtherAvroModelCodec(AvroModelCodec):
+    """For testing purposes."""
+
+
+class TestModelCodec(unittest.TestCase):
+    def test_model_codecs(self):
+        self.assertIs(AvroModelCodec, MODEL_CODECS["avro"])
+        self.assertIs(JsonModelCodec, MODEL_CODECS["json"])
+
+    def test_get_name(self):
+        self.assertEqual(AvroModelCodec(), ModelCodec.get("avro"))
+        self.assertEqual(JsonModelCodec(), ModelCodec.get("json"))
+
+    def test_get_classname(self):
+        self.assertEqual(FakeModelCodec(), ModelCodec.get("minos.common.testing.FakeModelCodec"))
+
+    def test_get_class(self):
+        self.assertEqual(AvroModelCodec(), ModelCodec.get(AvroModelCodec))
+
+    def test_get_instance(self):
+        codec = FakeModelCodec()
+        self.assertIs(codec, ModelCodec.get(codec))
+
+    def test_get_raises(self):
+        with self.assertRaises(MinosModelException):
+            ModelCodec.get("tests.model_classes.User")
+        with self.assertRaises(MinosImportException):
+            ModelCodec.get("foo.Bar")
+        with self.assertRaises(MinosModelException):
+            ModelCodec.get(_OtherAvroModelCodec)
+
+    def test_get_not_registered_raises(self):
+        with patch.dict(MODEL_CODECS):
+            MODEL_CODECS.pop(FakeModelCodec.name)
+            with self.assertRaises(MinosModelException):
+                ModelCodec.get("minos.common.testing.FakeModelCodec")
+            with self.assertRaises(MinosModelException):
+                ModelCodec.get(FakeModelCodec)
+            with self.assertRaises(MinosModelException):
+                ModelCodec.get(FakeModelCodec())
+            self.assertNotIn(FakeModelCodec.name, MODEL_CODECS)
+
+    def test_register(self):
+        with patch.dict(MODEL_CODECS):
+            MODEL_CODECS.pop(FakeModelCodec.name, None)
+            ModelCodec.register(FakeModelCodec)
+            ModelCodec.register(FakeModelCodec)
+            self.assertIs(FakeModelCodec, MODEL_CODECS[FakeModelCodec.name])
+
+    def test_register_raises(self):
+        with self.assertRaises(MinosModelException):
+            ModelCodec.register(_OtherAvroModelCodec)
+        self.assertIs(AvroModelCodec, MODEL_CODECS["avro"])
+        self.assertIs(JsonModelCodec, MODEL_CODECS["json"])
+
+    def test_detect(self):
+        model = User(1234)
+        with patch.dict(MODEL_CODECS):
+            MODEL_CODECS.pop(FakeModelCodec.name, None)
+            self.assertEqual(AvroModelCodec(), ModelCodec.detect(AvroModelCodec().encode(model)))
+            self.assertEqual(AvroModelCodec(), ModelCodec.detect(FakeModelCodec().encode(model)))
+        self.assertEqual(JsonModelCodec(), ModelCodec.detect(JsonModelCodec().encode(model)))
+        self.assertEqual(JsonModelCodec(), ModelCodec.detect(memoryview(JsonModelCodec().encode(model))))
+
+    def test_detect_registered(self):
+        model = User(1234)
+        codec = FakeModelCodec()
+        self.assertEqual(AvroModelCodec(), ModelCodec.detect(AvroModelCodec().encode(model)))
+        self.assertEqual(codec, ModelCodec.detect(codec.encode(model)))
+        self.assertEqual(codec, ModelCodec.detect(memoryview(codec.encode(model))))
+
+    def test_encode_raises(self):
+        with self.assertRaises(EmptyMinosModelSequenceException):
+            AvroModelCodec().encode([])
+        with self.assertRaises(MultiTypeMinosModelSequenceException):
+            AvroModelCodec().encode([User(1234), Base(5678)])
+
+    def test_repr(self):
+        self.assertEqual("AvroModelCodec()", repr(AvroModelCodec()))
+
+
+class TestAvroModelCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.codec = AvroModelCodec()
+
+    def test_name(self):
+        self.assertEqual("avro", AvroModelCodec.name)
+
+    def test_matches(self):
+        self.assertTrue(AvroModelCodec.matches(User(1234).avro_bytes))
+        self.assertFalse(AvroModelCodec.matches(FakeModelCodec().encode(User(1234))))
+
+    def test_encode(self):
+        model = User(1234)
+        self.assertEqual(model, User.from_avro_bytes(self.codec.encode(model)))
+
+    def test_decode(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual(model, self.codec.decode(self.codec.encode(model)))
+
+    def test_decode_batch_mode(self):
+        models = [User(1234), User(5678, "johndoe")]
+        self.assertEqual(models, self.codec.decode(self.codec.encode(models), User, batch_mode=True))
+
+
+class TestJsonModelCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.codec = JsonModelCodec()
+
+    def test_name(self):
+        self.assertEqual("json", JsonModelCodec.name)
+
+    def test_matches(self):
+        self.assertTrue(JsonModelCodec.matches(self.codec.encode(User(1234))))
+        self.assertFalse(JsonModelCodec.matches(User(1234).avro_bytes))
+        self.assertFalse(JsonModelCodec.matches(bytes()))
+
+    def test_matches_char_memoryview(self):
+        self.assertTrue(JsonModelCodec.matches(memoryview(self.codec.encode(User(1234))).cast("c")))
+
+    def test_decode(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual(model, self.codec.decode(self.codec.encode(model), ShoppingList))
+
+    def test_decode_trusted(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual(model, self.codec.decode(self.codec.encode(model), trusted=True))
+
+    def test_decode_buffer(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual(model, self.codec.decode(memoryview(self.codec.encode(model))))
+
+    def test_decode_char_memoryview(self):
+        model = User(1234)
+        self.assertEqual(model, self.codec.decode(memoryview(self.codec.encode(model)).cast("c"), User))
+
+    def test_decode_batch_mode(self):
+        models = [User(1234), User(5678, "johndoe")]
+        self.assertEqual(models, self.codec.decode(self.codec.encode(models), User, batch_mode=True))
+
+    def test_decode_dynamic(self):
+        model_type = ModelType.build("Foo", {"uuid": type(uuid4()), "values": dict[str, list[float]]})
+        model = model_type(uuid=uuid4(), values={"one": [1.0, 2.5]})
+        self.assertEqual(model, self.codec.decode(self.codec.encode(model)))
+
+    def test_encode_type_table_static(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual("tests.model_classes.ShoppingList", self._get_type_table(self.codec.encode(model)))
+
+    def test_encode_type_table_subclass(self):
+        model = ShoppingList(Customer(1234, name="john"), cost=3.5)
+        type_table = self._get_type_table(self.codec.encode(model))
+
+        self.assertEqual("tests.model_classes.ShoppingList", type_table[0])
+        self.assertEqual(["user"], list(type_table[1].keys()))
+
+        observed = self.codec.decode(self.codec.encode(model))
+        self.assertEqual(model, observed)
+        self.assertIsInstance(observed.user, Customer)
+
+    def test_encode_type_table_generic(self):
+        model = Auth(GenericUser("john"))
+        type_table = self._get_type_table(self.codec.encode(model))
+
+        self.assertEqual("tests.model_classes.Auth", type_table[0])
+        self.assertEqual(["user"], list(type_table[1].keys()))
+        self.assertEqual(model, self.codec.decode(self.codec.encode(model)))
+
+    @staticmethod
+    def _get_type_table(raw: bytes) -> Any:
+        end = 5 + int.from_bytes(raw[1:5], "big")
+        return orjson.loads(raw[5:end])
+
+    def test_decode_raises(self):
+        with self.assertRaises(MinosModelException):
+            self.codec.decode(User(1234).avro_bytes)
+
+    def test_encode_bytes_raises(self):
+        model_type = ModelType.build("Foo", {"content": bytes})
+        with self.assertRaises(MinosMalformedAttributeException):
+            self.codec.encode(model_type(content=bytes("foo", "utf-8")))
+
+    def test_encode_decode_equal_to_avro(self):
+        model = ShoppingList(User(1234), cost=3.5)
+        self.assertEqual(
+            AvroModelCodec().decode(AvroModelCodec().encode(model)), self.codec.decode(self.codec.encode(model))
+        )
+        self.assertIsInstance(self.codec.decode(self.codec.encode(model)), Model)
+
+
+if __name__ == "__main__":
+    unittest.main()
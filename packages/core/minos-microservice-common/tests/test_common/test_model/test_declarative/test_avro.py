@@ -1,4 +1,7 @@
 import unittest
+from typing import (
+    Union,
+)
 from unittest.mock import (
     call,
     patch,
@@ -8,11 +11,21 @@ from uuid import (
 )
 
 from minos.common import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
+    AvroSchemaDecoder,
+    AvroSchemaEncoder,
     EmptyMinosModelSequenceException,
+    InMemoryAvroSchemaRegistry,
+    MinosAvroProtocol,
+    MinosProtocolException,
     MissingSentinel,
     Model,
+    ModelType,
     MultiTypeMinosModelSequenceException,
 )
+from minos.common.testing import (
+    remove_namespace_suffixes,
+)
 from tests.model_classes import (
     Auth,
     Bar,
@@ -42,7 +55,7 @@ class TestModelAvro(MinosTestCase):
                                     {"name": "username", "type": ["string", "null"]},
                                 ],
                                 "name": "User",
-                                "namespace": "tests.model_classes.goodbye",
+                                "namespace": "tests.model_classes",
                                 "type": "record",
                             },
                             "null",
@@ -51,24 +64,22 @@ class TestModelAvro(MinosTestCase):
                     {"name": "cost", "type": "double"},
                 ],
                 "name": "ShoppingList",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, ShoppingList.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(ShoppingList.avro_schema))
 
     def test_avro_schema_generics(self):
         expected = [
             {
                 "fields": [{"name": "username", "type": ["string", "int"]}],
                 "name": "GenericUser",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, GenericUser.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(GenericUser.avro_schema))
 
     def test_avro_schema_generics_nested(self):
         expected = [
@@ -80,19 +91,18 @@ class TestModelAvro(MinosTestCase):
                             {
                                 "fields": [{"name": "username", "type": "string"}],
                                 "name": "GenericUser",
-                                "namespace": "tests.model_classes.goodbye",
+                                "namespace": "tests.model_classes",
                                 "type": "record",
                             }
                         ],
                     }
                 ],
                 "name": "Auth",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, Auth.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(Auth.avro_schema))
 
     def test_avro_schema_simple(self):
         customer = Customer(1234)
@@ -107,12 +117,11 @@ class TestModelAvro(MinosTestCase):
                     {"name": "lists", "type": [{"items": "int", "type": "array"}, "null"]},
                 ],
                 "name": "Customer",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, customer.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(customer.avro_schema))
 
     def test_avro_schema_multiple_fields(self):
         bar = Bar(first=Foo("one"), second=Foo("two"))
@@ -124,7 +133,7 @@ class TestModelAvro(MinosTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.hello",
+                            "namespace": "tests.model_classes",
                             "type": "record",
                         },
                     },
@@ -133,26 +142,46 @@ class TestModelAvro(MinosTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.goodbye",
+                            "namespace": "tests.model_classes",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "Bar",
-                "namespace": "tests.model_classes.one",
+                "namespace": "tests.model_classes",
                 "type": "record",
             }
         ]
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["one", "hello", "goodbye"]):
-            self.assertEqual(expected, bar.avro_schema)
+        self.assertEqual(expected, remove_namespace_suffixes(bar.avro_schema))
+
+        fields = bar.avro_schema[0]["fields"]
+        self.assertNotEqual(fields[0]["type"]["namespace"], fields[1]["type"]["namespace"])
+
+    def test_avro_schema_deterministic(self):
+        self.assertEqual(ShoppingList(User(1234)).avro_schema, ShoppingList(User(5678)).avro_schema)
+
+    def test_avro_schema_parameterized(self):
+        self.assertEqual(GenericUser("foo").avro_schema, GenericUser("bar").avro_schema)
+        self.assertNotEqual(GenericUser("foo").avro_schema, GenericUser(1234).avro_schema)
+
+    def test_avro_schema_cached(self):
+        self.assertIs(ShoppingList.avro_schema, ShoppingList.avro_schema)
+
+    def test_avro_schema_cached_union_order(self):
+        int_str = ModelType.build("foo.Bar", {"x": Union[int, str]})
+        str_int = ModelType.build("foo.Bar", {"x": Union[str, int]})
+
+        self.assertEqual(["int", "string"], int_str(x=1).avro_schema[0]["fields"][0]["type"])
+        self.assertEqual(["string", "int"], str_int(x=1).avro_schema[0]["fields"][0]["type"])
+        self.assertEqual(["int", "string"], int_str(x=1).avro_schema[0]["fields"][0]["type"])
 
     def test_encode_schema(self):
         user = User(1234)
         shopping_list = ShoppingList(user)
         with patch.object(ShoppingList, "encode_schema", return_value=MissingSentinel) as shopping_mock:
             with patch.object(User, "encode_schema", return_value=user.avro_schema) as user_mock:
-                shopping_list.avro_schema
+                AvroSchemaEncoder().build(shopping_list)
 
         encoder = shopping_mock.call_args_list[0].args[0]
 
@@ -229,17 +258,31 @@ class TestModelAvro(MinosTestCase):
     def test_decode_schema(self):
         user = User(1234)
         shopping_list = ShoppingList(user)
+        AvroSchemaDecoder._build_cached.cache_clear()
+
+        with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
+            # noinspection PyTypeChecker
+            Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
-                # noinspection PyTypeChecker
-                Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+        decoder = mock.call_args_list[0].args[0]
 
-            decoder = mock.call_args_list[0].args[0]
+        self.assertEqual(
+            [call(decoder, shopping_list.avro_schema[0]), call(decoder, user.avro_schema[0])], mock.call_args_list
+        )
 
-            self.assertEqual(
-                [call(decoder, shopping_list.avro_schema[0]), call(decoder, user.avro_schema[0])], mock.call_args_list
-            )
+    def test_decode_schema_cached(self):
+        shopping_list = ShoppingList(User(1234))
+        AvroSchemaDecoder._build_cached.cache_clear()
+
+        with patch.object(Model, "decode_schema", return_value=MissingSentinel) as mock:
+            # noinspection PyTypeChecker
+            Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+            self.assertEqual(2, mock.call_count)
+
+            mock.reset_mock()
+            # noinspection PyTypeChecker
+            Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+            self.assertEqual(0, mock.call_count)
 
     def test_decode_data(self):
         user = User(1234)
@@ -299,6 +342,31 @@ class TestModelAvro(MinosTestCase):
         base = Auth(GenericUser("foo"))
         self.assertEqual(base, Auth.from_avro_bytes(base.avro_bytes))
 
+    def test_from_avro_trusted(self):
+        shopping_list = ShoppingList(User(1234, "johndoe"), cost="1.234")
+        with patch.object(ShoppingList, "parse_cost", side_effect=ValueError) as parse_mock:
+            with patch.object(User, "validate_username", return_value=False) as validate_mock:
+                observed = ShoppingList.from_avro(shopping_list.avro_schema, shopping_list.avro_data, trusted=True)
+
+        self.assertEqual(shopping_list.avro_data, observed.avro_data)
+        self.assertEqual(0, parse_mock.call_count)
+        self.assertEqual(0, validate_mock.call_count)
+        self.assertFalse(IS_TRUSTED_MODEL_CONTEXT_VAR.get())
+
+    def test_from_avro_untrusted(self):
+        shopping_list = ShoppingList(User(1234, "johndoe"), cost="1.234")
+        with patch.object(User, "validate_username", return_value=False):
+            with self.assertRaises(Exception):
+                ShoppingList.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+
+    def test_from_avro_bytes_trusted(self):
+        customers = [Customer(1234), Customer(5678)]
+        avro_bytes = Customer.to_avro_bytes(customers)
+        with patch.object(Customer, "parse_name") as parse_mock:
+            decoded_customer = Customer.from_avro_bytes(avro_bytes, batch_mode=True, trusted=True)
+        self.assertEqual([c.avro_data for c in customers], [c.avro_data for c in decoded_customer])
+        self.assertEqual(0, parse_mock.call_count)
+
     def test_from_avro_str_single(self):
         customer = Customer(1234)
         avro_str = customer.avro_str
@@ -314,5 +382,54 @@ class TestModelAvro(MinosTestCase):
         self.assertEqual(customers, decoded_customer)
 
 
+class TestModelAvroWithRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = InMemoryAvroSchemaRegistry()
+
+    async def test_avro_bytes_with_registry(self):
+        shopping_list = ShoppingList(User(1234), cost=3.5)
+        observed = await shopping_list.avro_bytes_with_registry(self.registry)
+
+        self.assertTrue(MinosAvroProtocol.is_registry_encoded(observed))
+        self.assertLess(len(observed), len(shopping_list.avro_bytes))
+
+    async def test_from_avro_bytes_with_registry(self):
+        shopping_list = ShoppingList(User(1234), cost=3.5)
+        raw = await shopping_list.avro_bytes_with_registry(self.registry)
+
+        observed = await ShoppingList.from_avro_bytes_with_registry(raw, self.registry)
+        self.assertEqual(shopping_list, observed)
+
+    async def test_from_avro_bytes_with_registry_in_batch(self):
+        customers = [Customer(1234), Customer(5678)]
+        raw = await Customer.to_avro_bytes_with_registry(customers, self.registry)
+
+        observed = await Customer.from_avro_bytes_with_registry(raw, self.registry, batch_mode=True)
+        self.assertEqual(customers, observed)
+
+    async def test_from_avro_bytes_with_registry_trusted(self):
+        shopping_list = ShoppingList(User(1234), cost=3.5)
+        raw = await shopping_list.avro_bytes_with_registry(self.registry)
+
+        with patch.object(ShoppingList, "parse_cost", side_effect=ValueError) as mock:
+            observed = await ShoppingList.from_avro_bytes_with_registry(raw, self.registry, trusted=True)
+
+        self.assertEqual(shopping_list.avro_data, observed.avro_data)
+        self.assertEqual(0, mock.call_count)
+
+    async def test_from_avro_bytes_with_registry_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            await ShoppingList.from_avro_bytes_with_registry(ShoppingList(User(1234)).avro_bytes, self.registry)
+
+    async def test_to_avro_bytes_with_registry_empty_sequence(self):
+        with self.assertRaises(EmptyMinosModelSequenceException):
+            await Customer.to_avro_bytes_with_registry([], self.registry)
+
+    async def test_to_avro_bytes_with_registry_multi_type_sequence(self):
+        with self.assertRaises(MultiTypeMinosModelSequenceException):
+            await Customer.to_avro_bytes_with_registry([User(1234), Customer(5678)], self.registry)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from typing import (
     Optional,
+    Union,
 )
 
 from minos.common import (
@@ -12,6 +13,10 @@ from minos.common import (
     MinosTypeAttributeException,
     ModelType,
 )
+from minos.common.model.declarative import (
+    _get_class_type_hints,
+    _get_type_hints,
+)
 from tests.model_classes import (
     Analytics,
     Customer,
@@ -237,14 +242,12 @@ class TestDeclarativeModel(unittest.TestCase):
     def test_hash(self):
         user = User(123)
 
-        expected = hash(
-            (
-                Field("id", int, 123, validator=user.validate_id),
-                Field("username", Optional[str], parser=user.parse_username, validator=user.validate_username),
-            )
-        )
+        expected = hash((("id", 123), ("username", None)))
         self.assertEqual(expected, hash(user))
 
+    def test_hash_equal(self):
+        self.assertEqual(hash(User(123, "johndoe")), hash(User(123, "johndoe")))
+
     def test_repr(self):
         shopping_list = ShoppingList(User(1234), cost="1.234,56")
         expected = "ShoppingList(user=User(id=1234, username=None), cost=1234.56)"
@@ -285,6 +288,27 @@ class TestDeclarativeModel(unittest.TestCase):
         self.assertEqual(3, user.username)
         self.assertEqual(int, user.type_hints["username"])
 
+    def test_additional_type_hints_do_not_leak(self):
+        GenericUser(1, additional_type_hints={"username": int})
+        GenericUser("foo", additional_type_hints={"username": str})
+
+        self.assertEqual({"username": T}, GenericUser.type_hints)
+
+    def test_type_hints_cached(self):
+        self.assertIs(_get_class_type_hints(User), _get_class_type_hints(User))
+        self.assertIs(_get_type_hints(GenericUser, {"username": int}), _get_type_hints(GenericUser, {"username": int}))
+
+    def test_type_hints_cached_union_order(self):
+        self.assertEqual({"username": Union[int, str]}, _get_type_hints(GenericUser, {"username": Union[int, str]}))
+        observed = _get_type_hints(GenericUser, {"username": Union[str, int]})
+        self.assertEqual((str, int), observed["username"].__args__)
+
+    def test_field_hooks_cached(self):
+        model = Customer(1234, name="John", surname="Doe")
+        self.assertEqual(model.parse_name, model.fields["name"]._parser)
+        self.assertEqual(model.validate_username, model.fields["username"]._validator)
+        self.assertIsNone(model.fields["surname"]._validator)
+
 
 if __name__ == "__main__":
     unittest.main()
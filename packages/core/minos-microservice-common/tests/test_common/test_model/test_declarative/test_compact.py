@@ -0,0 +1,146 @@
+import pickle
+import unittest
+from copy import (
+    copy,
+)
+from typing import (
+    Optional,
+)
+from unittest.mock import (
+    patch,
+)
+
+from minos.common import (
+    CompactDeclarativeModel,
+    DeclarativeModel,
+    Field,
+    MinosAttributeValidationException,
+)
+from tests.model_classes import (
+    CompactUser,
+)
+
+
+class TestCompactDeclarativeModel(unittest.TestCase):
+    def test_subclass(self):
+        self.assertTrue(issubclass(CompactDeclarativeModel, DeclarativeModel))
+
+    def test_constructor(self):
+        model = CompactUser(123, "JohnDoe", ["foo"])
+        self.assertEqual(123, model.id)
+        self.assertEqual("johndoe", model.username)
+        self.assertEqual(["foo"], model.tags)
+
+    def test_constructor_without_fields(self):
+        with patch.object(Field, "__init__", return_value=None) as mock:
+            CompactUser(123, "JohnDoe", ["foo"])
+        self.assertEqual(0, mock.call_count)
+
+    def test_constructor_kwargs(self):
+        model = CompactUser(id=123, username=None)
+        self.assertEqual(123, model.id)
+        self.assertEqual(None, model.username)
+        self.assertEqual(None, model.tags)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(MinosAttributeValidationException):
+            CompactUser(-1, None, [])
+
+    def test_fields_not_stored(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        self.assertNotIn("_fields", vars(model))
+        self.assertEqual({"id": 123, "username": "johndoe", "tags": ["foo"]}, model.avro_data)
+        self.assertEqual(["id", "username", "tags"], list(model))
+        self.assertEqual(3, len(model))
+        self.assertEqual("CompactUser(id=123, username='johndoe', tags=['foo'])", repr(model))
+        self.assertEqual({"_field_table", "_values", "_Model__eq_reversing"}, set(vars(model)))
+
+    def test_field_table_shared(self):
+        one, two = CompactUser(123, "johndoe", []), CompactUser(456, "janedoe", [])
+        self.assertIs(one._field_table, two._field_table)
+
+    def test_fields(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        expected = {
+            "id": Field("id", int, 123, validator=model.validate_id),
+            "username": Field("username", Optional[str], "johndoe", parser=model.parse_username),
+            "tags": Field("tags", Optional[list[str]], ["foo"]),
+        }
+        self.assertEqual(expected, model.fields)
+        self.assertEqual(model.fields, expected)
+        self.assertEqual([123, "johndoe", ["foo"]], model._values)
+
+    def test_fields_view(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        field = model.fields["id"]
+        model.id = 456
+        self.assertEqual(456, field.value)
+
+    def test_fields_view_mutation(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        model.fields["username"].value = "JaneDoe"
+        self.assertEqual("janedoe", model.username)
+        self.assertEqual([123, "janedoe", ["foo"]], model._values)
+
+    def test_fields_view_mutation_raises(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        with self.assertRaises(MinosAttributeValidationException):
+            model.fields["id"].value = -1
+
+    def test_set_fields(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        table = model._field_table
+        model._fields |= CompactUser(456, "janedoe", []).fields
+        self.assertEqual(CompactUser(456, "janedoe", []), model)
+        self.assertIs(table, model._field_table)
+
+    def test_setattr(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        model.username = "JaneDoe"
+        self.assertEqual("janedoe", model.username)
+
+    def test_setattr_raises(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        with self.assertRaises(MinosAttributeValidationException):
+            model.id = -1
+        with self.assertRaises(AttributeError):
+            model.unknown = 1
+
+    def test_getattr_raises(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        with self.assertRaises(AttributeError):
+            model.unknown
+
+    def test_equal(self):
+        self.assertEqual(CompactUser(123, "johndoe", ["foo"]), CompactUser(123, "johndoe", ["foo"]))
+        self.assertNotEqual(CompactUser(123, "johndoe", ["foo"]), CompactUser(456, "johndoe", ["foo"]))
+
+    def test_equal_different_field_tables(self):
+        one, two = CompactUser(123, "johndoe", ["foo"]), CompactUser(123, "johndoe", ["foo"])
+        two._field_table = copy(two._field_table)
+        self.assertIsNot(one._field_table, two._field_table)
+        self.assertEqual(one, two)
+        self.assertEqual(two, one)
+
+    def test_hash(self):
+        model = CompactUser(123, "johndoe", None)
+        expected = hash(model)
+        self.assertIsNotNone(model.fields)
+        self.assertEqual(expected, hash(model))
+
+    def test_type_hints(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        observed = model.type_hints
+        self.assertEqual({"id": int, "username": Optional[str], "tags": Optional[list[str]]}, observed)
+
+    def test_avro_bytes(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        self.assertEqual(model, CompactUser.from_avro_bytes(model.avro_bytes))
+
+    def test_pickle(self):
+        model = CompactUser(123, "johndoe", ["foo"])
+        self.assertEqual(model, pickle.loads(pickle.dumps(model)))
+
+
+if __name__ == "__main__":
+    unittest.main()
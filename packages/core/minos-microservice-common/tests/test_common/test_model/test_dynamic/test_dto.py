@@ -2,15 +2,15 @@ import unittest
 from typing import (
     TypedDict,
 )
-from unittest.mock import (
-    patch,
-)
 
 from minos.common import (
     DataTransferObject,
     Field,
     ModelType,
 )
+from minos.common.testing import (
+    remove_namespace_suffixes,
+)
 from tests.model_classes import (
     Bar,
     Foo,
@@ -133,8 +133,7 @@ class TestDataTransferObject(unittest.IsolatedAsyncioTestCase):
         ]
         dto = DataTransferObject.from_avro(schema, {"price": 120})
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(schema, dto.avro_schema)
+        self.assertEqual(remove_namespace_suffixes(schema), remove_namespace_suffixes(dto.avro_schema))
 
     def test_classname(self):
         dto = DataTransferObject("Order", {}, namespace="example")
@@ -8,6 +8,7 @@ from unittest.mock import (
 )
 
 from minos.common import (
+    IS_TRUSTED_MODEL_CONTEXT_VAR,
     Field,
     MinosAttributeValidationException,
 )
@@ -40,6 +41,27 @@ class TestField(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(56, field.value)
 
+    def test_value_setter_trusted(self):
+        field = Field("test", int, 3, validator=lambda value: value > 0)
+        token = IS_TRUSTED_MODEL_CONTEXT_VAR.set(True)
+        try:
+            with patch("minos.common.AvroDataDecoder.build") as mock_build:
+                field.value = -56
+                self.assertEqual(0, mock_build.call_count)
+        finally:
+            IS_TRUSTED_MODEL_CONTEXT_VAR.reset(token)
+
+        self.assertEqual(-56, field.value)
+
+    def test_value_setter_trusted_missing(self):
+        token = IS_TRUSTED_MODEL_CONTEXT_VAR.set(True)
+        try:
+            field = Field("test", Optional[int])
+        finally:
+            IS_TRUSTED_MODEL_CONTEXT_VAR.reset(token)
+
+        self.assertEqual(None, field.value)
+
     def test_value_setter_update(self):
         field = Field("test", Optional[int], 3)
         self.assertEqual(3, field.value)
@@ -374,6 +374,32 @@ class TestAvroDataDecoder(MinosTestCase):
 
         self.assertEqual(raw, observed)
 
+    def test_compiled_cached(self):
+        # noinspection PyPep8Naming
+        Foo = ModelType.build("Foo", {"bar": list[Optional[int]]})
+        self.assertIs(AvroDataDecoder._compile(Foo), AvroDataDecoder._compile(Foo))
+        self.assertIs(AvroDataDecoder._compile(User), AvroDataDecoder._compile(User))
+
+    def test_compiled_union_order(self):
+        self.assertEqual(3, AvroDataDecoder(Union[int, float]).build(3.5))
+        self.assertEqual(3.5, AvroDataDecoder(Union[float, int]).build(3.5))
+
+    def test_compiled_reused(self):
+        # noinspection PyPep8Naming
+        Foo = ModelType.build("Foo", {"bar": list[Optional[int]]})
+        decoder = AvroDataDecoder(Foo)
+        self.assertEqual(Foo([1, None]), decoder.build({"bar": [1, None]}))
+        self.assertEqual(Foo([2]), decoder.build({"bar": [2]}))
+        with self.assertRaises(DataDecoderTypeException):
+            decoder.build({"bar": ["foo"]})
+
+    def test_compiled_self_referencing(self):
+        # noinspection PyPep8Naming
+        Node = ModelType.build("Node", {"value": int, "children": list[Any]})
+        decoder = AvroDataDecoder(Node)
+        observed = decoder.build({"value": 1, "children": [Node(2, [])]})
+        self.assertEqual(Node(1, [Node(2, [])]), observed)
+
 
 if __name__ == "__main__":
     unittest.main()
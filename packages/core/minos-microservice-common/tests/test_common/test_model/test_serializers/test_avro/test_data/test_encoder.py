@@ -13,11 +13,14 @@ from uuid import (
     uuid4,
 )
 
+import orjson
+
 from minos.common import (
     AvroDataEncoder,
     MinosMalformedAttributeException,
 )
 from tests.model_classes import (
+    Base,
     User,
 )
 
@@ -26,6 +29,10 @@ class _Foo:
     """For testing purposes"""
 
 
+class _Bar(str):
+    """For testing purposes"""
+
+
 class TestAvroDataEncoder(unittest.TestCase):
     def test_build_float(self):
         encoder = AvroDataEncoder(3.5)
@@ -91,6 +98,43 @@ class TestAvroDataEncoder(unittest.TestCase):
         observed = AvroDataEncoder(value).build()
         self.assertEqual(str(value), observed)
 
+    def test_builder_cached(self):
+        self.assertIs(AvroDataEncoder._get_builder(int), AvroDataEncoder._get_builder(int))
+
+    def test_builder_subclass(self):
+        observed = AvroDataEncoder(_Bar("foo")).build()
+        self.assertEqual("foo", observed)
+
+    def test_builder_model_subclass(self):
+        self.assertEqual(AvroDataEncoder._get_builder(Base), AvroDataEncoder._get_builder(User))
+
+    def test_build_json(self):
+        value = {
+            "users": [User(123), User(456, "foo")],
+            "tags": {"bar"},
+            "decimal": Decimal("3.5"),
+            "date": date(2021, 1, 21),
+            "time": time(20, 45, 21),
+            "datetime": datetime(2021, 1, 21, 20, 45, 21, tzinfo=timezone.utc),
+            "timedelta": timedelta(days=23, seconds=1),
+            "uuid": uuid4(),
+        }
+        observed = AvroDataEncoder(value).build_json()
+        expected = orjson.dumps(AvroDataEncoder(value).build())
+        self.assertEqual(orjson.loads(expected), orjson.loads(observed))
+
+    def test_build_json_with_value(self):
+        observed = AvroDataEncoder().build_json(User(123))
+        self.assertEqual(b'{"id":123,"username":null}', observed)
+
+    def test_build_json_with_exclude(self):
+        observed = AvroDataEncoder().build_json(User(123, "foo"), exclude={"id"})
+        self.assertEqual(b'{"username":"foo"}', observed)
+
+    def test_build_json_raises(self):
+        with self.assertRaises(MinosMalformedAttributeException):
+            AvroDataEncoder({"foo": _Foo()}).build_json()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,10 @@ from minos.common import (
     ModelType,
     classname,
 )
+from minos.common.model.serializers.avro.schema.decoder import (
+    _import_module_cached,
+    _import_module_or_none,
+)
 from tests.model_classes import (
     ShoppingList,
     Status,
@@ -171,6 +175,40 @@ class TestAvroSchemaDecoder(unittest.TestCase):
             observed = AvroSchemaDecoder({"type": "string", "logicalType": classname(ShoppingList)}).build()
         self.assertEqual(ShoppingList, observed)
 
+    def test_build_cached(self):
+        one = {"name": "CachedUser", "type": "record", "fields": [{"name": "username", "type": "string"}]}
+        two = {"type": "record", "fields": [{"type": "string", "name": "username"}], "name": "CachedUser"}
+        AvroSchemaDecoder._build_cached.cache_clear()
+
+        with patch.object(AvroSchemaDecoder, "_build_record", wraps=AvroSchemaDecoder()._build_record) as mock:
+            self.assertEqual(AvroSchemaDecoder(one).build(), AvroSchemaDecoder(two).build())
+
+        self.assertEqual(1, mock.call_count)
+
+    def test_build_with_kwargs_not_cached(self):
+        schema = {"name": "id", "type": "int"}
+        AvroSchemaDecoder._build_cached.cache_clear()
+
+        self.assertEqual(int, AvroSchemaDecoder(schema).build(foo="bar"))
+        self.assertEqual(0, AvroSchemaDecoder._build_cached.cache_info().currsize)
+
+    def test_import_cached(self):
+        _import_module_cached.cache_clear()
+        schema = {"type": "string", "logicalType": classname(Status)}
+
+        self.assertEqual(Status, AvroSchemaDecoder().build(schema, foo="bar"))
+        self.assertEqual(Status, AvroSchemaDecoder().build(schema, foo="bar"))
+        self.assertEqual(1, _import_module_cached.cache_info().misses)
+
+    def test_import_failure_not_cached(self):
+        _import_module_cached.cache_clear()
+        name = "tests.model_classes.NotDefinedYet"
+
+        self.assertIsNone(_import_module_or_none(name))
+        with patch("tests.model_classes.NotDefinedYet", Status, create=True):
+            self.assertEqual(Status, _import_module_or_none(name))
+        self.assertEqual(0, _import_module_cached.cache_info().hits)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,22 @@ class TestAvroSchemaEncoder(unittest.TestCase):
 
         self.assertEqual(expected, observed)
 
+    def test_model_type_deterministic(self):
+        type_ = ModelType.build("User", {"username": str}, namespace_="path.to")
+
+        first = AvroSchemaEncoder(type_, deterministic=True).build()
+        second = AvroSchemaEncoder(type_, deterministic=True).build()
+
+        self.assertEqual(first, second)
+
+    def test_model_type_deterministic_repeated(self):
+        user = ModelType.build("User", {"username": str}, namespace_="path.to")
+        type_ = ModelType.build("Group", {"first": user, "second": user}, namespace_="path.to")
+
+        observed = AvroSchemaEncoder(type_, deterministic=True).build()
+
+        self.assertNotEqual(observed["fields"][0]["type"]["namespace"], observed["fields"][1]["type"]["namespace"])
+
     def test_int(self):
         observed = AvroSchemaEncoder(int).build()
         expected = "int"
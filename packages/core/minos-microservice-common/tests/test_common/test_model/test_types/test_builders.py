@@ -1,8 +1,12 @@
 import unittest
 from typing import (
     Any,
+    Optional,
     Union,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
     ModelType,
@@ -45,6 +49,24 @@ class TestTypeHintBuilder(unittest.TestCase):
         observed = TypeHintBuilder([123], list[Union[int, Any]]).build()
         self.assertEqual(expected, observed)
 
+    def test_list_homogeneous(self):
+        builder = TypeHintBuilder(list(range(1000)))
+        with patch.object(TypeHintBuilder, "_build", wraps=builder._build) as mock:
+            self.assertEqual(list[int], builder.build())
+        self.assertEqual(3, mock.call_count)
+
+    def test_list_homogeneous_with_base(self):
+        self.assertEqual(list[Optional[int]], TypeHintBuilder([1, 2, 3], list[Optional[int]]).build())
+
+    def test_list_heterogeneous_tail(self):
+        self.assertEqual(list[Union[int, str]], TypeHintBuilder([*range(1000), "hello"]).build())
+
+    def test_list_sample_size(self):
+        self.assertEqual(list[int], TypeHintBuilder([*range(1000), "hello"], sample_size=10).build())
+
+    def test_dict_sample_size(self):
+        self.assertEqual(dict[str, int], TypeHintBuilder({"one": 1, "two": "2"}, sample_size=1).build())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from typing import (
+    Optional,
+    Union,
+)
+from unittest.mock import (
+    MagicMock,
+)
+
+from minos.common.model.types.caches import (
+    TypeHintKey,
+    identity_lru_cache,
+)
+
+
+class _Loose:
+    """For testing purposes."""
+
+    def __eq__(self, other):
+        return isinstance(other, _Loose)
+
+    def __hash__(self):
+        return 0
+
+
+class TestIdentityLruCache(unittest.TestCase):
+    def test_cached(self):
+        mock = MagicMock(side_effect=lambda a, b: (a, b))
+        cached = identity_lru_cache(maxsize=8)(mock)
+        one, two = object(), object()
+
+        self.assertEqual((one, two), cached(one, two))
+        self.assertEqual((one, two), cached(one, two))
+        self.assertEqual(1, mock.call_count)
+
+    def test_keyed_by_identity(self):
+        mock = MagicMock(side_effect=lambda a: a)
+        cached = identity_lru_cache(maxsize=8)(mock)
+        one, two = _Loose(), _Loose()
+
+        self.assertIs(one, cached(one))
+        self.assertIs(two, cached(two))
+        self.assertEqual(2, mock.call_count)
+
+    def test_maxsize(self):
+        mock = MagicMock(side_effect=lambda a: a)
+        cached = identity_lru_cache(maxsize=2)(mock)
+        one, two, three = object(), object(), object()
+
+        cached(one)
+        cached(two)
+        cached(one)
+        cached(three)
+        self.assertEqual(3, mock.call_count)
+
+        cached(one)
+        self.assertEqual(3, mock.call_count)
+        cached(two)
+        self.assertEqual(4, mock.call_count)
+
+    def test_cache_clear(self):
+        mock = MagicMock(side_effect=lambda a: a)
+        cached = identity_lru_cache(maxsize=8)(mock)
+        one = object()
+
+        cached(one)
+        cached.cache_clear()
+        cached(one)
+        self.assertEqual(2, mock.call_count)
+
+
+class TestTypeHintKey(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(TypeHintKey(int), TypeHintKey(int))
+        self.assertEqual(TypeHintKey(list[Optional[int]]), TypeHintKey(list[Optional[int]]))
+        self.assertEqual(hash(TypeHintKey(dict[str, int])), hash(TypeHintKey(dict[str, int])))
+
+    def test_union_order(self):
+        self.assertNotEqual(TypeHintKey(Union[int, float]), TypeHintKey(Union[float, int]))
+        self.assertNotEqual(TypeHintKey(list[Union[int, float]]), TypeHintKey(list[Union[float, int]]))
+
+    def test_keyed_by_identity(self):
+        self.assertNotEqual(TypeHintKey(_Loose), TypeHintKey(type("_Loose", (_Loose,), {})))
+
+    def test_type_(self):
+        self.assertEqual(Union[int, float], TypeHintKey(Union[int, float]).type_)
+
+    def test_unhashable_raises(self):
+        with self.assertRaises(TypeError):
+            TypeHintKey([int])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,9 @@ from typing import (
     Optional,
     Union,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
     Model,
@@ -136,6 +139,14 @@ class TestTypeHintComparator(unittest.TestCase):
         two = ModelType.build("tests.model_classes.Foo", {"text": float})
         self.assertFalse(TypeHintComparator(Optional[one], Optional[two]).match())
 
+    def test_match_cached(self):
+        one = ModelType.build("tests.model_classes.Foo", {"text": int})
+        two = ModelType.build("tests.model_classes.Foo", {"text": int})
+        self.assertTrue(TypeHintComparator(one, two).match())
+        with patch.object(TypeHintComparator, "_compare") as mock:
+            self.assertTrue(TypeHintComparator(one, two).match())
+        self.assertEqual(0, mock.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,10 @@
 import unittest
 from typing import (
     TypedDict,
+    Union,
+)
+from unittest.mock import (
+    patch,
 )
 
 from minos.common import (
@@ -14,6 +18,12 @@ from tests.model_classes import (
 )
 
 
+class Unhashable:
+    """For testing purposes."""
+
+    __hash__ = None
+
+
 class TestModelType(unittest.TestCase):
     def test_build(self):
         model_type = ModelType.build("Foo", {"text": int})
@@ -109,6 +119,68 @@ class TestModelType(unittest.TestCase):
         dto = model_type(text="test")
         self.assertEqual(DataTransferObject("Foo", [Field("text", str, "test")]), dto)
 
+    def test_model_cls(self):
+        model_type = ModelType.build("tests.model_classes.Foo", {"text": str})
+        self.assertEqual(Foo, model_type.model_cls)
+
+    def test_model_cls_dto(self):
+        model_type = ModelType.build("Foo", {"text": str})
+        self.assertEqual(DataTransferObject, model_type.model_cls)
+
+    def test_model_cls_cached(self):
+        model_type = ModelType.build("tests.model_classes.Foo", {"text": str, "cached": bytes})
+        with patch("minos.common.model.types.model_types.import_module", return_value=Foo) as mock:
+            self.assertEqual(Foo, model_type.model_cls)
+            self.assertEqual(Foo, model_type.model_cls)
+        self.assertEqual(1, mock.call_count)
+
+    def test_equal_cached(self):
+        one = ModelType.build("Foo", {"text": int})
+        two = ModelType.build("Bar", {"text": int})
+        self.assertNotEqual(one, two)
+        with patch.object(ModelType, "_equal") as mock:
+            self.assertNotEqual(one, two)
+        self.assertEqual(0, mock.call_count)
+
+    def test_build_interned(self):
+        one = ModelType.build("Foo", {"text": int, "bar": ModelType.build("Bar", {"items": list[str]})})
+        two = ModelType.build("Foo", {"text": int, "bar": ModelType.build("Bar", {"items": list[str]})})
+        self.assertIs(one, two)
+
+    def test_build_interned_different(self):
+        one = ModelType.build("Foo", {"text": int, "bar": str})
+        two = ModelType.build("Foo", {"bar": str, "text": int})
+        three = ModelType.build("foo.Foo", {"text": int, "bar": str})
+        self.assertIsNot(one, two)
+        self.assertIsNot(one, three)
+
+    def test_build_interned_union_order(self):
+        one = ModelType.build("Foo", {"x": Union[int, float]})
+        two = ModelType.build("Foo", {"x": Union[float, int]})
+        self.assertIsNot(one, two)
+        self.assertEqual(3, one(x=3.5).x)
+        self.assertEqual(3.5, two(x=3.5).x)
+
+    def test_build_interned_copies_type_hints(self):
+        type_hints = {"text": int}
+        model_type = ModelType.build("Foo", type_hints)
+        type_hints["other"] = str
+        self.assertEqual({"text": int}, model_type.type_hints)
+
+    def test_build_unhashable(self):
+        one = ModelType.build("Foo", {"text": Unhashable()})
+        two = ModelType.build("Foo", {"text": Unhashable()})
+        self.assertIsNot(one, two)
+
+    def test_from_model_interned(self):
+        self.assertIs(ModelType.from_model(Foo), ModelType.from_model(Foo))
+        self.assertIs(ModelType.from_model(Foo("one")), ModelType.from_model(Foo("two")))
+        self.assertIs(ModelType.from_model(Foo), ModelType.build("tests.model_classes.Foo", {"text": str}))
+
+    def test_equal_many_structurally_equal(self):
+        types = [ModelType.build("Foo", {"bar": ModelType.build("Bar", {"text": int})}) for _ in range(100)]
+        self.assertTrue(all(one == two for one in types for two in types))
+
 
 if __name__ == "__main__":
     unittest.main()
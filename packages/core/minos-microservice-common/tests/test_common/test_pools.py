@@ -19,14 +19,16 @@ from aiomisc.pool import (
 )
 
 from minos.common import (
+    WAIT_TIME_BUCKETS,
     MinosPool,
     MinosSetup,
+    PoolMetrics,
 )
 
 
 class _Pool(MinosPool):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.create_instance_call_count = 0
         self.destroy_instance_call_count = 0
 
@@ -38,6 +40,24 @@ class _Pool(MinosPool):
         self.destroy_instance_call_count += 1
 
 
+class _UniquePool(_Pool):
+    async def _create_instance(self) -> T:
+        self.create_instance_call_count += 1
+        return f"foo-{self.create_instance_call_count}"
+
+
+class _FailingPool(_Pool):
+    async def _create_instance(self) -> T:
+        self.create_instance_call_count += 1
+        raise ValueError()
+
+
+class _SlowPool(_UniquePool):
+    async def _create_instance(self) -> T:
+        await sleep(0.05)
+        return await super()._create_instance()
+
+
 class TestMinosPool(unittest.IsolatedAsyncioTestCase):
     def test_abstract(self):
         self.assertTrue(issubclass(MinosPool, (ABC, MinosSetup, PoolBase)))
@@ -70,6 +90,162 @@ class TestMinosPool(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(1, pool_mock.call_count)
 
+    def test_minsize_raises(self):
+        with self.assertRaises(ValueError):
+            _Pool(minsize=-1)
+        with self.assertRaises(ValueError):
+            _Pool(minsize=3, maxsize=2)
+
+    async def test_setup_prewarms(self):
+        pool = _UniquePool(minsize=3, already_setup=False)
+        self.assertEqual(0, len(pool))
+
+        async with pool:
+            self.assertEqual(3, pool.create_instance_call_count)
+            self.assertEqual(3, pool.metrics.idle)
+
+            async with pool.acquire():
+                self.assertEqual(3, pool.create_instance_call_count)
+
+    async def test_acquire_lifo(self):
+        async with _UniquePool() as pool:
+            async with pool.acquire() as first:
+                async with pool.acquire() as second:
+                    pass
+            self.assertEqual("foo-1", first)
+            self.assertEqual("foo-2", second)
+
+            async with pool.acquire() as observed:
+                self.assertEqual(first, observed)
+
+    async def test_shrink(self):
+        async with _UniquePool(minsize=1, idle_timeout=0.1) as pool:
+            async with pool.acquire(), pool.acquire(), pool.acquire():
+                self.assertEqual(3, len(pool))
+
+            pool._shrink()
+            self.assertEqual(3, len(pool))
+
+            await sleep(0.25)
+            self.assertEqual(1, len(pool))
+            self.assertEqual(2, pool.destroy_instance_call_count)
+
+            async with pool.acquire() as observed:
+                self.assertEqual("foo-1", observed)
+
+    async def test_spare_instance(self):
+        async with _SlowPool(wait_time_threshold=0.01) as pool:
+            async with pool.acquire() as first:
+                await sleep(0.1)
+                self.assertEqual(2, len(pool))
+                self.assertEqual(1, pool.metrics.idle)
+
+                async with pool.acquire() as second:
+                    await sleep(0.1)
+                    self.assertEqual(2, len(pool))
+
+        self.assertEqual("foo-1", first)
+        self.assertEqual("foo-2", second)
+
+    async def test_spare_instance_disabled(self):
+        async with _SlowPool(wait_time_threshold=None) as pool:
+            async with pool.acquire():
+                await sleep(0.1)
+                self.assertEqual(1, len(pool))
+
+    async def test_spare_instance_maxsize(self):
+        async with _SlowPool(maxsize=1, wait_time_threshold=0.01) as pool:
+            async with pool.acquire():
+                await sleep(0.1)
+                self.assertEqual(1, len(pool))
+
+    async def test_shrink_after_slow_acquisition(self):
+        async with _UniquePool(minsize=1) as pool:
+            async with pool.acquire(), pool.acquire(), pool.acquire():
+                pass
+            pool._idle_since = {instance: since - pool.idle_timeout for instance, since in pool._idle_since.items()}
+
+            pool._slow_acquired_at = pool._loop.time()
+            pool._shrink()
+            self.assertEqual(3, len(pool))
+
+            pool._slow_acquired_at -= pool.idle_timeout
+            pool._shrink()
+            self.assertEqual(1, len(pool))
+
+    async def test_metrics(self):
+        async with _Pool() as pool:
+            self.assertIsInstance(pool.metrics, PoolMetrics)
+
+            async with pool.acquire():
+                self.assertEqual(1, pool.metrics.in_use)
+                self.assertEqual(0, pool.metrics.idle)
+                self.assertEqual(1, pool.metrics.size)
+
+            async with pool.acquire():
+                pass
+
+            observed = pool.metrics.as_dict()
+
+        self.assertEqual(2, observed["acquisitions"])
+        self.assertEqual(2, sum(observed["wait_time_buckets"].values()))
+        self.assertEqual(list(WAIT_TIME_BUCKETS) + [float("inf")], list(observed["wait_time_buckets"]))
+        self.assertEqual(0, observed["in_use"])
+        self.assertEqual(1, observed["idle"])
+        self.assertEqual(1, observed["creations"])
+        self.assertEqual(0, observed["creation_failures"])
+
+    async def test_metrics_acquisition_with_failed_check(self):
+        checked = list()
+
+        async def _check_instance(instance: t.Any) -> bool:
+            await sleep(0.05)
+            checked.append(instance)
+            return len(checked) > 1
+
+        async with _UniquePool() as pool:
+            pool._check_instance = _check_instance
+            async with pool.acquire():
+                pass
+
+        self.assertEqual(2, len(checked))
+        self.assertEqual(1, pool.metrics.acquisitions)
+        self.assertGreaterEqual(pool.metrics.wait_time_sum, 0.1)
+
+    def test_metrics_observe_acquisition(self):
+        metrics = PoolMetrics(_Pool())
+        metrics.observe_acquisition(0.0005)
+        metrics.observe_acquisition(0.2)
+        metrics.observe_acquisition(10)
+
+        self.assertEqual(3, metrics.acquisitions)
+        self.assertAlmostEqual(10.2005, metrics.wait_time_sum)
+        self.assertEqual([1, 0, 0, 0, 0, 1, 0, 0, 1], metrics.wait_time_buckets)
+
+    async def test_creation_failure(self):
+        async with _FailingPool() as pool:
+            with self.assertRaises(ValueError):
+                async with pool.acquire():
+                    pass
+            self.assertFalse(pool._semaphore.locked())
+            self.assertEqual(1, pool.metrics.creation_failures)
+            self.assertEqual(0, pool.metrics.creations)
+
+    def test_creation_retry_delay(self):
+        pool = _Pool()
+        self.assertEqual(0.1, pool._get_creation_retry_delay())
+
+        pool.metrics.observe_creation(failed=True)
+        pool.metrics.observe_creation(failed=True)
+        self.assertEqual(0.4, pool._get_creation_retry_delay())
+
+        for _ in range(10):
+            pool.metrics.observe_creation(failed=True)
+        self.assertEqual(5.0, pool._get_creation_retry_delay())
+
+        pool.metrics.observe_creation()
+        self.assertEqual(0.1, pool._get_creation_retry_delay())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from minos.common import (
+    InMemoryAvroSchemaRegistry,
     MinosAvroProtocol,
     MinosProtocolException,
 )
@@ -123,6 +124,129 @@ class TestMinosAvroProtocol(unittest.TestCase):
         with self.assertRaises(MinosProtocolException):
             MinosAvroProtocol.decode(serialized)
 
+    def test_decode_with_schema(self):
+        serialized = MinosAvroProtocol.encode(
+            {"id": 1234}, {"type": "record", "name": "Foo", "fields": [{"name": "id", "type": "int"}]}
+        )
+
+        schema, data = MinosAvroProtocol.decode_with_schema(serialized)
+        self.assertEqual(MinosAvroProtocol.decode_schema(serialized), schema)
+        self.assertEqual({"id": 1234}, data)
+
+    def test_decode_with_schema_batch_mode(self):
+        serialized = MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True)
+
+        schema, data = MinosAvroProtocol.decode_with_schema(serialized, batch_mode=True)
+        self.assertEqual(["string", "int"], schema)
+        self.assertEqual(["one", 1], data)
+
+    def test_decode_with_schema_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_with_schema(bytes("foo", "utf-8"))
+
+    def test_decode_buffer(self):
+        serialized = MinosAvroProtocol.encode("one", "string")
+
+        for buffer in (bytearray(serialized), memoryview(serialized)):
+            self.assertEqual("string", MinosAvroProtocol.decode_schema(buffer))
+            self.assertEqual("one", MinosAvroProtocol.decode(buffer))
+            self.assertEqual(("string", "one"), MinosAvroProtocol.decode_with_schema(buffer))
+
+    def test_parse_schema_cached(self):
+        schema = [{"type": "record", "name": "Cached", "fields": [{"name": "text", "type": "string"}]}]
+        self.assertIs(MinosAvroProtocol._parse_schema(schema), MinosAvroProtocol._parse_schema(schema))
+
+
+class TestMinosAvroProtocolWithRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = InMemoryAvroSchemaRegistry()
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [
+                {"name": "cost", "type": "float"},
+                {"name": "tags", "type": {"type": "array", "items": "string"}},
+            ],
+        }
+
+    async def test_encode_decode(self):
+        data = {"cost": 3.0, "tags": ["one", "two"]}
+        serialized = await MinosAvroProtocol.encode_with_registry(data, self.schema, self.registry)
+        self.assertIsInstance(serialized, bytes)
+
+        deserialized = await MinosAvroProtocol.decode_with_registry(serialized, self.registry)
+        self.assertEqual(data, deserialized)
+
+    async def test_encode_smaller(self):
+        data = {"cost": 3.0, "tags": ["one", "two"]}
+        serialized = await MinosAvroProtocol.encode_with_registry(data, self.schema, self.registry)
+        self.assertLess(len(serialized), len(MinosAvroProtocol.encode(data, self.schema)))
+
+    async def test_header(self):
+        serialized = await MinosAvroProtocol.encode_with_registry({"cost": 3.0, "tags": []}, self.schema, self.registry)
+        fingerprint = self.registry.fingerprint(
+            await MinosAvroProtocol.decode_schema_with_registry(serialized, self.registry)
+        )
+
+        self.assertEqual(b"\x00", serialized[:1])
+        self.assertEqual(fingerprint.to_bytes(8, "big"), serialized[1:9])
+
+    async def test_decode_schema(self):
+        serialized = await MinosAvroProtocol.encode_with_registry({"cost": 3.0, "tags": []}, self.schema, self.registry)
+        schema = await MinosAvroProtocol.decode_schema_with_registry(serialized, self.registry)
+        self.assertEqual(self.schema, schema)
+
+    async def test_decode_buffer(self):
+        data = {"cost": 3.0, "tags": ["one", "two"]}
+        serialized = await MinosAvroProtocol.encode_with_registry(data, self.schema, self.registry)
+        observed = await MinosAvroProtocol.decode_with_registry(memoryview(serialized), self.registry)
+        self.assertEqual(data, observed)
+
+    async def test_decode_char_buffer(self):
+        data = {"cost": 3.0, "tags": ["one", "two"]}
+        serialized = await MinosAvroProtocol.encode_with_registry(data, self.schema, self.registry)
+        observed = await MinosAvroProtocol.decode_with_registry(memoryview(serialized).cast("c"), self.registry)
+        self.assertEqual(data, observed)
+
+    async def test_is_registry_encoded(self):
+        serialized = await MinosAvroProtocol.encode_with_registry({"cost": 3.0, "tags": []}, self.schema, self.registry)
+        self.assertTrue(MinosAvroProtocol.is_registry_encoded(serialized))
+        self.assertTrue(MinosAvroProtocol.is_registry_encoded(memoryview(serialized)))
+        self.assertTrue(MinosAvroProtocol.is_registry_encoded(memoryview(serialized).cast("c")))
+
+        serialized = MinosAvroProtocol.encode({"cost": 3.0, "tags": []}, self.schema)
+        self.assertFalse(MinosAvroProtocol.is_registry_encoded(serialized))
+        self.assertFalse(MinosAvroProtocol.is_registry_encoded(bytes()))
+
+    async def test_decode_schema_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            await MinosAvroProtocol.decode_schema_with_registry(b"Test", self.registry)
+
+    async def test_decode_unknown_fingerprint_raises(self):
+        serialized = await MinosAvroProtocol.encode_with_registry({"cost": 3.0, "tags": []}, self.schema, self.registry)
+        with self.assertRaises(MinosProtocolException):
+            await MinosAvroProtocol.decode_with_registry(serialized, InMemoryAvroSchemaRegistry())
+
+    async def test_batch_mode(self):
+        serialized = await MinosAvroProtocol.encode_with_registry(
+            ["one", 1], [["string", "int"]], self.registry, batch_mode=True
+        )
+
+        schema = await MinosAvroProtocol.decode_schema_with_registry(serialized, self.registry)
+        self.assertEqual(["string", "int"], schema)
+
+        data = await MinosAvroProtocol.decode_with_registry(serialized, self.registry, batch_mode=True)
+        self.assertEqual(["one", 1], data)
+
+    async def test_batch_mode_raises(self):
+        serialized = await MinosAvroProtocol.encode_with_registry(
+            ["one", 1], [["string", "int"]], self.registry, batch_mode=True
+        )
+
+        with self.assertRaises(MinosProtocolException):
+            await MinosAvroProtocol.decode_with_registry(serialized, self.registry)
+
 
 if __name__ == "__main__":
     unittest.main()
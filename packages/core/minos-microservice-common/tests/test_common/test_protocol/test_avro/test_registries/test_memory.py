@@ -0,0 +1,39 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+    MinosProtocolException,
+)
+
+
+class TestInMemoryAvroSchemaRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = {"type": "record", "name": "Foo", "fields": [{"name": "bar", "type": "string"}]}
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(InMemoryAvroSchemaRegistry, AvroSchemaRegistry))
+
+    def test_fingerprint(self):
+        reordered = {"fields": [{"type": "string", "name": "bar"}], "name": "Foo", "type": "record"}
+        self.assertEqual(AvroSchemaRegistry.fingerprint(self.schema), AvroSchemaRegistry.fingerprint(reordered))
+
+    def test_fingerprint_logical_type(self):
+        other = {"type": "record", "name": "Foo", "fields": [{"name": "bar", "type": "string", "logicalType": "uuid"}]}
+        self.assertNotEqual(AvroSchemaRegistry.fingerprint(self.schema), AvroSchemaRegistry.fingerprint(other))
+
+    async def test_register(self):
+        async with InMemoryAvroSchemaRegistry() as registry:
+            fingerprint = await registry.register(self.schema)
+            self.assertEqual(AvroSchemaRegistry.fingerprint(self.schema), fingerprint)
+            self.assertEqual(self.schema, await registry.get(fingerprint))
+
+    async def test_get_raises(self):
+        async with InMemoryAvroSchemaRegistry() as registry:
+            with self.assertRaises(MinosProtocolException):
+                await registry.get(1234)
+
+
+if __name__ == "__main__":
+    unittest.main()
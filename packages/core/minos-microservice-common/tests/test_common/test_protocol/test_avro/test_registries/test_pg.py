@@ -0,0 +1,52 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistry,
+    MinosProtocolException,
+    PostgreSqlAvroSchemaRegistry,
+    PostgreSqlMinosDatabase,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestPostgreSqlAvroSchemaRegistry(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = {"type": "record", "name": "Foo", "fields": [{"name": "bar", "type": "string"}]}
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(PostgreSqlAvroSchemaRegistry, (AvroSchemaRegistry, PostgreSqlMinosDatabase)))
+
+    def test_from_config(self):
+        registry = PostgreSqlAvroSchemaRegistry.from_config(self.config)
+        self.assertEqual(self.config.repository.database, registry.database)
+
+    async def test_register_get(self):
+        async with PostgreSqlAvroSchemaRegistry.from_config(self.config) as registry:
+            fingerprint = await registry.register(self.schema)
+
+        async with PostgreSqlAvroSchemaRegistry.from_config(self.config) as registry:
+            self.assertEqual(self.schema, await registry.get(fingerprint))
+
+    async def test_register_twice(self):
+        async with PostgreSqlAvroSchemaRegistry.from_config(self.config) as registry:
+            self.assertEqual(await registry.register(self.schema), await registry.register(self.schema))
+
+        async with PostgreSqlAvroSchemaRegistry.from_config(self.config) as registry:
+            self.assertEqual(await registry.register(self.schema), AvroSchemaRegistry.fingerprint(self.schema))
+
+    async def test_get_raises(self):
+        async with PostgreSqlAvroSchemaRegistry.from_config(self.config) as registry:
+            with self.assertRaises(MinosProtocolException):
+                await registry.get(1234)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,13 @@ class TestMinosJsonBinaryProtocol(unittest.TestCase):
         decoded = MinosJsonBinaryProtocol.decode(encoded)
         self.assertEqual(data, decoded)
 
+    def test_decode_buffer(self):
+        data = {"foo": "bar", "one": 2}
+        encoded = MinosJsonBinaryProtocol.encode(data)
+
+        self.assertEqual(data, MinosJsonBinaryProtocol.decode(memoryview(encoded)))
+        self.assertEqual(data, MinosJsonBinaryProtocol.decode(bytearray(encoded)))
+
 
 if __name__ == "__main__":
     unittest.main()
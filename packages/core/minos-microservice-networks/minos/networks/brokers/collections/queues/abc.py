@@ -9,6 +9,7 @@ from abc import (
 )
 from collections.abc import (
     AsyncIterator,
+    Iterable,
 )
 
 from minos.common import (
@@ -34,6 +35,16 @@ class BrokerQueue(ABC, MinosSetup):
     async def _enqueue(self, message: BrokerMessage) -> None:
         raise NotImplementedError
 
+    async def enqueue_many(self, messages: Iterable[BrokerMessage]) -> None:
+        """Enqueue many method."""
+        messages = list(messages)
+        logger.debug(f"Enqueuing {len(messages)!r} messages...")
+        await self._enqueue_many(messages)
+
+    async def _enqueue_many(self, messages: list[BrokerMessage]) -> None:
+        for message in messages:
+            await self._enqueue(message)
+
     def __aiter__(self) -> AsyncIterator[BrokerMessage]:
         return self
 
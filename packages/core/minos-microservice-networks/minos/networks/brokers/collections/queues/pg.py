@@ -9,10 +9,13 @@ from abc import (
 )
 from asyncio import (
     CancelledError,
+    Future,
     PriorityQueue,
     QueueEmpty,
     TimeoutError,
     create_task,
+    get_running_loop,
+    sleep,
     wait_for,
 )
 from contextlib import (
@@ -22,21 +25,25 @@ from typing import (
     Any,
     NoReturn,
     Optional,
+    Union,
 )
 
 from aiopg import (
     Cursor,
 )
-from cached_property import (
-    cached_property,
-)
 from psycopg2.sql import (
     SQL,
 )
 
 from minos.common import (
+    AvroModelCodec,
+    AvroSchemaRegistry,
+    MinosAvroProtocol,
     MinosConfig,
+    ModelCodec,
+    PostgreSqlMigration,
     PostgreSqlMinosDatabase,
+    paginate,
 )
 
 from ....utils import (
@@ -53,19 +60,47 @@ logger = logging.getLogger(__name__)
 
 
 class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
-    """PostgreSql Broker Queue class."""
+    """PostgreSql Broker Queue class.
+
+    If a schema registry is given, the messages of the topics that use the ``avro`` codec are stored with the schema
+    registry wire format, so only the fingerprint of the schema is stored with each entry.
+    """
 
     _queue: PriorityQueue[_Entry]
 
-    def __init__(self, *args, query_factory: PostgreSqlBrokerQueueQueryFactory, retry: int, records: int, **kwargs):
+    def __init__(
+        self,
+        *args,
+        query_factory: PostgreSqlBrokerQueueQueryFactory,
+        retry: int,
+        records: int,
+        codec: Union[str, ModelCodec] = "avro",
+        topic_codecs: Optional[dict[str, Union[str, ModelCodec]]] = None,
+        enqueue_batch_window: float = 0.0,
+        enqueue_batch_size: int = 1000,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
+        if topic_codecs is None:
+            topic_codecs = dict()
+
         self._query_factory = query_factory
         self._retry = retry
         self._records = records
 
+        self._codec = ModelCodec.get(codec)
+        self._topic_codecs = {topic: ModelCodec.get(topic_codec) for topic, topic_codec in topic_codecs.items()}
+        self._schema_registry = schema_registry
+
         self._queue = PriorityQueue(maxsize=records)
 
+        self._enqueue_batch_window = enqueue_batch_window
+        self._enqueue_batch_size = enqueue_batch_size
+        self._pending: list[tuple[str, bytes, Future]] = list()
+        self._enqueue_task = None
+
         self._run_task = None
 
     @property
@@ -76,24 +111,50 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
         """
         return self._query_factory
 
+    @property
+    def migrations(self) -> tuple[PostgreSqlMigration, ...]:
+        """Get the schema migrations required by the instance.
+
+        :return: A tuple of ``PostgreSqlMigration`` instances.
+        """
+        migration = PostgreSqlMigration(
+            self._query_factory.build_table_name(), [[self._query_factory.build_create_table()]]
+        )
+        return (migration,)
+
+    def get_codec(self, topic: str) -> ModelCodec:
+        """Get the codec used to encode the messages of the given topic.
+
+        :param topic: The topic name.
+        :return: A ``ModelCodec`` instance.
+        """
+        return self._topic_codecs.get(topic, self._codec)
+
+    @property
+    def schema_registry(self) -> Optional[AvroSchemaRegistry]:
+        """Get the schema registry.
+
+        :return: An ``AvroSchemaRegistry`` instance or ``None``.
+        """
+        return self._schema_registry
+
     @classmethod
     def _from_config(cls, config: MinosConfig, **kwargs) -> PostgreSqlBrokerQueue:
+        kwargs = {"codec": config.codecs.default, "topic_codecs": config.codecs.topics} | kwargs
         # noinspection PyProtectedMember
         return cls(**config.broker.queue._asdict(), **kwargs)
 
     async def _setup(self) -> None:
         await super()._setup()
-        await self._create_table()
+        await self.migrate()
         await self._start_run()
 
     async def _destroy(self) -> None:
+        await self._wait_enqueued()
         await self._stop_run()
         await self._flush_queue()
         await super()._destroy()
 
-    async def _create_table(self) -> None:
-        await self.submit_query(self._query_factory.build_create_table(), lock=self._query_factory.build_table_name())
-
     async def _start_run(self) -> None:
         if self._run_task is None:
             self._run_task = create_task(self._run())
@@ -108,20 +169,94 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
                 await wait_for(task, 0.5)
 
     async def _flush_queue(self):
+        entries = list()
         while True:
             try:
-                entry = self._queue.get_nowait()
+                entries.append(self._queue.get_nowait())
             except QueueEmpty:
                 break
-            await self.submit_query(self._query_factory.build_update_not_processed(), (entry.id_,))
+
+        if entries:
+            await self.submit_many(
+                self._query_factory.build_update_not_processed(), [(entry.id_,) for entry in entries]
+            )
+
+        for _ in entries:
             self._queue.task_done()
 
+    async def _wait_enqueued(self) -> None:
+        if self._enqueue_task is not None:
+            with suppress(CancelledError):
+                await self._enqueue_task
+
     async def _enqueue(self, message: BrokerMessage) -> None:
-        await self.submit_query_and_fetchone(self._query_factory.build_insert(), (message.topic, message.avro_bytes))
-        await self._notify_enqueued(message)
+        # The message is encoded before joining the batch, so that an encoding failure only affects its caller.
+        data = await self._encode(message)
 
-    async def _notify_enqueued(self, message: BrokerMessage) -> None:
-        await self.submit_query(self._query_factory.build_notify())
+        future = get_running_loop().create_future()
+        self._pending.append((message.topic, data, future))
+
+        if self._enqueue_task is None:
+            self._enqueue_task = create_task(self._enqueue_pending())
+
+        await future
+
+    async def _enqueue_pending(self) -> None:
+        batch = list()
+        try:
+            await sleep(self._enqueue_batch_window)
+            while self._pending:
+                batch = self._pending[: self._enqueue_batch_size]
+                del self._pending[: self._enqueue_batch_size]
+
+                try:
+                    await self._insert_many([(topic, data) for topic, data, _ in batch])
+                except Exception as exc:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                else:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            for _, _, future in batch + self._pending:
+                if not future.done():
+                    future.cancel()
+            self._pending.clear()
+            self._enqueue_task = None
+
+    async def _enqueue_many(self, messages: list[BrokerMessage]) -> None:
+        await self._insert_many([(message.topic, await self._encode(message)) for message in messages])
+
+    async def _encode(self, message: BrokerMessage) -> bytes:
+        codec = self.get_codec(message.topic)
+        if self._schema_registry is not None and isinstance(codec, AvroModelCodec):
+            return await message.avro_bytes_with_registry(self._schema_registry)
+        return codec.encode(message)
+
+    async def _insert_many(self, rows: list[tuple[str, bytes]]) -> None:
+        if not rows:
+            return
+
+        async with self.cursor() as cursor:
+            async with cursor.begin():
+                for page in paginate(rows, self._enqueue_batch_size):
+                    query = self._query_factory.build_insert_many(len(page))
+                    await cursor.execute(query, tuple(value for row in page for value in row))
+                await self._notify_enqueued(cursor, {topic for topic, _ in rows})
+
+    async def _notify_enqueued(self, cursor: Cursor, topics: set[str]) -> None:
+        """Notify the listeners that new entries have been enqueued, as part of the insertion transaction.
+
+        The base implementation sends a single notification on the queue channel, so the ``topics`` are not used. They
+        are provided for subclasses that notify on a per topic basis.
+
+        :param cursor: The cursor of the insertion transaction.
+        :param topics: The topics of the enqueued entries.
+        :return: This method does not return anything.
+        """
+        await cursor.execute(self._query_factory.build_notify())
 
     async def _dequeue(self) -> BrokerMessage:
         while True:
@@ -183,6 +318,8 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
                 return
 
             entries = [_Entry(*row) for row in rows]
+            for entry in entries:
+                await entry.load(self._schema_registry)
 
             # noinspection PyTypeChecker
             await cursor.execute(self._query_factory.build_mark_processing(), (tuple(entry.id_ for entry in entries),))
@@ -278,12 +415,14 @@ class PostgreSqlBrokerQueueQueryFactory(ABC):
             "WHERE NOT processing AND retry < %s FOR UPDATE SKIP LOCKED) s"
         )
 
-    def build_insert(self) -> SQL:
-        """Build the "insert" query.
+    def build_insert_many(self, count: int) -> SQL:
+        """Build the "insert many" query.
 
+        :param count: The number of rows to be inserted.
         :return: A ``SQL`` instance.
         """
-        return SQL(f"INSERT INTO {self.build_table_name()} (topic, data) VALUES (%s, %s) RETURNING id")
+        values = ", ".join("(%s, %s)" for _ in range(count))
+        return SQL(f"INSERT INTO {self.build_table_name()} (topic, data) VALUES {values}")
 
     def build_select_not_processed(self) -> SQL:
         """Build the "select not processed" query.
@@ -294,7 +433,7 @@ class PostgreSqlBrokerQueueQueryFactory(ABC):
             "SELECT id, data "
             f"FROM {self.build_table_name()} "
             "WHERE NOT processing AND retry < %s "
-            "ORDER BY created_at "
+            "ORDER BY created_at, id "
             "LIMIT %s "
             "FOR UPDATE "
             "SKIP LOCKED"
@@ -305,14 +444,34 @@ class _Entry:
     def __init__(self, id_: int, data_bytes: bytes):
         self.id_ = id_
         self.data_bytes = data_bytes
+        self._data = None
+
+    async def load(self, schema_registry: Optional[AvroSchemaRegistry]) -> None:
+        """Decode the data in advance if it is encoded with the schema registry wire format.
 
-    @cached_property
+        The schema must be obtained asynchronously from the registry, so it cannot be done on the ``data`` property. If
+        the data cannot be decoded, the failure is raised later, when the ``data`` property is accessed.
+
+        :param schema_registry: The schema registry. If ``None``, nothing is done.
+        :return: This method does not return anything.
+        """
+        if schema_registry is None or not MinosAvroProtocol.is_registry_encoded(self.data_bytes):
+            return
+
+        with suppress(Exception):
+            self._data = await BrokerMessage.from_avro_bytes_with_registry(
+                self.data_bytes, schema_registry, trusted=True
+            )
+
+    @property
     def data(self) -> BrokerMessage:
         """Get the data.
 
         :return: A ``Model`` inherited instance.
         """
-        return BrokerMessage.from_avro_bytes(self.data_bytes)
+        if self._data is None:
+            self._data = ModelCodec.detect(self.data_bytes).decode(self.data_bytes, BrokerMessage, trusted=True)
+        return self._data
 
     def __lt__(self, other: Any) -> bool:
         # noinspection PyBroadException
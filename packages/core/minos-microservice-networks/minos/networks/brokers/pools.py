@@ -31,9 +31,15 @@ class BrokerClientPool(MinosPool):
     """Broker Client Pool class."""
 
     def __init__(
-        self, instance_kwargs: dict[str, Any], maxsize: int = 5, recycle: Optional[int] = 3600, *args, **kwargs
+        self,
+        instance_kwargs: dict[str, Any],
+        maxsize: int = 5,
+        recycle: Optional[int] = 3600,
+        *args,
+        idle_timeout: Optional[float] = None,
+        **kwargs,
     ):
-        super().__init__(maxsize=maxsize, recycle=recycle, *args, **kwargs)
+        super().__init__(maxsize=maxsize, recycle=recycle, idle_timeout=idle_timeout, *args, **kwargs)
         self._instance_kwargs = instance_kwargs
 
     @classmethod
@@ -24,9 +24,6 @@ from ....collections import (
     PostgreSqlBrokerQueue,
     PostgreSqlBrokerQueueQueryFactory,
 )
-from ....messages import (
-    BrokerMessage,
-)
 from .abc import (
     BrokerSubscriberQueue,
     BrokerSubscriberQueueBuilder,
@@ -45,8 +42,9 @@ class PostgreSqlBrokerSubscriberQueue(PostgreSqlBrokerQueue, BrokerSubscriberQue
             query_factory = PostgreSqlBrokerSubscriberQueueQueryFactory()
         super().__init__(topics, *args, query_factory=query_factory, **kwargs)
 
-    async def _notify_enqueued(self, message: BrokerMessage) -> None:
-        await self.submit_query(self._query_factory.build_notify().format(Identifier(message.topic)))
+    async def _notify_enqueued(self, cursor: Cursor, topics: set[str]) -> None:
+        for topic in sorted(topics):
+            await cursor.execute(self._query_factory.build_notify().format(Identifier(topic)))
 
     async def _listen_entries(self, cursor: Cursor) -> None:
         for topic in self.topics:
@@ -121,7 +119,7 @@ class PostgreSqlBrokerSubscriberQueueQueryFactory(PostgreSqlBrokerQueueQueryFact
             "SELECT id, data "
             f"FROM {self.build_table_name()} "
             "WHERE NOT processing AND retry < %s AND topic IN %s "
-            "ORDER BY created_at "
+            "ORDER BY created_at, id "
             "LIMIT %s "
             "FOR UPDATE SKIP LOCKED"
         )
@@ -31,9 +31,6 @@ from aiohttp.web import Request as AioHttpRequest
 from cached_property import (
     cached_property,
 )
-from orjson import (
-    orjson,
-)
 
 from minos.common import (
     AvroDataDecoder,
@@ -142,8 +139,7 @@ class RestRequest(Request):
         return self._parse_multi_dict(form)
 
     async def _raw_avro(self) -> Any:
-        data = MinosAvroProtocol.decode(await self._raw_bytes())
-        schema = MinosAvroProtocol.decode_schema(await self._raw_bytes())
+        schema, data = MinosAvroProtocol.decode_with_schema(await self._raw_bytes())
 
         type_ = AvroSchemaDecoder(schema).build()
         return AvroDataDecoder(type_).build(data)
@@ -296,7 +292,7 @@ class RestResponse(Response):
         return mapper[self.content_type]
 
     async def _raw_json(self) -> bytes:
-        return orjson.dumps(self._raw_data)
+        return AvroDataEncoder(self._data).build_json()
 
     async def _raw_form(self) -> bytes:
         return urlencode(self._raw_data).encode()
@@ -4,6 +4,7 @@ from abc import (
 )
 from unittest.mock import (
     AsyncMock,
+    call,
 )
 
 from minos.common import (
@@ -59,6 +60,19 @@ class TestBrokerQueue(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(StopAsyncIteration):
             await queue.__aiter__().__anext__()
 
+    async def test_enqueue_many(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        enqueue_mock = AsyncMock()
+
+        async with _BrokerQueue() as queue:
+            queue._enqueue = enqueue_mock
+            await queue.enqueue_many(iter(messages))
+
+        self.assertEqual([call(messages[0]), call(messages[1])], enqueue_mock.call_args_list)
+
 
 if __name__ == "__main__":
     unittest.main()
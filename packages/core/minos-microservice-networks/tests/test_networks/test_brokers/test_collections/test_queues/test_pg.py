@@ -1,5 +1,7 @@
+import sys
 import unittest
 from asyncio import (
+    gather,
     sleep,
 )
 from unittest.mock import (
@@ -7,10 +9,22 @@ from unittest.mock import (
     patch,
 )
 
+from aiopg import (
+    Cursor,
+)
+
 from minos.common import (
+    AsyncPgCursor,
+    AsyncPgPool,
+    AvroModelCodec,
+    DependencyInjector,
+    InMemoryAvroSchemaRegistry,
+    MinosAvroProtocol,
     PostgreSqlMinosDatabase,
+    PostgreSqlPool,
 )
 from minos.common.testing import (
+    FakeModelCodec,
     PostgresAsyncTestCase,
 )
 from minos.networks import (
@@ -35,6 +49,8 @@ class _PostgreSqlBrokerQueueQueryFactory(PostgreSqlBrokerQueueQueryFactory):
 
 class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
     CONFIG_FILE_PATH = CONFIG_FILE_PATH
+    POOL_CLS = PostgreSqlPool
+    CURSOR_CLS = Cursor
 
     def setUp(self) -> None:
         super().setUp()
@@ -43,11 +59,87 @@ class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
     def test_is_subclass(self):
         self.assertTrue(issubclass(PostgreSqlBrokerQueue, (BrokerQueue, PostgreSqlMinosDatabase)))
 
+    async def test_pool(self):
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            self.assertIsInstance(queue.pool, self.POOL_CLS)
+
     async def test_query_factory(self):
         queue = PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory)
 
         self.assertEqual(self.query_factory, queue.query_factory)
 
+    def test_migrations(self):
+        queue = PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory)
+
+        self.assertEqual(1, len(queue.migrations))
+        self.assertEqual("test_table", queue.migrations[0].name)
+        self.assertEqual(1, queue.migrations[0].version)
+
+    async def test_setup_schema_version(self):
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            observed = await queue.submit_query_and_fetchone("SELECT name, version FROM minos_schema_version;")
+
+        self.assertEqual(("test_table", 1), observed)
+
+    async def test_get_codec(self):
+        queue = PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, topic_codecs={"foo": "minos.common.testing.FakeModelCodec"}
+        )
+
+        self.assertEqual(FakeModelCodec(), queue.get_codec("foo"))
+        self.assertEqual(AvroModelCodec(), queue.get_codec("bar"))
+
+    async def test_aiter_with_codec(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        queue = PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, codec=FakeModelCodec(), topic_codecs={"bar": "json"}
+        )
+        await queue.setup()
+        await queue.enqueue(messages[0])
+        await queue.enqueue(messages[1])
+
+        observed = list()
+        async for message in queue:
+            observed.append(message)
+            if len(messages) == len(observed):
+                await queue.destroy()
+
+        self.assertEqual(messages, observed)
+
+    async def test_aiter_with_schema_registry(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        registry = InMemoryAvroSchemaRegistry()
+
+        queue = PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, schema_registry=registry, topic_codecs={"bar": "json"}
+        )
+        self.assertEqual(registry, queue.schema_registry)
+
+        await queue.setup()
+        with patch.object(queue, "_insert_many", wraps=queue._insert_many) as mock:
+            await queue.enqueue(messages[0])
+            await queue.enqueue(messages[1])
+
+        rows = [row for call in mock.call_args_list for row in call.args[0]]
+        self.assertEqual(["foo", "bar"], [topic for topic, _ in rows])
+        self.assertTrue(MinosAvroProtocol.is_registry_encoded(rows[0][1]))
+        self.assertFalse(MinosAvroProtocol.is_registry_encoded(rows[1][1]))
+
+        observed = list()
+        async for message in queue:
+            observed.append(message)
+            if len(messages) == len(observed):
+                await queue.destroy()
+
+        self.assertEqual(messages, observed)
+
     async def test_enqueue(self):
         message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
 
@@ -80,8 +172,9 @@ class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
             BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
         ]
 
-        with patch(
-            "aiopg.Cursor.fetchall",
+        with patch.object(
+            self.CURSOR_CLS,
+            "fetchall",
             return_value=[[1, messages[0].avro_bytes], [2, bytes()], [3, messages[1].avro_bytes]],
         ):
             async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
@@ -127,6 +220,111 @@ class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
 
         self.assertEqual(expected, observed)
 
+    async def test_enqueue_many(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(5)]
+
+        async with PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, enqueue_batch_size=2
+        ) as queue:
+            notify_mock = AsyncMock(side_effect=queue._notify_enqueued)
+            queue._notify_enqueued = notify_mock
+
+            await queue.enqueue_many(messages)
+
+            observed = [await queue.dequeue() for _ in messages]
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(1, notify_mock.call_count)
+
+    async def test_enqueue_coalesced(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(5)]
+
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            insert_many_mock = AsyncMock(side_effect=queue._insert_many)
+            queue._insert_many = insert_many_mock
+
+            await gather(*(queue.enqueue(message) for message in messages))
+
+            observed = [await queue.dequeue() for _ in messages]
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(1, insert_many_mock.call_count)
+        self.assertEqual(["foo"] * 5, [topic for topic, _ in insert_many_mock.call_args.args[0]])
+
+    async def test_enqueue_coalesced_with_batch_size(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(5)]
+
+        async with PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, enqueue_batch_window=0.01, enqueue_batch_size=2
+        ) as queue:
+            insert_many_mock = AsyncMock(side_effect=queue._insert_many)
+            queue._insert_many = insert_many_mock
+
+            await gather(*(queue.enqueue(message) for message in messages))
+
+        self.assertEqual([2, 2, 1], [len(args[0]) for args, _ in insert_many_mock.call_args_list])
+
+    async def test_enqueue_raises(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            queue._insert_many = AsyncMock(side_effect=ValueError)
+
+            with self.assertRaises(ValueError):
+                await queue.enqueue(message)
+
+            self.assertEqual(None, queue._enqueue_task)
+
+    async def test_enqueue_encoding_raises(self):
+        good = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        bad = BrokerMessageV1("bad", BrokerMessageV1Payload("bar"))
+
+        async with PostgreSqlBrokerQueue.from_config(
+            self.config, query_factory=self.query_factory, topic_codecs={"bad": FakeModelCodec()}
+        ) as queue:
+            with patch.object(FakeModelCodec, "_encode_one", side_effect=ValueError):
+                observed = await gather(queue.enqueue(good), queue.enqueue(bad), return_exceptions=True)
+
+            self.assertIsNone(observed[0])
+            self.assertIsInstance(observed[1], ValueError)
+            self.assertEqual(good, await queue.dequeue())
+
+    async def test_destroy_flushes_queue(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(3)]
+
+        queue = PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory)
+        await queue.setup()
+        await queue.enqueue_many(messages)
+        await sleep(0.5)  # To give time to consume the messages from db.
+
+        submit_many_mock = AsyncMock(side_effect=queue.submit_many)
+        queue.submit_many = submit_many_mock
+        await queue.destroy()
+
+        self.assertEqual(1, submit_many_mock.call_count)
+        self.assertEqual(3, len(submit_many_mock.call_args.args[1]))
+
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            observed = [
+                row async for row in database.submit_query_and_iter("SELECT processing, retry FROM test_table;")
+            ]
+
+        self.assertEqual([(False, 1)] * 3, observed)
+
+
+class TestPostgreSqlBrokerQueueWithAsyncPg(TestPostgreSqlBrokerQueue):
+    POOL_CLS = AsyncPgPool
+    CURSOR_CLS = AsyncPgCursor
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.injector = DependencyInjector(self.config, postgresql_pool=AsyncPgPool)
+        await self.injector.wire(modules=[sys.modules[__name__]])
+
+    async def asyncTearDown(self):
+        await self.injector.unwire()
+        await super().asyncTearDown()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,8 @@
 import unittest
 
+from minos.common import (
+    PoolMetrics,
+)
 from minos.common.testing import (
     PostgresAsyncTestCase,
 )
@@ -55,6 +58,19 @@ class TestBrokerClientPool(PostgresAsyncTestCase):
 
         self.assertEqual(None, REQUEST_REPLY_TOPIC_CONTEXT_VAR.get())
 
+    def test_idle_timeout(self):
+        self.assertEqual(None, self.pool.idle_timeout)
+
+    async def test_metrics(self):
+        self.assertIsInstance(self.pool.metrics, PoolMetrics)
+
+        async with self.pool.acquire():
+            self.assertEqual(1, self.pool.metrics.in_use)
+
+        self.assertEqual(1, self.pool.metrics.acquisitions)
+        self.assertEqual(1, self.pool.metrics.creations)
+        self.assertEqual(1, self.pool.metrics.idle)
+
 
 if __name__ == "__main__":
     unittest.main()
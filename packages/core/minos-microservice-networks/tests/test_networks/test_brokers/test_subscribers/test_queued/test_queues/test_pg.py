@@ -76,6 +76,19 @@ class TestPostgreSqlBrokerSubscriberQueue(PostgresAsyncTestCase):
 
         self.assertEqual(messages, observed)
 
+    async def test_enqueue_many(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+            BrokerMessageV1("foo", BrokerMessageV1Payload("foobar")),
+        ]
+        async with PostgreSqlBrokerSubscriberQueue.from_config(self.config, topics={"foo", "bar"}) as queue:
+            await queue.enqueue_many(messages)
+
+            observed = [await queue.dequeue() for _ in messages]
+
+        self.assertEqual(messages, observed)
+
 
 class TestPostgreSqlBrokerSubscriberQueueQueryFactory(unittest.TestCase):
     def setUp(self) -> None:
@@ -1,13 +1,23 @@
+from __future__ import (
+    annotations,
+)
+
+from base64 import (
+    b64decode,
+    b64encode,
+)
 from collections.abc import (
     MutableMapping,
 )
 from typing import (
     Any,
+    Union,
 )
 
 from minos.common import (
     BucketModel,
     Field,
+    ModelCodec,
 )
 
 
@@ -25,6 +35,24 @@ class SagaContext(BucketModel, MutableMapping):
 
         super().__init__(fields=fields)
 
+    def encoded_str(self, codec: Union[str, ModelCodec] = "avro") -> str:
+        """Generate a ``str`` representation of the instance encoded with the given codec.
+
+        :param codec: The codec to be used (``avro`` by default).
+        :return: A ``str`` instance.
+        """
+        return b64encode(ModelCodec.get(codec).encode(self)).decode()
+
+    @classmethod
+    def from_encoded_str(cls, raw: str) -> SagaContext:
+        """Build a new instance from its ``str`` representation, detecting the codec that was used to encode it.
+
+        :param raw: The ``str`` representation of the instance (including the ones generated by ``avro_str``).
+        :return: A ``SagaContext`` instance.
+        """
+        raw = b64decode(raw.encode())
+        return ModelCodec.detect(raw).decode(raw, cls)
+
     def __setattr__(self, key: str, value: Any) -> None:
         try:
             super().__setattr__(key, value)
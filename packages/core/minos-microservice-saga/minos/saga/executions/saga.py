@@ -17,6 +17,10 @@ from uuid import (
     UUID,
 )
 
+from minos.common import (
+    ModelCodec,
+)
+
 from ..context import (
     SagaContext,
 )
@@ -93,7 +97,7 @@ class SagaExecution:
         current = raw | kwargs
         current["definition"] = Saga.from_raw(current["definition"])
         current["status"] = SagaStatus.from_raw(current["status"])
-        current["context"] = SagaContext.from_avro_str(current["context"])
+        current["context"] = SagaContext.from_encoded_str(current["context"])
         current["paused_step"] = (
             None if current["paused_step"] is None else SagaStepExecution.from_raw(current["paused_step"])
         )
@@ -296,15 +300,23 @@ class SagaExecution:
     def raw(self) -> dict[str, Any]:
         """Compute a raw representation of the instance.
 
+        :return: A ``dict`` instance.
+        """
+        return self.to_raw()
+
+    def to_raw(self, codec: Union[str, ModelCodec] = "avro") -> dict[str, Any]:
+        """Compute a raw representation of the instance, encoding the contexts with the given codec.
+
+        :param codec: The codec to be used to encode the contexts (``avro`` by default).
         :return: A ``dict`` instance.
         """
         return {
             "definition": self.definition.raw,
             "uuid": str(self.uuid),
             "status": self.status.raw,
-            "executed_steps": [step.raw for step in self.executed_steps],
-            "paused_step": None if self.paused_step is None else self.paused_step.raw,
-            "context": self.context.avro_str,
+            "executed_steps": [step.to_raw(codec) for step in self.executed_steps],
+            "paused_step": None if self.paused_step is None else self.paused_step.to_raw(codec),
+            "context": self.context.encoded_str(codec),
             "already_rollback": self.already_rollback,
             "user": None if self.user is None else str(self.user),
         }
@@ -14,6 +14,7 @@ from typing import (
 )
 
 from minos.common import (
+    ModelCodec,
     classname,
     import_module,
 )
@@ -135,6 +136,15 @@ class SagaStepExecution(ABC):
     def raw(self) -> dict[str, Any]:
         """Compute a raw representation of the instance.
 
+        :return: A ``dict`` instance.
+        """
+        return self.to_raw()
+
+    # noinspection PyUnusedLocal
+    def to_raw(self, codec: Union[str, ModelCodec] = "avro") -> dict[str, Any]:
+        """Compute a raw representation of the instance, encoding the contexts with the given codec.
+
+        :param codec: The codec to be used to encode the contexts (``avro`` by default).
         :return: A ``dict`` instance.
         """
         return {
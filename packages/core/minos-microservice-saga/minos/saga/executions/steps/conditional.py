@@ -13,11 +13,16 @@ from typing import (
     Any,
     Iterable,
     Optional,
+    Union,
 )
 from uuid import (
     UUID,
 )
 
+from minos.common import (
+    ModelCodec,
+)
+
 from ...context import (
     SagaContext,
 )
@@ -171,13 +176,13 @@ class ConditionalSagaStepExecution(SagaStepExecution):
 
         return execution.context
 
-    @property
-    def raw(self) -> dict[str, Any]:
-        """Compute a raw representation of the instance.
+    def to_raw(self, codec: Union[str, ModelCodec] = "avro") -> dict[str, Any]:
+        """Compute a raw representation of the instance, encoding the contexts with the given codec.
 
+        :param codec: The codec to be used to encode the contexts (``avro`` by default).
         :return: A ``dict`` instance.
         """
-        return super().raw | {"inner": None if self.inner is None else self.inner.raw}
+        return super().to_raw(codec) | {"inner": None if self.inner is None else self.inner.to_raw(codec)}
 
     def __iter__(self) -> Iterable:
         yield from chain(super().__iter__(), (self.inner,))
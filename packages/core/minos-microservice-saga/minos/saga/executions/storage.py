@@ -15,6 +15,7 @@ from minos.common import (
     MinosJsonBinaryProtocol,
     MinosStorage,
     MinosStorageLmdb,
+    ModelCodec,
 )
 
 from ..exceptions import (
@@ -33,9 +34,11 @@ class SagaExecutionStorage:
         storage_cls: Type[MinosStorage] = MinosStorageLmdb,
         protocol=MinosJsonBinaryProtocol,
         db_name: str = "LocalState",
+        codec: Union[str, ModelCodec] = "avro",
         **kwargs,
     ):
         self.db_name = db_name
+        self.codec = ModelCodec.get(codec)
         self._storage = storage_cls.build(protocol=protocol, **kwargs)
 
     @classmethod
@@ -47,7 +50,7 @@ class SagaExecutionStorage:
         :return: A new ``SagaExecutionStorage`` instance.
         """
         # noinspection PyProtectedMember
-        return cls(**(config.saga.storage._asdict() | kwargs))
+        return cls(**(config.saga.storage._asdict() | {"codec": config.codecs.default} | kwargs))
 
     def store(self, execution: SagaExecution) -> None:
         """Store an execution.
@@ -56,7 +59,7 @@ class SagaExecutionStorage:
         :return: This method does not return anything.
         """
         key = str(execution.uuid)
-        value = execution.raw
+        value = execution.to_raw(self.codec)
         self._storage.update(table=self.db_name, key=key, value=value)
 
     def load(self, key: Union[str, UUID]) -> SagaExecution:
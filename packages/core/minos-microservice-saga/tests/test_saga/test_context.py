@@ -1,10 +1,16 @@
 import unittest
+from base64 import (
+    b64decode,
+)
 from collections.abc import (
     MutableMapping,
 )
 
 from minos.common import (
+    AvroModelCodec,
     BucketModel,
+    JsonModelCodec,
+    ModelCodec,
 )
 from minos.saga import (
     SagaContext,
@@ -73,6 +79,22 @@ class TestSagaContext(unittest.TestCase):
         another = SagaContext.from_avro_bytes(original.avro_bytes)
         self.assertEqual(original, another)
 
+    def test_encoded_str(self):
+        original = SagaContext(one=1, two="two", three=Foo("three"))
+        raw = original.encoded_str()
+        self.assertEqual(AvroModelCodec(), ModelCodec.detect(b64decode(raw)))
+        self.assertEqual(original, SagaContext.from_encoded_str(raw))
+
+    def test_encoded_str_json(self):
+        original = SagaContext(one=1, two="two", three=Foo("three"))
+        raw = original.encoded_str("json")
+        self.assertEqual(JsonModelCodec(), ModelCodec.detect(b64decode(raw)))
+        self.assertEqual(original, SagaContext.from_encoded_str(raw))
+
+    def test_from_encoded_str_avro_str(self):
+        original = SagaContext(one=1, two="two", three=Foo("three"))
+        self.assertEqual(original, SagaContext.from_encoded_str(original.avro_str))
+
     def test_change_type(self):
         context = SagaContext(one=1)
         context["one"] = "one"
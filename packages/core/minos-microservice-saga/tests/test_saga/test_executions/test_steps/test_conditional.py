@@ -1,4 +1,7 @@
 import unittest
+from base64 import (
+    b64decode,
+)
 from contextlib import (
     suppress,
 )
@@ -9,6 +12,10 @@ from uuid import (
     uuid4,
 )
 
+from minos.common import (
+    JsonModelCodec,
+    ModelCodec,
+)
 from minos.saga import (
     ConditionalSagaStep,
     ConditionalSagaStepExecution,
@@ -236,6 +243,15 @@ class TestConditionalSageStepExecution(MinosTestCase):
         another = SagaStepExecution.from_raw(self.execution.raw)
         self.assertEqual(self.execution, another)
 
+    async def test_to_raw_codec(self):
+        with suppress(SagaPausedExecutionStepException):
+            await self.execution.execute(SagaContext(option=1), **self.execute_kwargs)
+
+        raw = self.execution.to_raw("json")
+
+        self.assertEqual(JsonModelCodec(), ModelCodec.detect(b64decode(raw["inner"]["context"])))
+        self.assertEqual(self.execution, SagaStepExecution.from_raw(raw))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,15 @@
 import unittest
+from base64 import (
+    b64decode,
+)
 from shutil import (
     rmtree,
 )
 
+from minos.common import (
+    JsonModelCodec,
+    ModelCodec,
+)
 from minos.saga import (
     SagaExecution,
     SagaExecutionNotFoundException,
@@ -58,6 +65,20 @@ class TestSagaExecutionStorage(MinosTestCase):
         self.assertNotEqual(self.execution, storage.load(self.execution.uuid))
         self.assertEqual(another, storage.load(self.execution.uuid))
 
+    def test_store_codec(self):
+        storage = SagaExecutionStorage(path=self.DB_PATH, codec="json")
+        self.assertEqual(JsonModelCodec(), storage.codec)
+
+        storage.store(self.execution)
+
+        raw = storage._storage.get(table=storage.db_name, key=str(self.execution.uuid))
+        self.assertEqual(JsonModelCodec(), ModelCodec.detect(b64decode(raw["context"])))
+        self.assertEqual(self.execution, storage.load(self.execution.uuid))
+
+    def test_from_config(self):
+        storage = SagaExecutionStorage.from_config(self.config, path=self.DB_PATH)
+        self.assertEqual(ModelCodec.get(self.config.codecs.default), storage.codec)
+
     def test_load_raises(self):
         storage = SagaExecutionStorage(path=self.DB_PATH)
 
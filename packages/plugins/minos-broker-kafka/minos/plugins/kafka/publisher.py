@@ -10,6 +10,10 @@ from asyncio import (
 from contextlib import (
     suppress,
 )
+from typing import (
+    Optional,
+    Union,
+)
 
 from aiokafka import (
     AIOKafkaProducer,
@@ -20,6 +24,7 @@ from cached_property import (
 
 from minos.common import (
     MinosConfig,
+    ModelCodec,
 )
 from minos.networks import (
     BrokerMessage,
@@ -55,13 +60,29 @@ class InMemoryQueuedKafkaBrokerPublisher(QueuedBrokerPublisher):
 class KafkaBrokerPublisher(BrokerPublisher):
     """Kafka Broker Publisher class."""
 
-    def __init__(self, *args, broker_host: str, broker_port: int, **kwargs):
+    def __init__(
+        self,
+        *args,
+        broker_host: str,
+        broker_port: int,
+        codec: Union[str, ModelCodec] = "avro",
+        topic_codecs: Optional[dict[str, Union[str, ModelCodec]]] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+
+        if topic_codecs is None:
+            topic_codecs = dict()
+
         self.broker_host = broker_host
         self.broker_port = broker_port
 
+        self._codec = ModelCodec.get(codec)
+        self._topic_codecs = {topic: ModelCodec.get(topic_codec) for topic, topic_codec in topic_codecs.items()}
+
     @classmethod
     def _from_config(cls, config: MinosConfig, **kwargs) -> KafkaBrokerPublisher:
+        kwargs = {"codec": config.codecs.default, "topic_codecs": config.codecs.topics} | kwargs
         kwargs["broker_host"] = config.broker.host
         kwargs["broker_port"] = config.broker.port
         # noinspection PyProtectedMember
@@ -76,8 +97,16 @@ class KafkaBrokerPublisher(BrokerPublisher):
             await wait_for(self.client.stop(), 0.5)
         await super()._destroy()
 
+    def get_codec(self, topic: str) -> ModelCodec:
+        """Get the codec used to encode the messages of the given topic.
+
+        :param topic: The topic name.
+        :return: A ``ModelCodec`` instance.
+        """
+        return self._topic_codecs.get(topic, self._codec)
+
     async def _send(self, message: BrokerMessage) -> None:
-        await self.client.send_and_wait(message.topic, message.avro_bytes)
+        await self.client.send_and_wait(message.topic, self.get_codec(message.topic).encode(message))
 
     @cached_property
     def client(self) -> AIOKafkaProducer:
@@ -35,6 +35,7 @@ from kafka.errors import (
 
 from minos.common import (
     MinosConfig,
+    ModelCodec,
 )
 from minos.networks import (
     BrokerMessage,
@@ -112,7 +113,7 @@ class KafkaBrokerSubscriber(BrokerSubscriber):
     async def _receive(self) -> BrokerMessage:
         record = await self.client.getone()
         bytes_ = record.value
-        message = BrokerMessage.from_avro_bytes(bytes_)
+        message = ModelCodec.detect(bytes_).decode(bytes_, BrokerMessage, trusted=True)
         return message
 
     @cached_property
@@ -8,8 +8,12 @@ from aiokafka import (
 )
 
 from minos.common import (
+    AvroModelCodec,
     MinosConfig,
 )
+from minos.common.testing import (
+    FakeModelCodec,
+)
 from minos.networks import (
     BrokerMessage,
     BrokerMessageV1,
@@ -57,6 +61,25 @@ class TestKafkaBrokerPublisher(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("foo", send_mock.call_args.args[0])
         self.assertEqual(message, BrokerMessage.from_avro_bytes(send_mock.call_args.args[1]))
 
+    def test_get_codec(self):
+        publisher = KafkaBrokerPublisher.from_config(
+            CONFIG_FILE_PATH, topic_codecs={"foo": "minos.common.testing.FakeModelCodec"}
+        )
+
+        self.assertEqual(FakeModelCodec(), publisher.get_codec("foo"))
+        self.assertEqual(AvroModelCodec(), publisher.get_codec("bar"))
+
+    async def test_send_with_codec(self):
+        send_mock = AsyncMock()
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, codec=FakeModelCodec()) as publisher:
+            publisher.client.send_and_wait = send_mock
+            await publisher.send(message)
+
+        self.assertEqual(1, send_mock.call_count)
+        self.assertEqual(message, FakeModelCodec().decode(send_mock.call_args.args[1], BrokerMessage))
+
     async def test_setup_destroy(self):
         publisher = KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH)
         start_mock = AsyncMock()
@@ -16,6 +16,10 @@ from kafka import (
 
 from minos.common import (
     MinosConfig,
+    ModelCodec,
+)
+from minos.common.testing import (
+    FakeModelCodec,
 )
 from minos.networks import (
     BrokerMessageV1,
@@ -175,6 +179,24 @@ class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(messages[0], await subscriber.receive())
             self.assertEqual(messages[1], await subscriber.receive())
 
+    async def test_receive_with_codec(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
+            get_mock = AsyncMock(
+                side_effect=[
+                    _ConsumerMessage(messages[0].avro_bytes),
+                    _ConsumerMessage(ModelCodec.get(FakeModelCodec).encode(messages[1])),
+                ]
+            )
+            subscriber.client.getone = get_mock
+
+            self.assertEqual(messages[0], await subscriber.receive())
+            self.assertEqual(messages[1], await subscriber.receive())
+
 
 class TestKafkaBrokerSubscriberBuilder(unittest.TestCase):
     def setUp(self) -> None: